@@ -1,10 +1,51 @@
-from flask import Flask, render_template, request, redirect, jsonify
-import os, subprocess, sys
+from flask import Flask, Response, render_template, request, redirect, jsonify, send_from_directory, stream_with_context, url_for
+import json, mimetypes, os, time
+
+from catalogo import CatalogoScripts
+from artefactos import AlmacenArtefactos
+from cache_resultados import CacheResultados
+from estaticos import MANIFIESTO, ManifiestoEstaticos
+from metricas import RegistroMetricas
+from pool_interpretes import ControlEjecucion, PoolInterpretes
+from simulaciones import SIMULACIONES, CargadorModulos, ErrorParametros, ejecutar_simulacion
+from trabajos import PlanificadorTrabajos
 
 app = Flask(__name__)
 
 # Ruta absoluta de la carpeta codigos
-RUTA_CODIGOS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'codigos')
+RUTA_BASE = os.path.dirname(os.path.abspath(__file__))
+RUTA_CODIGOS = os.path.join(RUTA_BASE, 'codigos')
+
+# Estáticos con huella generados por `python estaticos.py` (si no existen, se usan los originales)
+estaticos = ManifiestoEstaticos(app.static_folder)
+
+@app.context_processor
+def rutas_estaticas():
+    """`asset('css/estilos.css')`: URL del archivo estático (con huella si está construido)."""
+    return {'asset': lambda ruta: url_for('static', filename=estaticos.archivo(ruta))}
+
+# Metadatos de los scripts (se recalculan solo cuando cambia la carpeta)
+catalogo = CatalogoScripts(RUTA_CODIGOS)
+
+# Intérpretes precalentados (numpy, scipy, matplotlib y pandas ya importados)
+pool = PoolInterpretes(
+    tamano=int(os.environ.get("POOL_TAMANO", 2)),
+    max_ejecuciones=int(os.environ.get("POOL_MAX_EJECUCIONES", 50)),
+)
+
+# Archivos generados por cada ejecución, con nombres direccionados por contenido
+almacen = AlmacenArtefactos(
+    os.environ.get("ARTEFACTOS", os.path.join(RUTA_BASE, '.cache', 'artefactos')),
+    max_bytes=int(os.environ.get("ARTEFACTOS_MAX_MB", 200)) * 1024 * 1024,
+    max_edad=float(os.environ.get("ARTEFACTOS_MAX_HORAS", 168)) * 3600,
+)
+
+# Resultados de scripts deterministas (memoria + disco)
+cache = CacheResultados(
+    RUTA_CODIGOS,
+    os.environ.get("CACHE_RESULTADOS", os.path.join(RUTA_BASE, '.cache', 'resultados')),
+    capacidad=int(os.environ.get("CACHE_CAPACIDAD", 64)),
+)
 
 @app.route('/')
 def inicio():
@@ -16,24 +57,232 @@ def inicio():
         'año_ingreso': 2023,
         'foto': 'img/foto.jpg'
     }
-    archivos = [f for f in os.listdir(RUTA_CODIGOS) if f.endswith('.py')]
-    return render_template('index.html', usuario=datos_usuario, archivos=archivos)
+    return render_template('index.html', usuario=datos_usuario, archivos=catalogo.entradas())
+
+@app.route('/api/catalogo')
+def api_catalogo():
+    """Catálogo de scripts con metadatos (título, resumen, funciones, hash...)."""
+    return jsonify(catalogo.entradas())
 
 @app.route('/upload', methods=['POST'])
 def upload():
     archivo = request.files['archivo']
     if archivo.filename.endswith('.py'):
         archivo.save(os.path.join(RUTA_CODIGOS, archivo.filename))
+        cache.invalidar(archivo.filename)
+        catalogo.invalidar(archivo.filename)
     return redirect('/')
 
+def flujo_script(nombre, control=None):
+    """
+    Ejecuta `nombre` pasando por la caché de resultados.
+
+    Genera ("cache", bool), luego ("salida", texto) a medida que el script
+    escribe, ("artefactos", [{"nombre", "url", "bytes"}]) con los archivos
+    que generó y finalmente ("fin", codigo). Solo se retiene la salida
+    completa si el script es determinista y se va a guardar en caché.
+    """
+    clave = cache.clave(nombre)
+    if clave:
+        guardado = cache.obtener(nombre, clave)
+        if guardado:
+            metricas.registrar_acierto_cache(nombre)
+            yield "cache", True
+            yield "salida", guardado["salida"]
+            yield "artefactos", almacen.publicar(guardado["artefactos"])
+            yield "fin", 0
+            return
+
+    yield "cache", False
+    control = control or ControlEjecucion()
+    carpeta = almacen.crear_carpeta_ejecucion()
+    partes = [] if clave else None
+    bytes_salida = 0
+    espera_previa = control.espera
+    inicio = time.perf_counter()
+    try:
+        for tipo, valor in pool.ejecutar_flujo(os.path.join(RUTA_CODIGOS, nombre), control, carpeta):
+            if tipo == "salida":
+                bytes_salida += len(valor.encode("utf-8"))
+                if partes is not None:
+                    partes.append(valor)
+                yield tipo, valor
+                continue
+
+            # La duración excluye la espera por un trabajador libre del pool
+            duracion = time.perf_counter() - inicio - (control.espera - espera_previa)
+            metricas.registrar(nombre, duracion, valor, bytes_salida, control.espera, control.recursos)
+            artefactos = almacen.leer_ejecucion(carpeta)
+            if valor == 0 and clave:
+                cache.guardar(nombre, clave, "".join(partes), artefactos)
+            yield "artefactos", almacen.publicar(artefactos)
+            yield tipo, valor
+    finally:
+        almacen.eliminar_ejecucion(carpeta)
+
+# Costo de cada ejecución (expuesto en /metrics y /api/metricas)
+metricas = RegistroMetricas()
+
+# Módulos de codigos/ importados en este proceso para /api/sim
+modulos = CargadorModulos(RUTA_CODIGOS)
+
+# Trabajos asíncronos: /run?asincrono=1 encola y retorna un id
+planificador = PlanificadorTrabajos(
+    lambda nombre, control: (m for m in flujo_script(nombre, control) if m[0] != "cache"),
+    concurrencia=int(os.environ.get("TRABAJOS_CONCURRENCIA", 2)),
+    tiempo_limite=float(os.environ.get("TRABAJOS_TIEMPO_LIMITE", 120)),
+)
+
+def evento_sse(datos, tipo=None):
+    encabezado = f"event: {tipo}\n" if tipo else ""
+    return f"{encabezado}data: {datos}\n\n"
+
+def respuesta_sse(eventos):
+    return Response(
+        stream_with_context(eventos),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
 @app.route('/run/<nombre>', methods=['POST'])
 def run(nombre):
-    ruta = os.path.join(RUTA_CODIGOS, nombre)
+    if request.values.get('asincrono') in ('1', 'true', 'si'):
+        trabajo = planificador.enviar(nombre)
+        return jsonify({"trabajo": trabajo.id, "estado": trabajo.estado}), 202
+
+    partes = []
+    artefactos = []
+    for tipo, valor in flujo_script(nombre):
+        if tipo == "cache":
+            desde_cache = valor
+        elif tipo == "salida":
+            partes.append(valor)
+        elif tipo == "artefactos":
+            artefactos = valor
+        else:
+            codigo = valor
+    salida = "".join(partes)
+    if codigo != 0 and not salida:
+        salida = f"El programa terminó con código de salida {codigo}."
+    return jsonify({"salida": salida, "cache": desde_cache, "artefactos": artefactos})
+
+@app.route('/run/<nombre>/stream')
+def run_stream(nombre):
+    """Variante de /run que envía la salida línea por línea (Server-Sent Events)."""
+    def lineas():
+        desde_cache = False
+        pendiente = ""
+        for tipo, valor in flujo_script(nombre):
+            if tipo == "cache":
+                desde_cache = valor
+            elif tipo == "salida":
+                *completas, pendiente = (pendiente + valor).split("\n")
+                for linea in completas:
+                    yield evento_sse(linea)
+            else:
+                # El script ya terminó: la última línea sin salto va antes de los artefactos
+                if pendiente:
+                    yield evento_sse(pendiente)
+                    pendiente = ""
+                if tipo == "artefactos":
+                    yield evento_sse(json.dumps(valor), "artefactos")
+                else:
+                    yield evento_sse(json.dumps({"codigo": valor, "cache": desde_cache}), "fin")
+
+    return respuesta_sse(lineas())
+
+@app.route('/artefactos/<archivo>')
+def artefacto(archivo):
+    """Sirve un artefacto; su nombre depende del contenido, así que nunca cambia."""
+    respuesta = send_from_directory(almacen.carpeta, archivo, max_age=31536000)
+    respuesta.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+    return respuesta
+
+@app.route('/static/dist/<path:archivo>')
+def estatico_con_huella(archivo):
+    """
+    Sirve un estático con huella: caché inmutable, variante precomprimida
+    según Accept-Encoding, y ETag/304 y Range (send_file condicional).
+    """
+    if archivo == MANIFIESTO:
+        return jsonify({"error": "Archivo no encontrado."}), 404
+    ruta, codificacion = estaticos.variante(archivo, request.headers.get('Accept-Encoding'))
+    respuesta = send_from_directory(estaticos.carpeta, ruta, mimetype=mimetypes.guess_type(archivo)[0],
+                                    max_age=31536000)
+    if codificacion:
+        respuesta.headers["Content-Encoding"] = codificacion
+    respuesta.headers["Vary"] = "Accept-Encoding"
+    respuesta.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+    return respuesta
+
+@app.route('/trabajos/<id_trabajo>')
+def estado_trabajo(id_trabajo):
+    """Estado y salida de un trabajo; `desde` permite pedir solo la salida nueva."""
+    trabajo = planificador.obtener(id_trabajo)
+    if trabajo is None:
+        return jsonify({"error": "Trabajo no encontrado."}), 404
+    return jsonify(trabajo.a_dict(desde=request.args.get('desde', 0, type=int)))
+
+@app.route('/trabajos/<id_trabajo>/cancelar', methods=['POST'])
+def cancelar_trabajo(id_trabajo):
+    if not planificador.cancelar(id_trabajo):
+        return jsonify({"error": "El trabajo no existe o ya terminó."}), 409
+    return jsonify(planificador.obtener(id_trabajo).a_dict())
+
+@app.route('/trabajos/<id_trabajo>/eventos')
+def eventos_trabajo(id_trabajo):
+    """Suscripción SSE a un trabajo: salida línea por línea y evento final 'fin'."""
+    trabajo = planificador.obtener(id_trabajo)
+    if trabajo is None:
+        return jsonify({"error": "Trabajo no encontrado."}), 404
+
+    def lineas():
+        vista = 0
+        pendiente = ""
+        while True:
+            terminado = trabajo.terminado
+            nuevo = trabajo.texto(vista)
+            vista += len(nuevo)
+            *completas, pendiente = (pendiente + nuevo).split("\n")
+            for linea in completas:
+                yield evento_sse(linea)
+            if terminado:
+                if pendiente:
+                    yield evento_sse(pendiente)
+                yield evento_sse(json.dumps(trabajo.artefactos), "artefactos")
+                yield evento_sse(json.dumps({"estado": trabajo.estado, "codigo": trabajo.codigo}), "fin")
+                return
+            trabajo.esperar_cambio(vista)
+
+    return respuesta_sse(lineas())
+
+@app.route('/metrics')
+def metrics():
+    """Métricas por script en formato de texto de Prometheus."""
+    return Response(metricas.prometheus(), mimetype="text/plain; version=0.0.4")
+
+@app.route('/api/metricas')
+def api_metricas():
+    """Resumen JSON: scripts más lentos por duración media."""
+    return jsonify(metricas.resumen(limite=request.args.get('limite', 10, type=int)))
+
+@app.route('/api/sim')
+def api_simulaciones():
+    """Simulaciones disponibles y el esquema de sus parámetros."""
+    return jsonify({nombre: sim.a_dict() for nombre, sim in SIMULACIONES.items()})
+
+@app.route('/api/sim/<nombre>', methods=['GET', 'POST'])
+def api_simulacion(nombre):
+    """Ejecuta una simulación en proceso con parámetros de la query o del JSON."""
+    if nombre not in SIMULACIONES:
+        return jsonify({"error": f"Simulación desconocida: {nombre}"}), 404
+    datos = request.get_json(silent=True) if request.method == 'POST' else None
+    if datos is None:
+        datos = request.args.to_dict()
     try:
-        salida = subprocess.check_output([sys.executable, ruta], text=True)
-    except subprocess.CalledProcessError as e:
-        salida = e.output or str(e)
-    return jsonify({"salida": salida})
+        return jsonify(ejecutar_simulacion(modulos, nombre, datos, almacen))
+    except ErrorParametros as e:
+        return jsonify({"error": str(e)}), 400
 
 if __name__ == '__main__':
     port = int(os.environ.get("PORT", 10000))
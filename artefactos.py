@@ -0,0 +1,134 @@
+"""
+=========================================
+Almacén de artefactos por ejecución
+-----------------------------------------
+Propósito:
+    Que las imágenes y archivos generados por los scripts no se pisen
+    entre ejecuciones concurrentes ni queden viejos en la caché del navegador.
+
+Descripción:
+    - Cada ejecución corre en su propia carpeta temporal (con `static/img/`
+      ya creada), así las rutas fijas de los scripts no chocan.
+    - Al terminar, cada archivo generado se publica con un nombre
+      direccionado por contenido: <sha256[:16]>-<nombre>. Como el nombre
+      cambia si cambia el contenido, se sirve con caché inmutable.
+    - El almacén se limpia por antigüedad y por tamaño total (se desalojan
+      primero los archivos usados hace más tiempo).
+=========================================
+"""
+
+import hashlib
+import os
+import re
+import shutil
+import tempfile
+import threading
+import time
+
+_CARACTERES_INVALIDOS = re.compile(r"[^A-Za-z0-9._-]+")
+
+
+class AlmacenArtefactos:
+    """
+    Parámetros:
+        carpeta (str): carpeta donde se publican los artefactos.
+        url_base (str): prefijo de URL con el que se sirven.
+        max_bytes (int): tamaño total máximo antes de desalojar.
+        max_edad (float): segundos sin uso tras los que un artefacto se borra.
+        intervalo_limpieza (float): segundos mínimos entre dos limpiezas.
+    """
+
+    def __init__(self, carpeta, url_base="/artefactos", max_bytes=200 * 1024 * 1024,
+                 max_edad=7 * 24 * 3600, intervalo_limpieza=60):
+        self.carpeta = carpeta
+        self.url_base = url_base.rstrip("/")
+        self.max_bytes = max_bytes
+        self.max_edad = max_edad
+        self.intervalo_limpieza = intervalo_limpieza
+        self._carpeta_ejecuciones = os.path.join(carpeta, ".ejecuciones")
+        self._ultima_limpieza = 0.0
+        self._lock = threading.Lock()
+        os.makedirs(self._carpeta_ejecuciones, exist_ok=True)
+
+    # ------------------------------------------------------------
+    # Carpetas de ejecución
+    # ------------------------------------------------------------
+    def crear_carpeta_ejecucion(self):
+        """Carpeta de trabajo vacía (con static/img/) para una ejecución."""
+        carpeta = tempfile.mkdtemp(prefix="ejecucion-", dir=self._carpeta_ejecuciones)
+        os.makedirs(os.path.join(carpeta, "static", "img"))
+        return carpeta
+
+    @staticmethod
+    def leer_ejecucion(carpeta):
+        """Lee los archivos generados en `carpeta`: {ruta_relativa: bytes}."""
+        artefactos = {}
+        for raiz, _, archivos in os.walk(carpeta):
+            for archivo in archivos:
+                ruta = os.path.join(raiz, archivo)
+                with open(ruta, "rb") as f:
+                    artefactos[os.path.relpath(ruta, carpeta).replace(os.sep, "/")] = f.read()
+        return artefactos
+
+    @staticmethod
+    def eliminar_ejecucion(carpeta):
+        shutil.rmtree(carpeta, ignore_errors=True)
+
+    # ------------------------------------------------------------
+    # Publicación
+    # ------------------------------------------------------------
+    def guardar(self, nombre, contenido):
+        """Publica `contenido` y retorna el nombre de archivo direccionado por contenido."""
+        base = _CARACTERES_INVALIDOS.sub("_", os.path.basename(nombre)) or "artefacto"
+        archivo = f"{hashlib.sha256(contenido).hexdigest()[:16]}-{base}"
+        destino = os.path.join(self.carpeta, archivo)
+        if os.path.exists(destino):
+            # Mismo contenido: solo se renueva su antigüedad
+            os.utime(destino)
+        else:
+            temporal = tempfile.NamedTemporaryFile(dir=self.carpeta, prefix=".tmp-", delete=False)
+            with temporal:
+                temporal.write(contenido)
+            os.replace(temporal.name, destino)
+        return archivo
+
+    def publicar(self, artefactos):
+        """
+        Publica {ruta_relativa: bytes} y retorna una lista de
+        {"nombre", "url", "bytes"} ordenada por nombre.
+        """
+        publicados = [
+            {"nombre": relativa, "url": f"{self.url_base}/{self.guardar(relativa, contenido)}", "bytes": len(contenido)}
+            for relativa, contenido in sorted(artefactos.items())
+        ]
+        self.limpiar()
+        return publicados
+
+    # ------------------------------------------------------------
+    # Desalojo
+    # ------------------------------------------------------------
+    def limpiar(self, forzar=False):
+        """Borra artefactos vencidos y, si hace falta, los menos usados."""
+        ahora = time.time()
+        with self._lock:
+            if not forzar and ahora - self._ultima_limpieza < self.intervalo_limpieza:
+                return
+            self._ultima_limpieza = ahora
+
+        archivos = []
+        with os.scandir(self.carpeta) as it:
+            for entrada in it:
+                if entrada.is_file() and not entrada.name.startswith("."):
+                    info = entrada.stat()
+                    archivos.append((info.st_mtime, info.st_size, entrada.path))
+        archivos.sort()
+
+        total = sum(tamano for _, tamano, _ in archivos)
+        for mtime, tamano, ruta in archivos:
+            if ahora - mtime <= self.max_edad and total <= self.max_bytes:
+                break
+            try:
+                os.remove(ruta)
+            except OSError:
+                continue
+            total -= tamano
@@ -0,0 +1,374 @@
+"""
+=========================================
+Benchmarks de los algoritmos de `codigos/`
+-----------------------------------------
+Propósito:
+    Medir cuánto tarda la función principal de cada algoritmo a distintos
+    tamaños de problema y detectar regresiones entre una medición y otra.
+
+Descripción:
+    - Los módulos se cargan sin su demo de nivel superior: del árbol
+      sintáctico solo se conservan imports, funciones, clases y
+      asignaciones que no usan nombres de la demo ni llaman a integradas
+      con efectos (constantes, tablas y rutas).
+    - Cada caso se ejecuta con calentamiento y varias repeticiones, con la
+      salida estándar descartada y en una carpeta temporal (los gráficos
+      que escriben los scripts no ensucian el proyecto).
+    - Si una repetición supera `--max-segundos`, los tamaños mayores de ese
+      caso se omiten.
+    - Los resultados se guardan en una línea base JSON; antes de
+      sobrescribirla se comparan con la anterior y se marcan las
+      regresiones (mediana más lenta que la tolerancia).
+
+Uso:
+    python benchmarks.py
+    python benchmarks.py --tamanos 1e3,1e4,1e5 --solo generar,corridas
+=========================================
+"""
+
+import argparse
+import ast
+import builtins
+import contextlib
+import gc
+import io
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+import types
+
+import matplotlib
+import numpy as np
+
+matplotlib.use("Agg")
+
+RUTA_BASE = os.path.dirname(os.path.abspath(__file__))
+RUTA_CODIGOS = os.path.join(RUTA_BASE, 'codigos')
+BASE_POR_DEFECTO = os.path.join(RUTA_BASE, '.cache', 'benchmarks.json')
+TAMANOS_POR_DEFECTO = (10**3, 10**4, 10**5, 10**6, 10**7)
+
+# Los scripts importan módulos compartidos de su misma carpeta (p. ej. lcg_afin)
+if RUTA_CODIGOS not in sys.path:
+    sys.path.insert(0, RUTA_CODIGOS)
+
+
+# ============================================================
+# Carga de módulos sin efectos secundarios
+# ============================================================
+
+# Funciones integradas que pueden aparecer en una constante de módulo
+_INTEGRADAS_PURAS = {"int", "float", "str", "bool", "tuple", "list", "dict", "set", "frozenset",
+                     "range", "len", "abs", "min", "max", "sum", "round"}
+
+
+def _nombres_definidos(nodo):
+    """Nombres que una sentencia de nivel superior define."""
+    if isinstance(nodo, (ast.Import, ast.ImportFrom)):
+        return {(a.asname or a.name).split(".")[0] for a in nodo.names}
+    if isinstance(nodo, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+        return {nodo.name}
+    objetivos = nodo.targets if isinstance(nodo, ast.Assign) else [getattr(nodo, "target", None)]
+    return {n.id for t in objetivos if t is not None for n in ast.walk(t) if isinstance(n, ast.Name)}
+
+
+def _raiz(expresion):
+    while isinstance(expresion, (ast.Attribute, ast.Subscript, ast.Call)):
+        expresion = expresion.func if isinstance(expresion, ast.Call) else expresion.value
+    return expresion.id if isinstance(expresion, ast.Name) else None
+
+
+def _sin_efectos(nodo, definidos):
+    """True si la sentencia de nivel superior es segura de ejecutar al importar."""
+    if isinstance(nodo, (ast.Import, ast.ImportFrom, ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+        return True
+    if isinstance(nodo, (ast.Assign, ast.AnnAssign)) and nodo.value is not None:
+        # Solo nombres ya definidos (la demo pudo quitarse) y ninguna llamada a
+        # integradas con efectos (print, input, open...)
+        for n in ast.walk(nodo.value):
+            if isinstance(n, ast.Name) and n.id not in definidos and not hasattr(builtins, n.id):
+                return False
+            if isinstance(n, ast.Call) and _raiz(n.func) not in definidos | _INTEGRADAS_PURAS:
+                return False
+        return True
+    # Docstrings y otras constantes sueltas
+    return isinstance(nodo, ast.Expr) and isinstance(nodo.value, ast.Constant)
+
+
+def cargar_sin_efectos(ruta):
+    """Importa `ruta` ejecutando solo sus definiciones (sin la demo)."""
+    with open(ruta, "rb") as f:
+        arbol = ast.parse(f.read(), filename=ruta)
+    cuerpo, definidos = [], {"__file__", "__name__"}
+    for nodo in arbol.body:
+        if _sin_efectos(nodo, definidos):
+            cuerpo.append(nodo)
+            if not isinstance(nodo, ast.Expr):
+                definidos |= _nombres_definidos(nodo)
+    arbol.body = cuerpo
+    nombre = os.path.splitext(os.path.basename(ruta))[0]
+    modulo = types.ModuleType(nombre)
+    modulo.__file__ = ruta
+    exec(compile(arbol, ruta, "exec"), modulo.__dict__)
+    return modulo
+
+
+# ============================================================
+# Casos
+# ============================================================
+
+def _uniformes(n):
+    generador = random.Random(12345)
+    return [generador.random() for _ in range(n)]
+
+
+def _archivo_uniformes(ruta, n):
+    """Guarda n uniformes en `ruta` (.npy, en la carpeta temporal del benchmark) y retorna la ruta."""
+    np.save(ruta, np.array(_uniformes(n)))
+    return ruta
+
+
+class Caso:
+    """
+    Un benchmark: `preparar(modulo, n)` retorna la función sin argumentos
+    que se cronometra (la preparación de datos no se mide).
+
+    Parámetros:
+        nombre (str): identificador del caso.
+        script (str): archivo de `codigos/`.
+        preparar (callable): preparar(modulo, n) -> callable.
+        tamanos (tuple, opcional): tamaños propios del caso, cuando el
+            parámetro relevante no escala hasta 1e7.
+    """
+
+    def __init__(self, nombre, script, preparar, tamanos=None):
+        self.nombre = nombre
+        self.script = script
+        self.preparar = preparar
+        self.tamanos = tamanos
+
+
+CASOS = [
+    Caso("generar", "generador_Congruencial.py",
+         lambda m, n: lambda: m.GeneradorCongruencial(16807, 12345, 0, 2**31 - 1).generar(n)),
+    Caso("generar_silencioso", "generador_Congruencial.py",
+         lambda m, n: lambda: m.GeneradorCongruencial(16807, 12345, 0, 2**31 - 1).generar(n, silencioso=True)),
+    Caso("cuadrados_medios", "aleatorio_NO_congruencial.py",
+         lambda m, n: lambda: m.cuadrados_medios(5735, 4, n)),
+    # n valores en total: 1000 semillas de 4 dígitos × n/1000 pasos
+    Caso("cuadrados_medios_lote", "cuadrados_medios_entero.py",
+         lambda m, n: lambda: m.secuencias_lote(range(1000), 4, max(n // 1000, 1))),
+    Caso("corridas", "prueba_corridas_aleat.py",
+         lambda m, n: (lambda datos: lambda: m.corridas(m.compar(datos)))(_uniformes(n))),
+    Caso("prueba_corridas", "prueba_corridas_aleat.py",
+         lambda m, n: (lambda datos: lambda: m.prueba_corridas(datos))(np.array(_uniformes(n)))),
+    Caso("prueba_series", "Prueba_series.py",
+         lambda m, n: (lambda datos: lambda: m.prueba_series(datos))(_uniformes(n))),
+    Caso("prueba_series_archivo", "Prueba_series.py",
+         lambda m, n: (lambda ruta: lambda: m.prueba_series_archivo(ruta, m=100, procesos=1))(
+             _archivo_uniformes("serie.npy", n))),
+    Caso("prueba_ks", "Prueba_kolmogorov_smirnov.py",
+         lambda m, n: (lambda datos: lambda: m.prueba_ks(datos, mostrar=False))(np.array(_uniformes(n)))),
+    Caso("bateria_pruebas", "bateria_pruebas.py",
+         lambda m, n: lambda: m.bateria(n, "numpy", semilla=1, mostrar=False)),
+    Caso("histograma_en_linea", "flujos.py",
+         lambda m, n: (lambda datos: lambda: m.consumir(np.array_split(datos, max(n // 2**20, 1)),
+                                                       m.HistogramaEnLinea.uniforme(20)))(np.array(_uniformes(n)))),
+    Caso("momentos_en_linea", "momentos.py",
+         lambda m, n: (lambda datos: lambda: m.MomentosEnLinea.de(iter(np.array_split(datos, max(n // 2**20, 1))),
+                                                                  orden=4))(np.array(_uniformes(n)))),
+    Caso("simulacion_colisiones", "simulacion_monte_carlo_colision.py",
+         lambda m, n: lambda: m.simulacion_colisiones(N=10, delta=0.05, M=n, seed=1)),
+    Caso("caminata_aleatoria_2D", "monte_carlo_prob_acumulada.py",
+         lambda m, n: lambda: m.caminata_aleatoria_2D(simulaciones=n, movimientos=10, condicion=2)),
+    Caso("simular_MM1", "monte_carlo_cafeteria.py",
+         lambda m, n: lambda: m.simular_MM1(iteraciones=n)),
+    Caso("simular_cola_banco", "Teoria_colas_monte.py",
+         lambda m, n: lambda: m.simular_cola_banco(n, 0.8, 1.0)),
+    # erlang_c(a, c) desborda el float con c > 170: se escala el número de servidores
+    Caso("erlang_c", "monte_carlo_centrodellamadas.py",
+         lambda m, n: lambda: m.erlang_c(4.0, n), tamanos=(10, 25, 50, 100, 170)),
+    Caso("simulacion_robot_recolector", "simulacion_monte_rec_obj.py",
+         lambda m, n: lambda: m.simulacion_robot_recolector(M=n, seed=1)),
+    Caso("box_muller_lcg", "LCG_Box_muller.py",
+         lambda m, n: lambda: m.Aleatorio(seed=12345, n=n).generar_normal()),
+    Caso("box_muller_cuadrados_medios", "Generador_cuadrados_med_box_muller.py",
+         lambda m, n: lambda: m.Aleatorio(5735, n).generar_normal()),
+    Caso("normales_box_muller", "muestreo_normal.py",
+         lambda m, n: (lambda salida: lambda: m.normales(n, semilla=1, salida=salida))(np.empty(n))),
+    Caso("normales_polar", "muestreo_normal.py",
+         lambda m, n: (lambda salida: lambda: m.normales(n, metodo="polar", semilla=1, salida=salida))(np.empty(n))),
+    Caso("normales_ziggurat", "muestreo_normal.py",
+         lambda m, n: (lambda salida: lambda: m.normales(n, metodo="ziggurat", semilla=1, salida=salida))(np.empty(n))),
+]
+
+
+# ============================================================
+# Medición
+# ============================================================
+
+def cronometrar(funcion, calentamiento=1, repeticiones=3, max_segundos=None):
+    """
+    Ejecuta `funcion` y retorna los tiempos (s) de cada repetición.
+    Deja de repetir (incluso en el calentamiento) si una corrida supera
+    `max_segundos`.
+    """
+    tiempos = []
+    with contextlib.redirect_stdout(io.StringIO()) as salida:
+        for i in range(calentamiento + repeticiones):
+            salida.seek(0)
+            salida.truncate()
+            gc.collect()
+            gc.disable()
+            try:
+                inicio = time.perf_counter()
+                funcion()
+                transcurrido = time.perf_counter() - inicio
+            finally:
+                gc.enable()
+            excedido = max_segundos is not None and transcurrido > max_segundos
+            if i >= calentamiento or excedido:
+                # Una corrida demasiado larga no se repite: se usa como única medición
+                tiempos.append(transcurrido)
+            if excedido:
+                break
+    return tiempos
+
+
+def ejecutar_casos(casos, tamanos, calentamiento=1, repeticiones=3, max_segundos=10.0):
+    """Retorna {caso: {tamaño: estadísticas}} y muestra el avance en stderr."""
+    resultados = {}
+    directorio_original = os.getcwd()
+    with tempfile.TemporaryDirectory(prefix="benchmarks-") as carpeta:
+        os.makedirs(os.path.join(carpeta, "static", "img"))
+        os.chdir(carpeta)
+        try:
+            for caso in casos:
+                modulo = cargar_sin_efectos(os.path.join(RUTA_CODIGOS, caso.script))
+                resultados[caso.nombre] = {}
+                for n in caso.tamanos or tamanos:
+                    funcion = caso.preparar(modulo, n)
+                    tiempos = cronometrar(funcion, calentamiento, repeticiones, max_segundos)
+                    resultados[caso.nombre][str(n)] = {
+                        "mediana": statistics.median(tiempos),
+                        "minimo": min(tiempos),
+                        "media": statistics.fmean(tiempos),
+                        "repeticiones": len(tiempos),
+                    }
+                    print(f"{caso.nombre:<30} n={n:<10} {statistics.median(tiempos):.6f}s", file=sys.stderr)
+                    if max(tiempos) > max_segundos:
+                        break
+        finally:
+            os.chdir(directorio_original)
+    return resultados
+
+
+# ============================================================
+# Línea base y regresiones
+# ============================================================
+
+def comparar(anterior, actual, tolerancia=0.2, minimo_segundos=0.001):
+    """
+    Compara las medianas de dos mediciones. Retorna una lista de
+    {"caso", "n", "anterior", "actual", "razon", "regresion"} para los
+    tamaños presentes en ambas. Diferencias menores que `minimo_segundos`
+    no cuentan como regresión (ruido de medición).
+    """
+    filas = []
+    for caso, por_tamano in actual.items():
+        for n, estadisticas in por_tamano.items():
+            previo = anterior.get(caso, {}).get(n)
+            if previo is None:
+                continue
+            antes, ahora = previo["mediana"], estadisticas["mediana"]
+            razon = ahora / antes if antes > 0 else float("inf")
+            filas.append({
+                "caso": caso,
+                "n": int(n),
+                "anterior": antes,
+                "actual": ahora,
+                "razon": razon,
+                "regresion": razon > 1 + tolerancia and ahora - antes > minimo_segundos,
+            })
+    return filas
+
+
+def leer_base(ruta):
+    try:
+        with open(ruta, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def guardar_base(ruta, resultados):
+    os.makedirs(os.path.dirname(ruta) or ".", exist_ok=True)
+    datos = {
+        "fecha": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "plataforma": platform.platform(),
+        "resultados": resultados,
+    }
+    temporal = ruta + ".tmp"
+    with open(temporal, "w", encoding="utf-8") as f:
+        json.dump(datos, f, indent=2, ensure_ascii=False)
+    os.replace(temporal, ruta)
+
+
+def _tamanos(texto):
+    return tuple(int(float(t)) for t in texto.split(",") if t.strip())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks de los algoritmos de codigos/.")
+    parser.add_argument("--tamanos", type=_tamanos, default=TAMANOS_POR_DEFECTO,
+                        help="tamaños separados por coma (ej. 1e3,1e4,1e5)")
+    parser.add_argument("--solo", default="", help="casos a ejecutar, separados por coma")
+    parser.add_argument("--calentamiento", type=int, default=1)
+    parser.add_argument("--repeticiones", type=int, default=3)
+    parser.add_argument("--max-segundos", type=float, default=10.0,
+                        help="omite tamaños mayores si una repetición supera este tiempo")
+    parser.add_argument("--base", default=BASE_POR_DEFECTO, help="archivo JSON de la línea base")
+    parser.add_argument("--tolerancia", type=float, default=0.2,
+                        help="aumento relativo de la mediana considerado regresión")
+    parser.add_argument("--no-guardar", action="store_true", help="no sobrescribe la línea base")
+    args = parser.parse_args(argv)
+
+    solo = {s.strip() for s in args.solo.split(",") if s.strip()}
+    desconocidos = solo - {c.nombre for c in CASOS}
+    if desconocidos:
+        parser.error(f"casos desconocidos: {', '.join(sorted(desconocidos))}")
+    casos = [c for c in CASOS if not solo or c.nombre in solo]
+
+    resultados = ejecutar_casos(casos, args.tamanos, args.calentamiento, args.repeticiones, args.max_segundos)
+
+    anterior = leer_base(args.base)
+    regresiones = []
+    if anterior:
+        print(f"\n=== Comparación con la línea base del {anterior.get('fecha', '?')} ===")
+        for fila in comparar(anterior.get("resultados", {}), resultados, args.tolerancia):
+            marca = "REGRESIÓN" if fila["regresion"] else ""
+            print(f"{fila['caso']:<30} n={fila['n']:<10} {fila['anterior']:.6f}s -> "
+                  f"{fila['actual']:.6f}s  x{fila['razon']:.2f}  {marca}")
+            if fila["regresion"]:
+                regresiones.append(fila)
+        print(f"\nRegresiones: {len(regresiones)}")
+    else:
+        print("\nNo hay línea base anterior para comparar.")
+
+    if not args.no_guardar:
+        # Se conservan los casos de la base anterior que no se midieron ahora
+        combinados = dict(anterior.get("resultados", {})) if anterior else {}
+        combinados.update(resultados)
+        guardar_base(args.base, combinados)
+        print(f"Línea base guardada en: {args.base}")
+
+    return 1 if regresiones else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,230 @@
+"""
+=========================================
+Caché de resultados de scripts deterministas
+-----------------------------------------
+Propósito:
+    No volver a ejecutar un script cuya salida no puede cambiar.
+
+Descripción:
+    - La clave es el SHA-256 del contenido del script y de los módulos
+      locales de `codigos/` que importa.
+    - Se guarda la salida estándar y los archivos que el script generó
+      (imágenes, archivos de texto) en su carpeta de ejecución.
+    - Primer nivel: LRU en memoria. Segundo nivel: disco, organizado como
+      <carpeta>/<nombre_script>/<clave>/ para poder invalidar por nombre.
+    - Un script se considera determinista si lo declara con el comentario
+      `# determinista: si` (o `no` para excluirlo) o, en su defecto, si
+      ninguno de sus módulos usa azar sin sembrarlo con una constante en
+      ese mismo módulo. De las dependencias se ignora el bloque
+      `if __name__ == "__main__":`, que no corre al importarlas.
+=========================================
+"""
+
+import ast
+import hashlib
+import json
+import os
+import re
+import shutil
+import tempfile
+import threading
+from collections import OrderedDict
+
+_MARCA_DETERMINISTA = re.compile(r"^#\s*determinista\s*:\s*(si|sí|no)\s*$", re.IGNORECASE | re.MULTILINE)
+
+# Funciones cuya llamada con una constante fija la semilla
+_FUNCIONES_SEMILLA = {"seed", "default_rng", "RandomState", "Random"}
+
+
+def _es_demo(nodo):
+    """True si `nodo` es el bloque `if __name__ == "__main__":`."""
+    prueba = nodo.test if isinstance(nodo, ast.If) else None
+    return (isinstance(prueba, ast.Compare) and isinstance(prueba.left, ast.Name)
+            and prueba.left.id == "__name__" and len(prueba.comparators) == 1
+            and isinstance(prueba.comparators[0], ast.Constant) and prueba.comparators[0].value == "__main__")
+
+
+def _sin_demo(arbol):
+    """El módulo sin su bloque `if __name__ == "__main__":` (lo que corre al importarlo)."""
+    return ast.Module(body=[nodo for nodo in arbol.body if not _es_demo(nodo)], type_ignores=[])
+
+
+def _dependencias_locales(arbol, carpeta):
+    """Nombres de los módulos de `carpeta` importados en `arbol`."""
+    nombres = set()
+    for nodo in ast.walk(arbol):
+        if isinstance(nodo, ast.Import):
+            nombres.update(alias.name.split(".")[0] for alias in nodo.names)
+        elif isinstance(nodo, ast.ImportFrom) and nodo.module and not nodo.level:
+            nombres.add(nodo.module.split(".")[0])
+    return {n for n in nombres if os.path.isfile(os.path.join(carpeta, n + ".py"))}
+
+
+def _analizar_azar(arbol):
+    """Retorna (usa_azar, siembra_constante) para un árbol sintáctico."""
+    usa_azar = False
+    siembra = False
+    for nodo in ast.walk(arbol):
+        if isinstance(nodo, ast.Import):
+            usa_azar |= any(a.name in ("random", "secrets", "numpy.random") for a in nodo.names)
+        elif isinstance(nodo, ast.ImportFrom):
+            usa_azar |= nodo.module in ("random", "secrets", "numpy.random") or (
+                nodo.module == "numpy" and any(a.name == "random" for a in nodo.names)
+            )
+        elif isinstance(nodo, ast.Attribute) and nodo.attr == "random":
+            usa_azar = True
+        elif isinstance(nodo, ast.Call):
+            funcion = nodo.func
+            nombre = funcion.attr if isinstance(funcion, ast.Attribute) else getattr(funcion, "id", None)
+            if nombre in _FUNCIONES_SEMILLA and nodo.args and isinstance(nodo.args[0], ast.Constant):
+                siembra |= nodo.args[0].value is not None
+            for kw in nodo.keywords:
+                if kw.arg == "seed" and isinstance(kw.value, ast.Constant) and kw.value.value is not None:
+                    siembra = True
+    return usa_azar, siembra
+
+
+class CacheResultados:
+    """
+    Caché de dos niveles (memoria + disco) para salidas de scripts.
+
+    Parámetros:
+        carpeta_codigos (str): carpeta donde viven los scripts.
+        carpeta_disco (str): carpeta del nivel en disco.
+        capacidad (int): entradas máximas en el nivel de memoria.
+    """
+
+    def __init__(self, carpeta_codigos, carpeta_disco, capacidad=64):
+        self.carpeta_codigos = carpeta_codigos
+        self.carpeta_disco = carpeta_disco
+        self.capacidad = capacidad
+        self._memoria = OrderedDict()
+        self._deterministas = {}
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------
+    # Claves y detección de determinismo
+    # ------------------------------------------------------------
+    def _fuentes(self, nombre):
+        """Fuentes del script y de sus dependencias locales, en orden estable."""
+        fuentes = {}
+        principal = os.path.splitext(nombre)[0]
+        pendientes = [principal]
+        while pendientes:
+            modulo = pendientes.pop()
+            if modulo in fuentes:
+                continue
+            with open(os.path.join(self.carpeta_codigos, modulo + ".py"), "rb") as f:
+                fuentes[modulo] = f.read()
+            try:
+                arbol = ast.parse(fuentes[modulo])
+            except SyntaxError:
+                continue
+            if modulo != principal:
+                arbol = _sin_demo(arbol)
+            pendientes.extend(_dependencias_locales(arbol, self.carpeta_codigos))
+        return fuentes
+
+    def clave(self, nombre):
+        """
+        Retorna la clave del script `nombre` si es determinista, o None.
+        """
+        try:
+            fuentes = self._fuentes(nombre)
+        except OSError:
+            return None
+        h = hashlib.sha256()
+        for modulo in sorted(fuentes):
+            h.update(modulo.encode() + b"\0" + fuentes[modulo] + b"\0")
+        clave = h.hexdigest()
+
+        if clave not in self._deterministas:
+            self._deterministas[clave] = self._es_determinista(os.path.splitext(nombre)[0], fuentes)
+        return clave if self._deterministas[clave] else None
+
+    @staticmethod
+    def _es_determinista(principal, fuentes):
+        marca = _MARCA_DETERMINISTA.search(fuentes[principal].decode("utf-8", errors="replace"))
+        if marca:
+            return marca.group(1).lower() != "no"
+
+        # Una semilla solo cuenta para el azar de su propio módulo
+        for modulo, fuente in fuentes.items():
+            try:
+                arbol = ast.parse(fuente)
+            except SyntaxError:
+                return False
+            usa_azar, siembra = _analizar_azar(arbol if modulo == principal else _sin_demo(arbol))
+            if usa_azar and not siembra:
+                return False
+        return True
+
+    # ------------------------------------------------------------
+    # Lectura y escritura
+    # ------------------------------------------------------------
+    def _ruta_entrada(self, nombre, clave):
+        return os.path.join(self.carpeta_disco, nombre, clave)
+
+    def _recordar(self, nombre, clave, entrada):
+        with self._lock:
+            self._memoria[(nombre, clave)] = entrada
+            self._memoria.move_to_end((nombre, clave))
+            while len(self._memoria) > self.capacidad:
+                self._memoria.popitem(last=False)
+
+    def obtener(self, nombre, clave):
+        """
+        Retorna {"salida": str, "artefactos": {ruta_relativa: bytes}} o None.
+        """
+        with self._lock:
+            entrada = self._memoria.get((nombre, clave))
+            if entrada is not None:
+                self._memoria.move_to_end((nombre, clave))
+                return entrada
+
+        carpeta = self._ruta_entrada(nombre, clave)
+        try:
+            with open(os.path.join(carpeta, "meta.json"), encoding="utf-8") as f:
+                meta = json.load(f)
+            artefactos = {}
+            for relativa in meta["artefactos"]:
+                with open(os.path.join(carpeta, "artefactos", relativa), "rb") as f:
+                    artefactos[relativa] = f.read()
+        except (OSError, ValueError, KeyError):
+            return None
+
+        entrada = {"salida": meta["salida"], "artefactos": artefactos}
+        self._recordar(nombre, clave, entrada)
+        return entrada
+
+    def guardar(self, nombre, clave, salida, artefactos):
+        """Guarda la salida y los artefactos en memoria y en disco."""
+        entrada = {"salida": salida, "artefactos": dict(artefactos)}
+        self._recordar(nombre, clave, entrada)
+
+        carpeta = self._ruta_entrada(nombre, clave)
+        os.makedirs(os.path.dirname(carpeta), exist_ok=True)
+        # Carpeta temporal propia: dos primeras ejecuciones simultáneas no se pisan
+        temporal = tempfile.mkdtemp(dir=os.path.dirname(carpeta), prefix=".tmp-")
+        try:
+            for relativa, contenido in artefactos.items():
+                destino = os.path.join(temporal, "artefactos", relativa)
+                os.makedirs(os.path.dirname(destino), exist_ok=True)
+                with open(destino, "wb") as f:
+                    f.write(contenido)
+            with open(os.path.join(temporal, "meta.json"), "w", encoding="utf-8") as f:
+                json.dump({"salida": salida, "artefactos": sorted(artefactos)}, f, ensure_ascii=False)
+            try:
+                os.replace(temporal, carpeta)
+            except OSError:
+                # Otra ejecución ya guardó la misma clave (mismo contenido)
+                pass
+        finally:
+            shutil.rmtree(temporal, ignore_errors=True)
+
+    def invalidar(self, nombre):
+        """Elimina todas las entradas del script `nombre`."""
+        shutil.rmtree(os.path.join(self.carpeta_disco, nombre), ignore_errors=True)
+        with self._lock:
+            for llave in [llave for llave in self._memoria if llave[0] == nombre]:
+                del self._memoria[llave]
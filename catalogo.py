@@ -0,0 +1,149 @@
+"""
+=========================================
+Catálogo de scripts de `codigos/`
+-----------------------------------------
+Propósito:
+    Evitar `os.listdir` y la lectura de archivos en cada visita a `/`, y
+    dar al frontend metadatos de cada script (título, resumen, funciones).
+
+Descripción:
+    - Cada entrada guarda: nombre, título, resumen (sección "Propósito"),
+      docstring del módulo, tamaño, hash SHA-256, funciones y clases
+      definidas en el nivel superior.
+    - La carpeta solo se vuelve a recorrer cuando cambia su mtime (se
+      agregó, borró o renombró un archivo) o tras una invalidación.
+    - En cada recorrido solo se re-analizan los archivos cuyo mtime o
+      tamaño cambió, o los invalidados (por ejemplo, tras /upload).
+=========================================
+"""
+
+import ast
+import hashlib
+import os
+import re
+import threading
+
+_SEPARADOR = re.compile(r"^[=\-\s]*$")
+_ALGORITMO = re.compile(r"^ALGORITMO\s*:\s*(.+)$", re.IGNORECASE)
+_SECCION_PROPOSITO = re.compile(r"^(Prop[oó]sito|Objetivo)\s*:\s*$", re.IGNORECASE)
+
+
+def _titulo(docstring, nombre):
+    """Título del script: línea 'ALGORITMO : ...' o primera línea con texto."""
+    for linea in (docstring or "").splitlines():
+        linea = linea.strip()
+        if _SEPARADOR.match(linea):
+            continue
+        coincidencia = _ALGORITMO.match(linea)
+        return coincidencia.group(1).strip() if coincidencia else linea
+    return os.path.splitext(nombre)[0].replace("_", " ").capitalize()
+
+
+def _resumen(docstring):
+    """Primer párrafo de la sección 'Propósito:' (u 'Objetivo:'), si existe."""
+    lineas = (docstring or "").splitlines()
+    for i, linea in enumerate(lineas):
+        if _SECCION_PROPOSITO.match(linea.strip()):
+            sangria = len(linea) - len(linea.lstrip())
+            parrafo = []
+            for siguiente in lineas[i + 1:]:
+                texto = siguiente.strip()
+                # El párrafo termina en una línea vacía o al volver a la sangría del encabezado
+                if not texto or _SEPARADOR.match(texto) or len(siguiente) - len(siguiente.lstrip()) <= sangria:
+                    break
+                parrafo.append(texto)
+            return " ".join(parrafo) or None
+    return None
+
+
+def analizar_script(ruta):
+    """Lee y analiza un script; retorna el diccionario de su entrada."""
+    with open(ruta, "rb") as f:
+        contenido = f.read()
+    nombre = os.path.basename(ruta)
+
+    docstring = None
+    funciones = []
+    clases = []
+    try:
+        arbol = ast.parse(contenido)
+        docstring = ast.get_docstring(arbol)
+        for nodo in arbol.body:
+            if isinstance(nodo, (ast.FunctionDef, ast.AsyncFunctionDef)) and not nodo.name.startswith("_"):
+                funciones.append(nodo.name)
+            elif isinstance(nodo, ast.ClassDef) and not nodo.name.startswith("_"):
+                clases.append(nodo.name)
+        valido = True
+    except SyntaxError:
+        valido = False
+
+    return {
+        "nombre": nombre,
+        "titulo": _titulo(docstring, nombre),
+        "resumen": _resumen(docstring),
+        "docstring": docstring,
+        "tamano": len(contenido),
+        "hash": hashlib.sha256(contenido).hexdigest(),
+        "funciones": funciones,
+        "clases": clases,
+        "valido": valido,
+    }
+
+
+class CatalogoScripts:
+    """
+    Catálogo en memoria de los scripts `.py` de una carpeta.
+
+    Parámetros:
+        carpeta (str): carpeta a catalogar.
+    """
+
+    def __init__(self, carpeta):
+        self.carpeta = carpeta
+        self._entradas = {}
+        self._firmas = {}
+        self._mtime_carpeta = None
+        self._lock = threading.Lock()
+
+    def _actualizar(self):
+        """Re-analiza solo los archivos nuevos o con mtime/tamaño distinto."""
+        mtime_carpeta = os.stat(self.carpeta).st_mtime_ns
+        if mtime_carpeta == self._mtime_carpeta:
+            return
+
+        actuales = {}
+        with os.scandir(self.carpeta) as it:
+            for archivo in it:
+                if archivo.name.endswith(".py") and archivo.is_file():
+                    info = archivo.stat()
+                    actuales[archivo.name] = (info.st_mtime_ns, info.st_size)
+
+        with self._lock:
+            for nombre in set(self._entradas) - set(actuales):
+                del self._entradas[nombre]
+                self._firmas.pop(nombre, None)
+            for nombre, firma in actuales.items():
+                if self._firmas.get(nombre) != firma:
+                    try:
+                        self._entradas[nombre] = analizar_script(os.path.join(self.carpeta, nombre))
+                    except OSError:
+                        continue
+                    self._firmas[nombre] = firma
+            self._mtime_carpeta = mtime_carpeta
+
+    def entradas(self):
+        """Lista de entradas ordenadas por nombre."""
+        self._actualizar()
+        with self._lock:
+            return [self._entradas[n] for n in sorted(self._entradas)]
+
+    def obtener(self, nombre):
+        self._actualizar()
+        with self._lock:
+            return self._entradas.get(nombre)
+
+    def invalidar(self, nombre):
+        """Fuerza a re-analizar `nombre` en la próxima consulta."""
+        with self._lock:
+            self._firmas.pop(nombre, None)
+            self._mtime_carpeta = None
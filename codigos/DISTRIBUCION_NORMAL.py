@@ -14,17 +14,27 @@ Contexto de aplicación:
 Descripción:
     - Se usa un LCG para producir números uniformes U(0,1).
     - Se transforman esos valores mediante Box–Muller para obtener
-      una distribución normal estándar.
+      una distribución normal estándar (por bloques con numpy, ver
+      muestreo_normal.py); `bloques_muestra` entrega la muestra por partes.
+    - El LCG puede saltar n pasos en O(log n) y repartirse en subflujos
+      reproducibles entre varios trabajadores (ver lcg_afin.py).
     - Se aplica la prueba de Kolmogorov–Smirnov (KS) para verificar
       la normalidad.
     - La gráfica se guarda como archivo (sin plt.show()) para compatibilidad web.
 =========================================
 """
 
-import math
+# determinista: si
+
+import copy
 import numpy as np
 import matplotlib.pyplot as plt
-from scipy.stats import kstest, norm
+from scipy.stats import norm
+
+import lcg_afin
+from generador_Congruencial import TAMANO_BLOQUE, GeneradorCongruencial
+from muestreo_normal import box_muller
+from Prueba_kolmogorov_smirnov import prueba_ks
 
 class GeneradorNormal:
     def __init__(self, semilla):
@@ -39,23 +49,46 @@ class GeneradorNormal:
         self.x = (self.a * self.x + self.c) % self.m
         return self.x / self.m
 
+    def saltar(self, n):
+        """Avanza el estado del LCG n pasos en O(log n)."""
+        self.x = lcg_afin.avanzar(self.x, self.a, self.c, self.m, n)
+
+    def subflujo(self, n, k, K):
+        """
+        Generador y tamaño de muestra del trabajador k de K. Se reparten
+        pares de uniformes (Box–Muller usa dos por par), así que las muestras
+        de cada trabajador, concatenadas en orden de k, coinciden con
+        generar_muestra(n, ...) de este generador.
+        """
+        inicio, fin = lcg_afin.particion(n // 2, k, K)
+        generador = copy.copy(self)
+        generador.saltar(2 * inicio)
+        return generador, 2 * (fin - inicio)
+
     def generar_muestra(self, n, mu, sigma):
         """Genera una muestra normal de tamaño n con media mu y desviación sigma."""
-        datos = []
-        for _ in range(n // 2):
-            u1 = self._uniforme()
-            u2 = self._uniforme()
-            R = math.sqrt(-2 * math.log(u1))
-            theta = 2 * math.pi * u2
-            z1 = R * math.cos(theta)
-            z2 = R * math.sin(theta)
-            datos.append(mu + sigma * z1)
-            datos.append(mu + sigma * z2)
-        return np.array(datos[:n])
+        # Mismas uniformes que n//2 pares de _uniforme(), calculadas por bloques
+        X = GeneradorCongruencial(self.a, self.x, self.c, self.m).secuencia(2 * (n // 2))
+        if len(X):
+            self.x = int(X[-1])
+        return mu + sigma * box_muller(X / float(self.m))
+
+    def bloques_muestra(self, n, mu, sigma, tamano=TAMANO_BLOQUE):
+        """
+        Los mismos valores que generar_muestra(n, mu, sigma), entregados en
+        arreglos de a lo más `tamano` (memoria constante para n grande).
+        """
+        lcg = GeneradorCongruencial(self.a, self.x, self.c, self.m)
+        # Tamaño par: un par de uniformes nunca queda repartido entre dos bloques
+        for X in lcg.bloques_enteros(2 * (n // 2), max(tamano - tamano % 2, 2)):
+            self.x = int(X[-1])
+            yield mu + sigma * box_muller(X / float(self.m))
 
     def verificar_normalidad(self, muestra, mu, sigma):
         """Aplica la prueba KS para verificar la normalidad de la muestra."""
-        ks_stat, p_valor = kstest(muestra, 'norm', args=(mu, sigma))
+        resultado = prueba_ks(muestra, "normal", parametros={"normal": (mu, sigma)}, mostrar=False)
+        ks_stat = resultado["resultados"]["normal"]["D"]
+        p_valor = resultado["resultados"]["normal"]["p_valor"]
         print("\nVerificación de normalidad")
         print(f"Estadístico KS = {ks_stat:.5f}")
         print(f"Valor-p = {p_valor:.5f}")
@@ -91,14 +124,15 @@ class GeneradorNormal:
 
 
 # ===== Ejecución (valores fijos, sin input) =====
-semilla = 123456789
-n = 200
-mu = 0
-sigma = 1
-
-gen = GeneradorNormal(semilla)
-muestra = gen.generar_muestra(n, mu, sigma)
-
-print("Primeros 5 valores generados:", muestra[:5])
-gen.verificar_normalidad(muestra, mu, sigma)
-gen.graficar_normal(muestra, mu, sigma)
+if __name__ == "__main__":
+    semilla = 123456789
+    n = 200
+    mu = 0
+    sigma = 1
+
+    gen = GeneradorNormal(semilla)
+    muestra = gen.generar_muestra(n, mu, sigma)
+
+    print("Primeros 5 valores generados:", muestra[:5])
+    gen.verificar_normalidad(muestra, mu, sigma)
+    gen.graficar_normal(muestra, mu, sigma)
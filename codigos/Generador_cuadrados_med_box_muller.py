@@ -14,15 +14,24 @@ Contexto de aplicación:
     con comportamiento normal.
 
 Descripción:
-    - Se genera una secuencia uniforme con el método de los cuadrados medios.
-    - Se aplica la transformación Box–Muller para obtener valores normales.
-    - Los resultados se guardan en archivo y se genera una gráfica como imagen.
+    - Se genera una secuencia uniforme con el método de los cuadrados medios
+      (en aritmética entera, con detección de ciclos).
+    - Se aplica la transformación Box–Muller para obtener valores normales
+      (por bloques con numpy, ver muestreo_normal.py).
+    - Los resultados se guardan en archivo (texto o .npy, ver
+      archivos_muestra.py) y se genera una gráfica como imagen.
     - No usa `input()` ni `plt.show()` para compatibilidad web.
 =========================================
 """
 
+# determinista: si
+
 import matplotlib.pyplot as plt
-import math
+import numpy as np
+
+from archivos_muestra import guardar_muestra
+from cuadrados_medios_entero import detectar_ciclo, secuencia
+from muestreo_normal import box_muller
 
 class Aleatorio:
     def __init__(self, x0, n, d=4):
@@ -36,31 +45,26 @@ class Aleatorio:
         self.d = d
 
     def cuadrados_medios(self, cantidad):
-        """Genera números pseudoaleatorios U(0,1) mediante cuadrados medios."""
-        numeros = []
-        x = self.x0
-        for _ in range(cantidad):
-            x_cuadrado = str(x**2).zfill(2*self.d)
-            inicio = (len(x_cuadrado) - self.d) // 2
-            x = int(x_cuadrado[inicio:inicio+self.d])
-            numeros.append(x / (10**self.d))
-        return numeros
+        """Genera números pseudoaleatorios U(0,1) mediante cuadrados medios (aritmética entera)."""
+        escala = 10 ** self.d
+        return [x / escala for x in secuencia(self.x0, self.d, cantidad)]
+
+    def ciclo(self):
+        """
+        Cola, periodo y paso de colapso de la secuencia de esta semilla
+        (ver cuadrados_medios_entero.detectar_ciclo).
+        """
+        return detectar_ciclo(self.x0, self.d)
 
     def generar_normal(self):
         """Genera números con distribución normal usando Box–Muller."""
-        uniformes = self.cuadrados_medios(2 * self.n)
-        normales = []
-
-        for i in range(0, len(uniformes), 2):
-            u1, u2 = uniformes[i], uniformes[i+1]
-            if u1 == 0:  # evitar log(0)
-                u1 = 1e-10
-            z1 = math.sqrt(-2 * math.log(u1)) * math.cos(2 * math.pi * u2)
-            z2 = math.sqrt(-2 * math.log(u1)) * math.sin(2 * math.pi * u2)
-            normales.append(z1)
-            if len(normales) < self.n:
-                normales.append(z2)
-        return normales
+        uniformes = np.array(self.cuadrados_medios(2 * self.n))
+        u1 = uniformes[0::2]
+        u1[u1 == 0] = 1e-10  # evitar log(0)
+        z = box_muller(uniformes)
+        # Mismo orden que el cálculo par a par: los Z₁, Z₂ intercalados hasta
+        # completar n y, de los pares restantes, solo Z₁
+        return np.concatenate((z[:self.n], z[2 * ((self.n + 1) // 2)::2])).tolist()
 
     def graficar(self, datos, ruta_guardado="static/img/normal_cm.png"):
         """Genera y guarda el histograma de los datos generados."""
@@ -75,19 +79,28 @@ class Aleatorio:
 
     def guardar_en_txt(self, datos, nombre_archivo="numeros_normales.txt"):
         """Guarda los datos generados en un archivo de texto."""
-        with open(nombre_archivo, "w") as f:
-            for num in datos:
-                f.write(f"{num}\n")
+        guardar_muestra(nombre_archivo, np.asarray(datos, dtype=float))
+        print(f"Números aleatorios guardados en: {nombre_archivo}")
+
+    def guardar_binario(self, datos, nombre_archivo="numeros_normales.npy"):
+        """Guarda los datos en binario (.npy o float64 crudo según la extensión)."""
+        guardar_muestra(nombre_archivo, datos)
         print(f"Números aleatorios guardados en: {nombre_archivo}")
 
 
 # ===== Ejecución (valores fijos, sin input) =====
-semilla = 5735       # semilla inicial
-cantidad = 100       # cantidad de números normales
-generador = Aleatorio(semilla, cantidad)
+if __name__ == "__main__":
+    semilla = 5735       # semilla inicial
+    cantidad = 100       # cantidad de números normales
+    generador = Aleatorio(semilla, cantidad)
+
+    datos = generador.generar_normal()
+    generador.graficar(datos)
+    generador.guardar_en_txt(datos)
 
-datos = generador.generar_normal()
-generador.graficar(datos)
-generador.guardar_en_txt(datos)
+    print("Primeros 5 valores generados:", datos[:5])
 
-print("Primeros 5 valores generados:", datos[:5])
+    ciclo = generador.ciclo()
+    if ciclo["colapso"] - 1 < 2 * cantidad:
+        print(f"Aviso: la semilla solo produce {ciclo['colapso'] - 1} uniformes distintos "
+              f"(cola {ciclo['cola']}, periodo {ciclo['periodo']}); el resto se repite.")
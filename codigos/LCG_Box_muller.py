@@ -13,19 +13,33 @@ Contexto de aplicación:
 
 Descripción técnica:
     - Se genera una secuencia uniforme U(0,1) con un LCG (parámetros por defecto: a=16807, m=2^31-1).
+    - La semilla puede avanzar n pasos en O(log n) y la secuencia repartirse
+      en subflujos reproducibles entre trabajadores (ver lcg_afin.py).
     - Se aplican pares de uniformes a la transformación de Box–Muller
-      para obtener variables normales N(0,1).
+      para obtener variables normales N(0,1) (por bloques con numpy, ver
+      muestreo_normal.py); `bloques_normales` entrega la misma muestra por
+      partes, con memoria constante.
     - Se normalizan los valores para garantizar media ≈ 0 y sigma ≈ 1.
     - Se guarda un histograma como imagen (ruta por defecto: static/img/normal_lcg.png)
-      y los números en un archivo de texto (ruta por defecto: numeros_normales.txt).
+      y los números en un archivo de texto (ruta por defecto: numeros_normales.txt)
+      o, con `guardar_binario`, en .npy (ver archivos_muestra.py).
     - No utiliza input() ni muestra ventanas gráficas (compatible con hosting web).
 =========================================
 """
 
-import math
+# determinista: si
+
+import copy
 import matplotlib.pyplot as plt
+import numpy as np
 import os
 
+import lcg_afin
+from archivos_muestra import guardar_muestra
+from generador_Congruencial import TAMANO_BLOQUE, GeneradorCongruencial
+from momentos import MomentosEnLinea
+from muestreo_normal import box_muller
+
 class Aleatorio:
     def __init__(self, seed, n, a=16807, c=0, m=(2**31 - 1)):
         """
@@ -39,39 +53,59 @@ class Aleatorio:
         self.c = int(c)
         self.m = int(m)
 
+    def lcg_bloques(self, cantidad, tamano=TAMANO_BLOQUE):
+        """Los mismos valores que lcg(cantidad), en arreglos de a lo más `tamano`."""
+        for U in GeneradorCongruencial(self.a, self.seed, self.c, self.m).bloques(cantidad, tamano):
+            # evitar extremos que provoquen log(0) o 1 exacto
+            yield np.clip(U, 1e-12, 1 - 1e-12)
+
     def lcg(self, cantidad):
         """Generador congruencial lineal: retorna lista de U(0,1)."""
-        numeros = []
-        x = self.seed
-        for _ in range(cantidad):
-            x = (self.a * x + self.c) % self.m
-            u = x / self.m
-            # evitar extremos que provoquen log(0) o 1 exacto
-            u = max(min(u, 1 - 1e-12), 1e-12)
-            numeros.append(u)
-        return numeros
+        return next(self.lcg_bloques(cantidad, max(cantidad, 1)), np.empty(0)).tolist()
+
+    def _normales_bloques(self, tamano):
+        """
+        Valores de Box–Muller (sin normalizar) en el orden de generar_normal:
+        del par p se toman Z₁ siempre y Z₂ solo mientras no haya n valores,
+        es decir, el valor de índice global g si g < n o g es par.
+        """
+        inicio = 0
+        for u in self.lcg_bloques(2 * self.n, max(tamano - tamano % 2, 2)):
+            g = np.arange(inicio, inicio + len(u))
+            yield box_muller(u)[(g < self.n) | (g % 2 == 0)]
+            inicio += len(u)
+
+    def bloques_normales(self, tamano=TAMANO_BLOQUE):
+        """
+        Los mismos valores que generar_normal(), entregados por bloques con
+        memoria constante: una pasada para la media y la desviación
+        (MomentosEnLinea) y otra, con la misma semilla, para normalizar.
+        """
+        momentos = MomentosEnLinea.de(self._normales_bloques(tamano))
+        for z in self._normales_bloques(tamano):
+            yield momentos.normalizar(z)
+
+    def saltar(self, n):
+        """Avanza la semilla n pasos en O(log n)."""
+        self.seed = lcg_afin.avanzar(self.seed, self.a, self.c, self.m, n)
+
+    def subflujo(self, cantidad, k, K):
+        """
+        Generador y cantidad de uniformes del trabajador k de K. Las listas
+        lcg(...) de cada uno, concatenadas en orden de k, coinciden con
+        self.lcg(cantidad).
+        """
+        inicio, fin = lcg_afin.particion(cantidad, k, K)
+        generador = copy.copy(self)
+        generador.saltar(inicio)
+        return generador, fin - inicio
 
     def generar_normal(self):
         """Genera y normaliza una lista de n números ~N(0,1) usando Box–Muller."""
-        uniformes = self.lcg(2 * self.n)
-        normales = []
-        for i in range(0, len(uniformes), 2):
-            u1, u2 = uniformes[i], uniformes[i + 1]
-            r = math.sqrt(-2.0 * math.log(u1))
-            theta = 2.0 * math.pi * u2
-            z1 = r * math.cos(theta)
-            z2 = r * math.sin(theta)
-            normales.append(z1)
-            if len(normales) < self.n:
-                normales.append(z2)
+        normales = next(self._normales_bloques(2 * self.n), np.empty(0))
 
         # Normalizar media y desviación estándar
-        mu = sum(normales) / len(normales)
-        sigma = math.sqrt(sum((x - mu)**2 for x in normales) / len(normales))
-        sigma = sigma if sigma != 0 else 1.0
-        normales = [(x - mu) / sigma for x in normales]
-
-        return normales
+        return MomentosEnLinea.de(normales).normalizar(normales).tolist()
 
     def graficar_y_guardar(self, datos, ruta_img="static/img/normal_lcg.png", bins=30):
         """Genera y guarda el histograma (sin mostrar ventana)."""
@@ -93,10 +127,18 @@ class Aleatorio:
     def guardar_en_txt(self, datos, nombre_archivo="numeros_normales.txt", decimales=5):
         """Guarda la muestra normal en un archivo de texto."""
         ruta = os.path.join(os.getcwd(), nombre_archivo)
-        with open(ruta, "w", encoding="utf-8") as f:
-            f.write("Números normales (media~0, sigma~1) generados con LCG + Box-Muller\n")
-            for num in datos:
-                f.write(f"{num:.{decimales}f}\n")
+        guardar_muestra(ruta, np.asarray(datos, dtype=float), decimales=decimales,
+                        encabezado="Números normales (media~0, sigma~1) generados con LCG + Box-Muller")
+        print(f"Archivo guardado en: {ruta}")
+
+    def guardar_binario(self, datos, nombre_archivo="numeros_normales.npy"):
+        """
+        Guarda la muestra en binario (.npy o float64 crudo según la
+        extensión): 8 bytes por número y lectura con memmap. `datos` puede
+        ser una lista, un arreglo o bloques (p. ej. bloques_normales()).
+        """
+        ruta = os.path.join(os.getcwd(), nombre_archivo)
+        guardar_muestra(ruta, datos)
         print(f"Archivo guardado en: {ruta}")
 
 
@@ -1,89 +1,384 @@
 """
 ============================================================
-PRUEBA DE AJUSTE — KOLMOGOROV-SMIRNOV (Distribución Weibull)
+PRUEBA DE AJUSTE — KOLMOGOROV-SMIRNOV (Varias distribuciones)
 ------------------------------------------------------------
 Propósito:
     Verificar si un conjunto de datos puede considerarse
-    proveniente de una distribución Weibull con parámetros
-    dados (alfa, beta), utilizando el método de Kolmogorov-Smirnov.
+    proveniente de una distribución teórica (Weibull, normal,
+    exponencial o uniforme), utilizando el método de
+    Kolmogorov-Smirnov.
 
 Contexto de aplicación:
     Este método es útil en simulación y análisis de confiabilidad
     (tiempos de vida, fallas, duraciones), donde se desea evaluar
     el ajuste de los datos experimentales a una distribución teórica.
 
-
+Método:
+    - La muestra se ordena una sola vez, x₍₁₎ <= ... <= x₍ₙ₎, y se
+      compara la función de distribución empírica con la teórica F en
+      cada dato (sin agrupar en intervalos):
+          D⁺ = máx(i/n - F(x₍ᵢ₎)),  D⁻ = máx(F(x₍ᵢ₎) - (i-1)/n),  D = máx(D⁺, D⁻)
+    - El valor-p y el valor crítico salen de la distribución exacta de D
+      para n datos (scipy.stats.kstwo), no de la aproximación 1.36/√n.
+    - Con el mismo arreglo ordenado se prueban todas las distribuciones
+      candidatas; F se evalúa por bloques, así que la memoria extra no
+      crece con n (la muestra puede ser un memmap de 10^7 valores o más).
+    - Los parámetros que no se indican se estiman con numpy (máxima
+      verosimilitud; la forma de la Weibull por Newton). En ese caso el
+      valor-p es conservador: la prueba supone parámetros conocidos.
+    - `KSEnLinea` no ordena: acumula F(x) en `clases` intervalos de igual
+      probabilidad bloque a bloque (una pasada, memoria fija) y acota D
+      con un error de a lo más 1/clases; sirve para flujos de 10^8 valores
+      o más contra una distribución con parámetros conocidos.
 ============================================================
 """
 
 import numpy as np
-import math
 import matplotlib.pyplot as plt
+from scipy.special import ndtr
+from scipy.stats import kstwo
+
+from archivos_muestra import leer_muestra
+
+# Valores por bloque al evaluar las funciones de distribución
+TAMANO_BLOQUE = 1 << 20
+# Intervalos de probabilidad de KSEnLinea (error de D de a lo más 1/CLASES_EN_LINEA)
+CLASES_EN_LINEA = 1 << 20
+# Tolerancia y máximo de iteraciones de Newton para la forma de la Weibull
+TOLERANCIA_WEIBULL = 1e-10
+ITERACIONES_WEIBULL = 100
+
+
+# ============================================================
+# Estimación de parámetros (sobre la muestra ordenada)
+# ============================================================
+
+def _positivos(x, nombre):
+    if x[0] <= 0:
+        raise ValueError(f"La distribución {nombre} requiere datos positivos.")
+
+
+def estimar_weibull(x):
+    """
+    (forma, escala) de máxima verosimilitud. La forma k resuelve
+        1/k + media(ln x) - Σ xᵏ ln x / Σ xᵏ = 0
+    por Newton; los datos se dividen por el máximo para que xᵏ no desborde.
+    """
+    _positivos(x, "Weibull")
+    maximo = float(x[-1])
+    ly = np.log(x / maximo)
+    media_ly = float(ly.mean())
+    desviacion = float(ly.std())
+    k = 1.2 / desviacion if desviacion > 0 else 1.0      # π/√6 ≈ 1.28 para la Weibull
+    for _ in range(ITERACIONES_WEIBULL):
+        w = np.exp(k * ly)
+        s0 = float(w.sum())
+        w *= ly
+        s1 = float(w.sum())
+        s2 = float(np.dot(w, ly))
+        g = 1 / k + media_ly - s1 / s0
+        derivada = -1 / (k * k) - (s2 / s0 - (s1 / s0) ** 2)
+        paso = g / derivada
+        k = k - paso if k - paso > 0 else k / 2
+        if abs(paso) <= TOLERANCIA_WEIBULL * k:
+            break
+    escala = maximo * float(np.mean(np.exp(k * ly))) ** (1 / k)
+    return k, escala
+
+
+def estimar_normal(x):
+    """(μ, σ) de máxima verosimilitud."""
+    return float(x.mean()), float(x.std())
+
+
+def estimar_exponencial(x):
+    """Escala β (= media) de máxima verosimilitud."""
+    _positivos(x, "exponencial")
+    return (float(x.mean()),)
+
+
+def estimar_uniforme(x):
+    """(a, b) de máxima verosimilitud: mínimo y máximo."""
+    return float(x[0]), float(x[-1])
+
+
+def validar_parametros(nombre, valores):
+    """
+    ValueError si los parámetros no definen una distribución: valores no
+    finitos, escala (o σ) no positiva, o a >= b en la uniforme. Con ellos
+    F daría NaN y D saldría 0 sin aviso.
+    """
+    if not np.all(np.isfinite(valores)):
+        raise ValueError(f"Parámetros no finitos para la distribución {nombre}: {valores}.")
+    if nombre == "uniforme":
+        valida = valores[0] < valores[1]
+    else:
+        valida = all(v > 0 for v in (valores if nombre == "weibull" else valores[-1:]))
+    if not valida:
+        raise ValueError(f"Parámetros degenerados para la distribución {nombre}: {valores} "
+                         f"(varianza nula).")
+
+
+# ============================================================
+# Funciones de distribución
+# ============================================================
+
+def cdf_weibull(x, forma, escala):
+    return -np.expm1(-(np.maximum(x, 0) / escala) ** forma)
+
+
+def cdf_normal(x, mu, sigma):
+    return ndtr((x - mu) / sigma)
+
+
+def cdf_exponencial(x, escala):
+    return -np.expm1(-np.maximum(x, 0) / escala)
+
+
+def cdf_uniforme(x, a, b):
+    return np.clip((x - a) / (b - a), 0.0, 1.0)
+
+
+# nombre: (nombres de los parámetros, estimador, función de distribución)
+DISTRIBUCIONES = {
+    "weibull": (("forma", "escala"), estimar_weibull, cdf_weibull),
+    "normal": (("mu", "sigma"), estimar_normal, cdf_normal),
+    "exponencial": (("escala",), estimar_exponencial, cdf_exponencial),
+    "uniforme": (("a", "b"), estimar_uniforme, cdf_uniforme),
+}
+
+
+# ============================================================
+# Estadístico y prueba
+# ============================================================
+
+def estadistico_ks(ordenados, cdf, tamano=TAMANO_BLOQUE):
+    """D = máx(D⁺, D⁻) de la muestra ordenada contra `cdf`, evaluada por bloques."""
+    n = len(ordenados)
+    d_mas = d_menos = 0.0
+    for inicio in range(0, n, tamano):
+        F = cdf(np.asarray(ordenados[inicio:inicio + tamano], dtype=float))
+        if np.isnan(F).any():
+            raise ValueError("La función de distribución dio NaN (¿parámetros degenerados?).")
+        i = np.arange(inicio + 1, inicio + len(F) + 1) / n
+        d_mas = max(d_mas, float(np.max(i - F)))
+        d_menos = max(d_menos, float(np.max(F - (i - 1 / n))))
+    return max(d_mas, d_menos)
+
+
+def ordenar(datos):
+    """Copia ordenada (float64) de una lista, arreglo, memmap o ruta de archivo."""
+    if isinstance(datos, str):
+        datos = leer_muestra(datos)
+    return np.sort(np.asarray(datos, dtype=float).reshape(-1))
+
+
+def prueba_ks_ordenados(ordenados, distribuciones=tuple(DISTRIBUCIONES), alpha=0.05, parametros=None):
+    """
+    Prueba KS de la muestra ya ordenada contra cada distribución.
+
+    Parámetros:
+        ordenados : arreglo ordenado de forma ascendente.
+        distribuciones : nombres de DISTRIBUCIONES a probar.
+        alpha : nivel de significancia.
+        parametros : dict opcional {nombre: tupla}; las que no figuran se estiman.
+
+    Retorna:
+        dict : {nombre: resultado}; cada resultado tiene parametros, D,
+               p_valor, D_critico, estimados y decision (o error si la
+               distribución no aplica a los datos, p. ej. Weibull con negativos
+               o una muestra constante, o si los parámetros son degenerados).
+    """
+    n = len(ordenados)
+    if n == 0:
+        raise ValueError("La muestra está vacía.")
+    parametros = parametros or {}
+    D_critico = float(kstwo.isf(alpha, n))
+    resultados = {}
+    for nombre in distribuciones:
+        if nombre not in DISTRIBUCIONES:
+            raise ValueError(f"Distribución desconocida: {nombre} (opciones: {', '.join(DISTRIBUCIONES)}).")
+        nombres, estimador, cdf = DISTRIBUCIONES[nombre]
+        estimados = nombre not in parametros
+        try:
+            if estimados and ordenados[0] == ordenados[-1]:
+                raise ValueError("La muestra es constante: no se pueden estimar los parámetros.")
+            valores = tuple(estimador(ordenados)) if estimados else tuple(parametros[nombre])
+            validar_parametros(nombre, valores)
+            D = estadistico_ks(ordenados, lambda x: cdf(x, *valores))
+        except ValueError as e:
+            resultados[nombre] = {"error": str(e)}
+            continue
+        p_valor = float(kstwo.sf(D, n))
+        resultados[nombre] = {
+            "parametros": dict(zip(nombres, valores)),
+            "D": D,
+            "p_valor": p_valor,
+            "D_critico": D_critico,
+            "estimados": estimados,
+            "decision": ("No se rechaza H₀" if D <= D_critico else "Se rechaza H₀"),
+        }
+    return resultados
+
+
+def prueba_ks(datos, distribuciones=tuple(DISTRIBUCIONES), alpha=0.05, parametros=None, mostrar=True):
+    """
+    Ordena `datos` (lista, arreglo, memmap o ruta de archivo) una vez y
+    aplica la prueba KS contra cada distribución (ver prueba_ks_ordenados).
+    Agrega "n" y "mejor" (la distribución con menor D). ValueError si
+    ninguna distribución se pudo probar (p. ej. una muestra constante).
+    """
+    if isinstance(distribuciones, str):
+        distribuciones = (distribuciones,)
+    ordenados = ordenar(datos)
+    resultados = prueba_ks_ordenados(ordenados, distribuciones, alpha, parametros)
+    validos = {nombre: r for nombre, r in resultados.items() if "D" in r}
+    if not validos:
+        raise ValueError(" ".join(f"{nombre}: {r['error']}" for nombre, r in resultados.items()))
+    resumen = {
+        "n": len(ordenados),
+        "alpha": alpha,
+        "resultados": resultados,
+        "mejor": min(validos, key=lambda nombre: validos[nombre]["D"]),
+    }
+    if mostrar:
+        mostrar_resultados(resumen)
+    return resumen
+
+
+class KSEnLinea:
+    """
+    Prueba KS acumulada bloque a bloque contra una distribución con
+    parámetros conocidos (por defecto U(0, 1)).
+
+    Cada valor se transforma con F y se cuenta en uno de `clases`
+    intervalos iguales de [0, 1]. En los bordes j/clases la distribución
+    empírica es exacta; dentro de cada intervalo |Fₙ - F| se acota con los
+    conteos de sus extremos, así que el D reportado es una cota superior
+    que excede al exacto en a lo más 1/clases.
+    """
+
+    def __init__(self, distribucion="uniforme", parametros=(0.0, 1.0), clases=CLASES_EN_LINEA):
+        if distribucion not in DISTRIBUCIONES:
+            raise ValueError(f"Distribución desconocida: {distribucion}.")
+        validar_parametros(distribucion, tuple(parametros))
+        self.distribucion = distribucion
+        self.parametros = tuple(parametros)
+        self.clases = clases
+        self.conteos = np.zeros(clases, dtype=np.int64)
+        self.n = 0
+
+    def agregar(self, bloque):
+        F = DISTRIBUCIONES[self.distribucion][2](np.asarray(bloque, dtype=float).reshape(-1), *self.parametros)
+        clase = np.minimum((F * self.clases).astype(np.int64), self.clases - 1)
+        self.conteos += np.bincount(clase, minlength=self.clases)
+        self.n += len(F)
+
+    def agregar_valor(self, x):
+        """Agrega un solo valor en O(1)."""
+        F = float(DISTRIBUCIONES[self.distribucion][2](float(x), *self.parametros))
+        self.conteos[min(int(F * self.clases), self.clases - 1)] += 1
+        self.n += 1
+
+    def combinar(self, otro):
+        """Suma los conteos de `otro` (misma distribución y clases). Retorna self."""
+        if (otro.distribucion, otro.parametros, otro.clases) != (self.distribucion, self.parametros, self.clases):
+            raise ValueError("Solo se combinan acumuladores con la misma distribución y clases.")
+        self.conteos += otro.conteos
+        self.n += otro.n
+        return self
+
+    def estadistico(self):
+        """(D en los bordes, cota superior de D)."""
+        if self.n == 0:
+            raise ValueError("La muestra está vacía.")
+        empirica = np.concatenate(([0], np.cumsum(self.conteos))) / self.n
+        bordes = np.arange(self.clases + 1) / self.clases
+        en_bordes = float(np.max(np.abs(empirica - bordes)))
+        cota = max(float(np.max(empirica[1:] - bordes[:-1])), float(np.max(bordes[1:] - empirica[:-1])))
+        return en_bordes, cota
+
+    def resultado(self, alpha=0.05):
+        """D (cota superior), su valor mínimo posible, valor-p, valor crítico y decisión."""
+        en_bordes, D = self.estadistico()
+        D_critico = float(kstwo.isf(alpha, self.n))
+        return {
+            "n": self.n,
+            "distribucion": self.distribucion,
+            "parametros": self.parametros,
+            "D": D,
+            "D_minimo": en_bordes,
+            "p_valor": float(kstwo.sf(D, self.n)),
+            "D_critico": D_critico,
+            "decision": ("No se rechaza H₀" if D <= D_critico else "Se rechaza H₀"),
+        }
+
+
+def mostrar_resultados(resumen):
+    """Imprime la tabla de resultados de prueba_ks."""
+    print(f"\nPRUEBA DE KOLMOGOROV–SMIRNOV (n = {resumen['n']}, α = {resumen['alpha']})")
+    print("-" * 86)
+    print(f"{'Distribución':<13} {'Parámetros':<34} {'D':<9} {'D crítico':<10} {'Valor-p':<9} Decisión")
+    print("-" * 86)
+    for nombre, r in resumen["resultados"].items():
+        if "error" in r:
+            print(f"{nombre:<13} {r['error']}")
+            continue
+        parametros = ", ".join(f"{k}={v:.4g}" for k, v in r["parametros"].items())
+        parametros += " (est.)" if r["estimados"] else ""
+        print(f"{nombre:<13} {parametros:<34} {r['D']:<9.5f} {r['D_critico']:<10.5f} "
+              f"{r['p_valor']:<9.4f} {r['decision']}")
+    print("-" * 86)
+    if resumen["mejor"]:
+        print(f"Mejor ajuste (menor D): {resumen['mejor']}")
+
+
+def graficar_ajuste(ordenados, resumen, ruta_guardado, titulo="Prueba de Kolmogorov–Smirnov"):
+    """Guarda la distribución empírica junto a las funciones teóricas ajustadas."""
+    n = len(ordenados)
+    paso = max(n // 5000, 1)                  # a lo más ~5000 puntos de la escalera
+    x = np.asarray(ordenados[::paso], dtype=float)
+    plt.figure(figsize=(8, 5))
+    plt.step(x, np.arange(1, n + 1, paso) / n, where="post", color="black", label="Empírica")
+    malla = np.linspace(x[0], x[-1], 400)
+    for nombre, r in resumen["resultados"].items():
+        if "D" in r:
+            cdf = DISTRIBUCIONES[nombre][2]
+            plt.plot(malla, cdf(malla, *r["parametros"].values()), label=f"{nombre} (D = {r['D']:.4f})")
+    plt.title(titulo)
+    plt.xlabel("x")
+    plt.ylabel("F(x)")
+    plt.grid(alpha=0.3)
+    plt.legend()
+    plt.tight_layout()
+    plt.savefig(ruta_guardado)
+    plt.close()
+
+
+# ===== Ejecución (valores fijos, sin input) =====
+if __name__ == "__main__":
+    # --- 1. Datos de entrada ---
+    datos = np.array([
+        4.33, 9.97, 2.81, 4.34, 1.36, 1.61, 7.86, 14.39, 1.76, 3.53,
+        2.16, 5.49, 3.44, 2.30, 6.58, 2.88, 0.98, 9.92, 5.24, 1.46,
+        0.70, 4.52, 4.38, 11.65, 8.42, 0.44, 2.12, 8.04, 10.92, 3.69,
+        1.59, 4.44, 2.18, 12.16, 2.44, 2.15, 0.82, 6.19, 6.60, 0.28,
+        8.59, 6.96, 4.48, 0.85, 1.90, 7.36, 3.04, 9.66, 4.82, 2.89
+    ])
+
+    # --- 2. Weibull con los parámetros dados (α = 1.38 forma, β = 5.19 escala) ---
+    resumen = prueba_ks(datos, "weibull", parametros={"weibull": (1.38, 5.19)})
+    if resumen["resultados"]["weibull"]["decision"] == "No se rechaza H₀":
+        print("✅ No se rechaza H₀: Los datos siguen la distribución Weibull.")
+    else:
+        print("❌ Se rechaza H₀: Los datos no siguen la distribución Weibull.")
 
+    # --- 3. Todas las candidatas con parámetros estimados ---
+    ordenados = ordenar(datos)
+    resumen = prueba_ks(ordenados)
+    graficar_ajuste(ordenados, resumen, "static/img/kolmogorov_weibull.png",
+                    titulo="Prueba de Kolmogorov–Smirnov — Distribución empírica y ajustes")
 
-# --- 1. Datos de entrada ---
-datos = np.array([
-    4.33, 9.97, 2.81, 4.34, 1.36, 1.61, 7.86, 14.39, 1.76, 3.53,
-    2.16, 5.49, 3.44, 2.30, 6.58, 2.88, 0.98, 9.92, 5.24, 1.46,
-    0.70, 4.52, 4.38, 11.65, 8.42, 0.44, 2.12, 8.04, 10.92, 3.69,
-    1.59, 4.44, 2.18, 12.16, 2.44, 2.15, 0.82, 6.19, 6.60, 0.28,
-    8.59, 6.96, 4.48, 0.85, 1.90, 7.36, 3.04, 9.66, 4.82, 2.89
-])
-
-# --- 2. Parámetros del modelo Weibull ---
-alpha = 1.38   # parámetro de forma
-beta = 5.19    # parámetro de escala
-
-# --- 3. Configuración de intervalos ---
-m = 8          # número de intervalos
-A = 2          # amplitud por intervalo
-bins = np.arange(0, m * A + 2, A)
-
-# --- 4. Cálculo de frecuencias observadas ---
-Oi, _ = np.histogram(datos, bins=bins)
-Ni = np.cumsum(Oi)
-POi = Oi / len(datos)
-POAi = Ni / len(datos)
-
-# --- 5. Cálculo de probabilidades esperadas acumuladas (Weibull) ---
-lim_sup = bins[1:]
-PEAi = 1 - np.exp(-((lim_sup / beta) ** alpha))
-
-# --- 6. Estadístico KS ---
-diferencias = np.abs(POAi - PEAi)
-c = np.max(diferencias)
-
-# --- 7. Mostrar resultados en tabla ---
-print("\nPRUEBA DE KOLMOGOROV–SMIRNOV — DISTRIBUCIÓN WEIBULL")
-print("----------------------------------------------------------")
-print(f"{'Intervalo':<10} {'Oi':<5} {'POi':<8} {'POAi':<8} {'PEAi':<8} {'|POAi-PEAi|':<10}")
-print("-"*65)
-for i in range(len(Oi)):
-    intervalo = f"{bins[i]:.0f}-{bins[i+1]:.0f}"
-    print(f"{intervalo:<10} {Oi[i]:<5} {POi[i]:<8.4f} {POAi[i]:<8.4f} {PEAi[i]:<8.4f} {diferencias[i]:<10.4f}")
-print("-"*65)
-print(f"Estadístico KS (c) = {c:.4f}")
-print("----------------------------------------------------------")
-
-# --- 8. Valor crítico (α = 0.05) ---
-n = len(datos)
-D_critico = 1.36 / math.sqrt(n)
-print(f"Valor crítico (α=0.05): {D_critico:.4f}")
-
-# --- 9. Conclusión ---
-if c < D_critico:
-    print("✅ No se rechaza H₀: Los datos siguen la distribución Weibull.")
-else:
-    print("❌ Se rechaza H₀: Los datos no siguen la distribución Weibull.")
-
-# --- 10. Histograma ---
-plt.figure(figsize=(8, 5))
-plt.hist(datos, bins=bins, edgecolor='black', color='lightblue', alpha=0.7)
-plt.title("Histograma de frecuencias — Prueba de Kolmogorov–Smirnov (Weibull)")
-plt.xlabel("Intervalos")
-plt.ylabel("Frecuencia")
-plt.grid(axis="y", alpha=0.75)
-plt.xticks(bins)
-plt.tight_layout()
-plt.savefig("static/img/kolmogorov_weibull.png")  # para uso en hosting
-plt.close()
+    # --- 4. Muestra grande: 10^6 valores Weibull(1.38, 5.19) ---
+    grande = 5.19 * np.random.default_rng(12345).weibull(1.38, 10**6)
+    prueba_ks(grande)
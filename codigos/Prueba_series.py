@@ -16,116 +16,448 @@ Hipótesis:
     H₀: Los números son independientes.
     H₁: Los números NO son independientes.
 
-
+Implementación:
+    - Cada número se asigna a su intervalo cᵢ = ⌊rᵢ·m⌋ y cada k-tupla
+      (rᵢ, ..., rᵢ₊ₖ₋₁) a una celda del hipercubo con el índice
+          cᵢ·m^(k-1) + cᵢ₊₁·m^(k-2) + ... + cᵢ₊ₖ₋₁
+      (k = 2: los pares de siempre). Las frecuencias se cuentan con
+      np.bincount sobre ese índice.
+    - Si m^k es muy grande para un arreglo denso se cuentan solo las
+      celdas ocupadas (np.unique):  χ² = (m^k / T)·Σ O² - T.
+    - El valor crítico y el valor-p salen de la distribución χ² (scipy)
+      para cualquier número de grados de libertad.
+    - Con tuplas solapadas (por defecto, como la prueba original) los
+      conteos no son independientes y χ² es aproximado; `solapados=False`
+      usa tuplas disjuntas (rₖⱼ, ..., rₖⱼ₊ₖ₋₁), la prueba de series clásica.
+    - `ConteoSeries` acumula las frecuencias bloque a bloque (o valor a
+      valor con `agregar_valor`, guardando solo los últimos k - 1 valores)
+      y se combina con otros conteos; `prueba_series_archivo(ruta)` lo usa para probar
+      archivos más grandes que la memoria, repartidos entre procesos.
+============================================================
 """
 
+# determinista: si
+
+import multiprocessing
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
 import numpy as np
-import matplotlib.pyplot as plt
-
-# --- Tabla de valores críticos χ² (α = 0.05) ---
-CHI2_CRITICOS_005 = {
-    1: 3.841, 2: 5.991, 3: 7.815, 4: 9.488, 5: 11.070,
-    6: 12.592, 7: 14.067, 8: 15.507, 9: 16.919, 10: 18.307,
-    11: 19.675, 12: 21.026, 13: 22.362, 14: 23.685, 15: 24.996,
-    16: 26.296, 17: 27.587, 18: 28.869, 19: 30.144, 20: 31.410,
-    21: 32.671, 22: 33.924, 23: 35.172, 24: 36.415, 25: 37.652,
-    26: 38.885, 27: 40.113, 28: 41.337, 29: 42.557, 30: 43.773
-}
+from matplotlib.figure import Figure
+from scipy.stats import chi2
+
+from archivos_muestra import formato_de, leer_bloques, leer_muestra
+from lcg_afin import particion
+
+# Mayor cantidad de celdas contadas en un arreglo denso (más: conteo disperso)
+CELDAS_DENSAS_MAX = 1 << 24
+# Pares dibujados como máximo en el gráfico de dispersión
+PARES_GRAFICO_MAX = 20000
+# Celdas agregadas valor a valor que se juntan antes de pasarlas al conteo disperso
+CELDAS_SUELTAS_MAX = 1 << 16
+# Valores por bloque al leer archivos
+TAMANO_BLOQUE = 1 << 22
 
 # ============================================================
 # Funciones
 # ============================================================
 
 def leer_datos(archivo: str):
-    """Lee un archivo de texto con números separados por espacio o salto de línea."""
-    with open(archivo, "r") as f:
-        return [float(x) for x in f.read().split()]
+    """
+    Lee la muestra detectando el formato (ver archivos_muestra.py): .npy o
+    float64 crudo se abren como memmap sin copiar; el texto (números
+    separados por espacio o salto de línea) se carga en un arreglo.
+    """
+    return leer_muestra(archivo)
+
+
+def indices_tuplas(datos, m, k=2, solapados=True):
+    """
+    Índice de celda (0..m^k - 1) de cada k-tupla de `datos`.
+    Solapadas: n - k + 1 tuplas; disjuntas: n // k tuplas.
+    """
+    if m ** k >= 1 << 63:
+        raise ValueError(f"m^k = {m}^{k} no cabe en un índice de 64 bits.")
+    c = np.clip((np.asarray(datos, dtype=float) * m).astype(np.int64), 0, m - 1)
+    if solapados:
+        t = len(c) - k + 1
+        columnas = [c[j:j + t] for j in range(k)]
+    else:
+        t = len(c) // k
+        columnas = [c[j:t * k:k] for j in range(k)]
+    indice = np.zeros(max(t, 0), dtype=np.int64)
+    for columna in columnas:
+        indice *= m
+        indice += columna
+    return indice
+
+
+def contar_celdas(indice, celdas):
+    """
+    Frecuencias de las celdas: arreglo denso de largo `celdas` o, si son
+    demasiadas, (celdas ocupadas, conteos).
+    """
+    if celdas <= CELDAS_DENSAS_MAX:
+        return np.bincount(indice, minlength=celdas)
+    return np.unique(indice, return_counts=True)
+
+
+def chi_cuadrado_celdas(conteos, celdas, tuplas):
+    """χ² de frecuencias uniformes sobre `celdas` (conteo denso o disperso)."""
+    if tuplas == 0:
+        return 0.0
+    if isinstance(conteos, tuple):
+        O = conteos[1].astype(float)
+        # Σ (O - E)² / E sobre todas las celdas, con las vacías incluidas
+        return float(celdas / tuplas * np.dot(O, O) - tuplas)
+    E = tuplas / celdas
+    O = conteos.astype(float)
+    return float(np.sum((O - E) ** 2) / E)
+
+
+class ConteoSeries:
+    """
+    Frecuencias de las k-tuplas acumuladas bloque a bloque.
+
+    Entre bloques se guardan los últimos valores que todavía no forman
+    una tupla completa (k - 1 con tuplas solapadas), así que las tuplas
+    que cruzan el borde de un bloque se cuentan igual que si la secuencia
+    llegara entera. La memoria es proporcional a m^k (o a las celdas
+    ocupadas en el conteo disperso) más un bloque.
+
+    Parámetros:
+        m (int): intervalos por eje.
+        k (int): largo de las tuplas.
+        solapados (bool): tuplas solapadas o disjuntas.
+    """
+
+    def __init__(self, m, k=2, solapados=True):
+        if m < 1 or k < 1:
+            raise ValueError("m y k deben ser >= 1.")
+        if m ** k >= 1 << 63:
+            raise ValueError(f"m^k = {m}^{k} no cabe en un índice de 64 bits.")
+        self.m, self.k, self.solapados = m, k, solapados
+        self.celdas = m ** k
+        self.n = 0                  # valores recibidos
+        self.tuplas = 0             # tuplas contadas
+        self._resto = np.empty(0)   # valores pendientes del bloque anterior
+        self._sueltos = {}          # conteo disperso: celdas agregadas valor a valor
+        if self.celdas <= CELDAS_DENSAS_MAX:
+            self.conteos = np.zeros(self.celdas, dtype=np.int64)
+        else:
+            self.conteos = (np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64))
+
+    def _sumar(self, conteos):
+        if not isinstance(conteos, tuple):
+            self.conteos += conteos
+            return
+        celdas = np.concatenate((self.conteos[0], conteos[0]))
+        frecuencias = np.concatenate((self.conteos[1], conteos[1]))
+        ocupadas, posicion = np.unique(celdas, return_inverse=True)
+        self.conteos = (ocupadas, np.bincount(posicion, weights=frecuencias).astype(np.int64))
+
+    def agregar(self, bloque):
+        bloque = np.asarray(bloque, dtype=float).reshape(-1)
+        self.n += len(bloque)
+        x = np.concatenate((self._resto, bloque)) if len(self._resto) else bloque
+        indice = indices_tuplas(x, self.m, self.k, self.solapados)
+        usados = len(x) - (self.k - 1) if self.solapados else len(indice) * self.k
+        self._resto = np.array(x[max(usados, 0):])
+        if len(indice):
+            self.tuplas += len(indice)
+            self._sumar(contar_celdas(indice, self.celdas))
+
+    def agregar_valor(self, x):
+        """Agrega un solo valor en O(k) (para monitorear un generador en vivo)."""
+        self.n += 1
+        valores = self._resto.tolist() + [float(x)]
+        if len(valores) == self.k:
+            celda = 0
+            for v in valores:
+                celda = celda * self.m + min(max(int(v * self.m), 0), self.m - 1)
+            self.tuplas += 1
+            if self.disperso:
+                self._sueltos[celda] = self._sueltos.get(celda, 0) + 1
+                if len(self._sueltos) >= CELDAS_SUELTAS_MAX:
+                    self._consolidar()
+            else:
+                self.conteos[celda] += 1
+            valores = valores[1:] if self.solapados else []
+        self._resto = np.array(valores)
+
+    def _consolidar(self):
+        """Pasa al conteo disperso las celdas agregadas con agregar_valor."""
+        if self._sueltos:
+            sueltos, self._sueltos = self._sueltos, {}
+            self._sumar((np.fromiter(sueltos.keys(), dtype=np.int64, count=len(sueltos)),
+                         np.fromiter(sueltos.values(), dtype=np.int64, count=len(sueltos))))
+
+    def combinar(self, otro):
+        """
+        Suma las frecuencias de `otro` (p. ej. de otro proceso). Las tuplas
+        que cruzan el borde entre ambos no se agregan: cada parte debe
+        incluir los valores que necesita. Retorna self.
+        """
+        if (otro.m, otro.k, otro.solapados) != (self.m, self.k, self.solapados):
+            raise ValueError("Solo se combinan conteos con los mismos m, k y solapados.")
+        otro._consolidar()
+        self.n += otro.n
+        self.tuplas += otro.tuplas
+        self._sumar(otro.conteos)
+        return self
+
+    @property
+    def disperso(self):
+        return isinstance(self.conteos, tuple)
+
+    def chi_cuadrado(self):
+        self._consolidar()
+        return chi_cuadrado_celdas(self.conteos, self.celdas, self.tuplas)
+
+    def resultado(self, alpha=0.05, mostrar=True):
+        """chi², gl, valor crítico, valor-p y decisión; los imprime si mostrar=True."""
+        m, k, celdas, tuplas = self.m, self.k, self.celdas, self.tuplas
+        if tuplas == 0:
+            raise ValueError(f"La prueba de series requiere al menos {k} números.")
+        E = tuplas / celdas
+        chi2_calc = self.chi_cuadrado()
+        gl = celdas - 1
+
+        # --- Valor crítico y valor-p ---
+        if gl > 0:
+            chi2_crit = float(chi2.ppf(1 - alpha, gl))
+            p_valor = float(chi2.sf(chi2_calc, gl))
+            if chi2_calc <= chi2_crit:
+                decision = "✅ Se acepta H₀: Los números son independientes."
+            else:
+                decision = "❌ Se rechaza H₀: Los números son dependientes."
+        else:
+            chi2_crit = p_valor = None
+            decision = "⚠ Se requiere al menos 2 celdas (m^k > 1)."
+
+        # --- Mostrar resultados ---
+        if mostrar:
+            print("\n=== PRUEBA DE SERIES ===")
+            print(f"Número de datos: {self.n}")
+            print(f"Número de {'pares' if k == 2 else f'{k}-tuplas'}: {tuplas}"
+                  f"{'' if self.solapados else ' (disjuntas)'}")
+            print(f"Casillas por eje (m): {m}   Celdas: {celdas}"
+                  f"{' (conteo disperso)' if self.disperso else ''}")
+            print(f"Frecuencia esperada (E): {E:.4f}")
+            print(f"Chi² calculado: {chi2_calc:.4f}")
+            print(f"Grados de libertad: {gl}")
+            if chi2_crit is not None:
+                print(f"Chi² crítico (α={alpha}): {chi2_crit:.4f}")
+                print(f"Valor-p: {p_valor:.4f}")
+            print(decision)
+            if E < 5:
+                print("⚠ Frecuencia esperada menor que 5: el χ² es poco confiable (use un m menor).")
 
+        return {
+            "chi2_calc": chi2_calc,
+            "gl": gl,
+            "chi2_crit": chi2_crit,
+            "p_valor": p_valor,
+            "decision": decision,
+            "n": self.n,
+            "m": m,
+            "k": k,
+            "celdas": celdas,
+            "tuplas": tuplas,
+        }
 
-def prueba_series(datos, alpha=0.05, mostrar_pares=False):
+
+def m_por_defecto(n, k=2):
+    """Intervalos por eje para que haya cerca de una tupla por celda: round(n^(1/k))."""
+    return max(int(round(n ** (1 / k))), 1)
+
+
+def prueba_series(datos, alpha=0.05, mostrar_pares=False, m=None, k=2, solapados=True,
+                  ruta_grafico="static/img/series_test.png", mostrar=True):
     """
     Aplica la prueba de series usando numpy para eficiencia.
 
     Parámetros:
-        datos : list[float]
+        datos : list[float] | ndarray | memmap
             Secuencia de números en (0,1).
         alpha : float
             Nivel de significancia.
         mostrar_pares : bool
-            Si es True, muestra todos los pares generados.
+            Si es True, muestra todas las tuplas generadas.
+        m : int, opcional
+            Intervalos por eje (por defecto round(n^(1/k))).
+        k : int
+            Largo de las tuplas (2 = pares).
+        solapados : bool
+            Tuplas consecutivas solapadas (rᵢ, rᵢ₊₁, ...) o disjuntas.
+        ruta_grafico : str | None
+            Dónde guardar la dispersión de pares (None: sin gráfico).
+        mostrar : bool
+            Si es True, imprime la tabla de frecuencias y el resultado.
 
     Retorna:
-        dict : resultados principales (chi² calculado, gl, decisión).
+        dict : resultados principales (chi² calculado, gl, valor crítico,
+               valor-p, decisión).
     """
+    datos = np.asarray(datos, dtype=float)
     n = len(datos)
-    pares = [(datos[i], datos[i + 1]) for i in range(n - 1)]
-    m = int(round(n ** 0.5))  # número de intervalos por eje
-
-    # --- Matriz de frecuencias observadas ---
-    O = np.zeros((m, m), dtype=int)
-    for x, y in pares:
-        i = min(int(x * m), m - 1)
-        j = min(int(y * m), m - 1)
-        O[i, j] += 1
-
-    # --- Frecuencia esperada por celda ---
-    E = (n - 1) / (m * m)
-    chi2_calc = np.sum((O - E) ** 2 / E)
-    gl = m * m - 1
-
-    # --- Valor crítico ---
-    chi2_crit = CHI2_CRITICOS_005.get(gl, None)
-
-    # --- Mostrar resultados ---
-    print("\n=== PRUEBA DE SERIES ===")
-    print(f"Número de datos: {n}")
-    print(f"Número de pares: {len(pares)}")
-    print(f"Casillas por eje (m): {m}")
-    print(f"Frecuencia esperada (E): {E:.4f}")
-    print(f"Chi² calculado: {chi2_calc:.4f}")
-    print(f"Grados de libertad: {gl}")
-
-    if chi2_crit:
-        print(f"Chi² crítico (α={alpha}): {chi2_crit}")
-        if chi2_calc <= chi2_crit:
-            decision = "✅ Se acepta H₀: Los números son independientes."
-        else:
-            decision = "❌ Se rechaza H₀: Los números son dependientes."
-        print(decision)
-    else:
-        decision = "⚠ No hay valor crítico precargado para gl = " + str(gl)
-        print(decision)
+    if m is None:
+        m = m_por_defecto(n, k)  # número de intervalos por eje
 
-    # --- Mostrar pares opcional ---
+    # --- Frecuencias observadas por celda ---
+    conteo = ConteoSeries(m, k, solapados)
+    conteo.agregar(datos)
+    resultado = conteo.resultado(alpha, mostrar)
+
+    # --- Mostrar tuplas opcional ---
     if mostrar_pares:
-        print("\nPares (rᵢ, rᵢ₊₁):")
-        for i, (a, b) in enumerate(pares, start=1):
-            print(f"{i:>3}: ({a:.4f}, {b:.4f})")
-
-    # --- Gráfico de dispersión ---
-    x_vals, y_vals = zip(*pares)
-    plt.figure(figsize=(6, 6))
-    plt.scatter(x_vals, y_vals, c="red", marker="o", alpha=0.6)
-    plt.title("Prueba de Series — Dispersión de Pares Consecutivos")
-    plt.xlabel("r(i)")
-    plt.ylabel("r(i+1)")
-    plt.grid(True, linestyle="--", alpha=0.5)
-    plt.tight_layout()
-    plt.savefig("static/img/series_test.png")
-    plt.close()
+        print("\nPares (rᵢ, rᵢ₊₁):" if k == 2 else f"\n{k}-tuplas:")
+        paso = 1 if solapados else k
+        for i in range(conteo.tuplas):
+            tupla = ", ".join(f"{v:.4f}" for v in datos[i * paso:i * paso + k])
+            print(f"{i + 1:>3}: ({tupla})")
+
+    # --- Gráfico de dispersión (primeros pares) ---
+    if ruta_grafico and n > 1:
+        cantidad = min(n - 1, PARES_GRAFICO_MAX)
+        # Figura propia, sin el estado global de pyplot (se llama desde hilos del servidor)
+        figura = Figure(figsize=(6, 6))
+        ejes = figura.subplots()
+        ejes.scatter(datos[:cantidad], datos[1:cantidad + 1], c="red", marker="o",
+                     alpha=0.6 if cantidad <= 1000 else 0.2, s=20 if cantidad <= 1000 else 2)
+        ejes.set_title("Prueba de Series — Dispersión de Pares Consecutivos")
+        ejes.set_xlabel("r(i)")
+        ejes.set_ylabel("r(i+1)")
+        ejes.grid(True, linestyle="--", alpha=0.5)
+        figura.tight_layout()
+        figura.savefig(ruta_grafico)
 
     # --- Retornar resultados para usar en GUI o reporte ---
-    return {
-        "chi2_calc": chi2_calc,
-        "gl": gl,
-        "chi2_crit": chi2_crit,
-        "decision": decision,
-    }
+    return resultado
+
+
+# ============================================================
+# Archivos más grandes que la memoria
+# ============================================================
+
+def _contar_tramo(ruta, inicio, fin, m, k, solapados, tamano):
+    """Conteo de los valores [inicio, fin) de un archivo binario (se ejecuta en un proceso aparte)."""
+    datos = leer_muestra(ruta)
+    conteo = ConteoSeries(m, k, solapados)
+    for i in range(inicio, fin, tamano):
+        conteo.agregar(datos[i:min(i + tamano, fin)])
+    return conteo
+
+
+def _tramos(n, k, solapados, partes):
+    """
+    Tramos de valores [inicio, fin) de cada parte. Con tuplas solapadas
+    cada tramo se extiende k - 1 valores sobre el siguiente, para contar
+    las tuplas que empiezan al final del tramo; con tuplas disjuntas los
+    bordes caen en múltiplos de k.
+    """
+    if solapados:
+        total = max(n - k + 1, 0)
+        bordes = [particion(total, i, partes) for i in range(partes)]
+        return [(a, b + k - 1) for a, b in bordes if b > a]
+    bordes = [particion(n // k, i, partes) for i in range(partes)]
+    return [(a * k, b * k) for a, b in bordes if b > a]
+
+
+def _paralelo_disponible():
+    # Los procesos daemon (p. ej. los trabajadores del servidor) no pueden
+    # crear hijos, y un módulo cargado sin importar no se puede enviar a otro proceso
+    if multiprocessing.current_process().daemon:
+        return False
+    modulo = sys.modules.get(__name__)
+    return modulo is not None and getattr(modulo, "_contar_tramo", None) is _contar_tramo
+
+
+def contar_archivo(ruta, m=None, k=2, solapados=True, procesos=None, tamano=TAMANO_BLOQUE):
+    """
+    ConteoSeries de la muestra guardada en `ruta` sin cargarla completa.
+
+    Los binarios (.npy, float64 crudo) se abren como memmap y se reparten
+    en tramos entre `procesos` procesos (por defecto, uno por núcleo);
+    los conteos de cada tramo se suman al final. El texto se lee por
+    partes en un solo proceso (conviene pasarlo antes a .npy con
+    archivos_muestra.convertir).
+    """
+    if formato_de(ruta) == "texto":
+        if m is None:
+            m = m_por_defecto(sum(len(bloque) for bloque in leer_bloques(ruta, tamano)), k)
+        conteo = ConteoSeries(m, k, solapados)
+        for bloque in leer_bloques(ruta, tamano):
+            conteo.agregar(bloque)
+        return conteo
+
+    n = len(leer_muestra(ruta))
+    if m is None:
+        m = m_por_defecto(n, k)
+    procesos = procesos or os.cpu_count() or 1
+    tramos = _tramos(n, k, solapados, max(procesos, 1))
+    if procesos > 1 and len(tramos) > 1 and _paralelo_disponible():
+        with ProcessPoolExecutor(max_workers=min(procesos, len(tramos)),
+                                 mp_context=multiprocessing.get_context("spawn")) as ejecutor:
+            partes = list(ejecutor.map(_contar_tramo, *zip(*[(ruta, a, b, m, k, solapados, tamano)
+                                                             for a, b in tramos])))
+    else:
+        partes = [_contar_tramo(ruta, a, b, m, k, solapados, tamano) for a, b in tramos]
+
+    conteo = ConteoSeries(m, k, solapados)
+    for parte in partes:
+        conteo.combinar(parte)
+    conteo.n = n    # los tramos solapados repiten k - 1 valores en cada borde
+    return conteo
+
+
+def prueba_series_archivo(ruta, alpha=0.05, m=None, k=2, solapados=True, procesos=None,
+                          tamano=TAMANO_BLOQUE, mostrar=True):
+    """
+    Prueba de series sobre un archivo de muestra de cualquier tamaño (ver
+    contar_archivo). La memoria usada es proporcional a m^k más un bloque
+    de `tamano` valores por proceso.
+    """
+    return contar_archivo(ruta, m, k, solapados, procesos, tamano).resultado(alpha, mostrar)
+
+
+def prueba_series_generador(n=100000, generador="numpy", semilla=None, m=None, k=2, alpha=0.05,
+                            ruta_grafico="static/img/series_test.png", mostrar=True):
+    """
+    Prueba de series sobre n uniformes de un generador (ver generadores.py).
+    Con mostrar=False no imprime la tabla (p. ej. al llamarla desde la API).
+    """
+    from generadores import obtener_generador
+
+    datos = obtener_generador(generador, semilla).uniformes(n)
+    resultado = prueba_series(datos, alpha, m=m, k=k, ruta_grafico=ruta_grafico, mostrar=mostrar)
+    resultado["generador"] = generador
+    p_valor = f"{resultado['p_valor']:.4f}" if resultado["p_valor"] is not None else "-"
+    resultado["mensaje"] = (f"Prueba de series ({generador}, n = {n}, m = {resultado['m']}, k = {k}): "
+                            f"χ² = {resultado['chi2_calc']:.3f}, gl = {resultado['gl']}, "
+                            f"p = {p_valor}. {resultado['decision']}")
+    return resultado
 
 
 # ============================================================
 # Ejecución directa
 # ============================================================
 if __name__ == "__main__":
-    datos = leer_datos("datos_tarea_estadistica_comput.txt")
-    prueba_series(datos, alpha=0.05, mostrar_pares=False)
+    import tempfile
+
+    from archivos_muestra import guardar_muestra
+    from generadores import GeneradorLCG
+
+    if os.path.exists("datos_tarea_estadistica_comput.txt"):
+        prueba_series(leer_datos("datos_tarea_estadistica_comput.txt"), alpha=0.05, mostrar_pares=False)
+
+    # 10^5 uniformes del LCG en memoria (con el gráfico de dispersión)
+    prueba_series(GeneradorLCG(semilla=12345).uniformes(10**5), alpha=0.05)
+
+    # Volcado binario de 10^6 uniformes (8 MB) en una carpeta temporal, probado por tramos
+    with tempfile.TemporaryDirectory() as carpeta:
+        ruta = os.path.join(carpeta, "lcg.npy")
+        guardar_muestra(ruta, GeneradorLCG(semilla=12345).bloques(10**6))
+        prueba_series_archivo(ruta, alpha=0.05, m=100)
+        prueba_series_archivo(ruta, alpha=0.05, m=10, k=4, solapados=False)
@@ -1,51 +1,55 @@
+# determinista: no
+
 import pandas as pd
 import numpy as np
 
-def simular_cola_banco(num_clientes: int, tasa_llegada: float, tasa_servicio: float):
+from generadores import obtener_generador
+from momentos import MomentosEnLinea
+
+def simular_cola_banco(num_clientes: int, tasa_llegada: float, tasa_servicio: float, generador=None):
     """
     Simulación de Cola de Banco (Modelo M/M/1)
     Retorna resultados como texto o diccionario
+    `generador`: fuente de números aleatorios (ver generadores.py)
     """
 
     # Verificación básica
     if num_clientes <= 0 or tasa_llegada <= 0 or tasa_servicio <= 0:
         return {"mensaje": "Parametros invalidos. Todos deben ser mayores que 0."}
 
+    generador = obtener_generador(generador)
+
     # Advertencia si el sistema es inestable
     advertencia = ""
     if tasa_llegada >= tasa_servicio:
         advertencia = "El sistema podria volverse inestable (lambda >= mu)."
 
     # Generar tiempos de llegada y servicio
-    tiempos_llegada = np.random.exponential(1 / tasa_llegada, num_clientes)
-    tiempos_servicio = np.random.exponential(1 / tasa_servicio, num_clientes)
-
-    llegada_acumulada = 0
-    fin_cajero = 0
-    registros = []
-
-    for i in range(num_clientes):
-        llegada_acumulada += tiempos_llegada[i]
-        inicio_servicio = max(llegada_acumulada, fin_cajero)
-        espera = inicio_servicio - llegada_acumulada
-        fin_servicio = inicio_servicio + tiempos_servicio[i]
-        tiempo_total = fin_servicio - llegada_acumulada
-        fin_cajero = fin_servicio
-
-        registros.append({
-            "Cliente": i + 1,
-            "Llegada": round(llegada_acumulada, 3),
-            "Inicio": round(inicio_servicio, 3),
-            "Fin": round(fin_servicio, 3),
-            "Espera": round(espera, 3),
-            "Tiempo_Total": round(tiempo_total, 3),
-        })
-
-    df = pd.DataFrame(registros)
-
-    # Métricas observadas
-    promedio_espera = float(df["Espera"].mean())
-    promedio_total = float(df["Tiempo_Total"].mean())
+    tiempos_llegada = generador.exponenciales(1 / tasa_llegada, num_clientes)
+    tiempos_servicio = generador.exponenciales(1 / tasa_servicio, num_clientes)
+
+    # Recursión de Lindley sin bucle: espera_i = max(0, fin_cajero_{i-1} - llegada_i)
+    llegada_acumulada = np.cumsum(tiempos_llegada)
+    Z = np.concatenate(([0.0], np.cumsum(tiempos_servicio[:-1] - tiempos_llegada[1:])))
+    espera = Z - np.minimum.accumulate(Z)
+    inicio_servicio = llegada_acumulada + espera
+    fin_servicio = inicio_servicio + tiempos_servicio
+    tiempo_total = fin_servicio - llegada_acumulada
+
+    df = pd.DataFrame({
+        "Cliente": np.arange(1, num_clientes + 1),
+        "Llegada": np.round(llegada_acumulada, 3),
+        "Inicio": np.round(inicio_servicio, 3),
+        "Fin": np.round(fin_servicio, 3),
+        "Espera": np.round(espera, 3),
+        "Tiempo_Total": np.round(tiempo_total, 3),
+    })
+
+    # Métricas observadas (sobre los valores redondeados de la tabla)
+    espera_tabla = MomentosEnLinea.de(df["Espera"].to_numpy())
+    total_tabla = MomentosEnLinea.de(df["Tiempo_Total"].to_numpy())
+    promedio_espera = espera_tabla.media
+    promedio_total = total_tabla.media
     clientes_esperaron = int((df["Espera"] > 0).sum())
     porcentaje_esperaron = round((clientes_esperaron / num_clientes) * 100, 2)
 
@@ -79,6 +83,8 @@ def simular_cola_banco(num_clientes: int, tasa_llegada: float, tasa_servicio: fl
     resultados = {
         "promedio_espera": promedio_espera,
         "promedio_total": promedio_total,
+        "desviacion_espera": espera_tabla.desviacion(),
+        "espera_maxima": espera_tabla.maximo,
         "rho": rho,
         "clientes_esperaron": clientes_esperaron,
         "porcentaje_esperaron": porcentaje_esperaron,
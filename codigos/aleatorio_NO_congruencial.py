@@ -15,10 +15,16 @@ Descripción:
     - Se eleva al cuadrado la semilla inicial.
     - Se extraen los dígitos centrales para formar la nueva semilla.
     - Cada valor generado (r_i) se normaliza entre 0 y 1.
+    - Los dígitos centrales se obtienen con aritmética entera y, con
+      `detener_en_ciclo=True`, la generación se detiene cuando la
+      secuencia empieza a repetirse (ver cuadrados_medios_entero.py).
     - No se usa `input()` ni interfaces gráficas, para compatibilidad
       con servidores web.
 =========================================
 """
+
+from cuadrados_medios_entero import detectar_ciclo, siguiente
+
 """
     Genera una secuencia de números pseudoaleatorios
     con el método de los cuadrados medios.
@@ -27,32 +33,39 @@ Descripción:
         semilla (int): valor inicial X0
         d (int): cantidad de dígitos en la semilla
         n (int): cantidad de números a generar
+        detener_en_ciclo (bool): si es True, deja de generar cuando la
+            secuencia empieza a repetir valores (o cae en cero)
 
     Retorna:
         list: lista de valores pseudoaleatorios normalizados
     """
 
-def cuadrados_medios(semilla, d, n):
+def cuadrados_medios(semilla, d, n, detener_en_ciclo=False):
     
     x = semilla
     resultados = []
 
     print("Método de los Cuadrados Medios")
     print(f"Semilla inicial: X0 = {semilla}")
+
+    if detener_en_ciclo and 0 <= semilla < 10 ** d:
+        ciclo = detectar_ciclo(semilla, d)
+        if ciclo["colapso"] - 1 < n:
+            n = ciclo["colapso"] - 1
+            motivo = "cae en 0" if ciclo["cero"] else f"entra en un ciclo de periodo {ciclo['periodo']}"
+            print(f"La secuencia {motivo}: se generan solo {n} valores distintos")
+
     print("Yi\t\tXi\t\tri")
 
     for i in range(1, n + 1):
         y = x * x
-        y_str = str(y).zfill(2 * d)  # Asegura longitud 2d
-
-        inicio = (len(y_str) - d) // 2
-        x_str = y_str[inicio:inicio + d]
-        x = int(x_str)
+        # Aritmética entera: mismos dígitos centrales que str(y).zfill(2d)
+        x = siguiente(x, d)
 
         r = x / (10 ** d)
         resultados.append(r)
 
-        print(f"Y{i-1} = {y_str}  X{i} = {x_str}  r{i} = {r:.4f}")
+        print(f"Y{i-1} = {y:0{2 * d}d}  X{i} = {x:0{d}d}  r{i} = {r:.4f}")
 
     print("\nSecuencia Generada:")
     print(resultados)
@@ -60,8 +73,9 @@ def cuadrados_medios(semilla, d, n):
 
 
 # ===== Ejecución (valores fijos, sin input) =====
-semilla = 5735
-d = 4
-n = 5
+if __name__ == "__main__":
+    semilla = 5735
+    d = 4
+    n = 5
 
-cuadrados_medios(semilla, d, n)
+    cuadrados_medios(semilla, d, n)
@@ -0,0 +1,247 @@
+"""
+=========================================
+ALGORITMO : Archivos de muestras (.npy, binario float64 y texto)
+-----------------------------------------
+Propósito:
+    Guardar y leer muestras grandes sin pasar por una línea de texto por
+    número: en binario ocupan 8 bytes por valor y se abren con memmap
+    (sin copiar ni cargar el archivo completo en memoria).
+
+Descripción:
+    - Formatos, según la extensión:
+          .npy                 formato de numpy (encabezado + float64)
+          .f64 / .bin / .raw   float64 little-endian sin encabezado
+          otra (.txt, ...)     texto, un número por línea
+    - `EscritorMuestra` escribe bloque a bloque (método `agregar`, como
+      los consumidores de flujos.py); en .npy el encabezado se completa
+      con la cantidad final al cerrar.
+    - `guardar_muestra(ruta, datos)` guarda un arreglo o un iterable de
+      bloques.
+    - `leer_muestra(ruta)` detecta el formato (por el encabezado de numpy
+      o la extensión) y retorna un memmap de solo lectura para los
+      binarios; el texto se lee de una vez con numpy (se ignoran las
+      líneas no numéricas, como un título).
+    - `leer_bloques(ruta)` recorre la muestra en arreglos de tamaño
+      acotado (tramos del memmap o partes del texto), para procesar
+      archivos más grandes que la memoria.
+    - `convertir(origen, destino)` pasa un archivo de texto a binario
+      leyendo por partes.
+=========================================
+"""
+
+# determinista: no
+
+import os
+
+import numpy as np
+
+MAGIA_NPY = b"\x93NUMPY"
+EXTENSIONES_CRUDAS = (".f64", ".bin", ".raw")
+TIPO = np.dtype("<f8")
+
+# Encabezado .npy de largo fijo (múltiplo de 64) para reescribir la cantidad al cerrar
+_LARGO_ENCABEZADO = 128
+# Bytes por lectura al procesar archivos por partes
+_BYTES_POR_BLOQUE = 1 << 24
+# Valores por cadena al pasar un bloque a texto (acota la tupla y la cadena de formato)
+_VALORES_POR_TEXTO = 1 << 16
+
+
+def _formato_por_extension(ruta):
+    extension = os.path.splitext(ruta)[1].lower()
+    if extension == ".npy":
+        return "npy"
+    if extension in EXTENSIONES_CRUDAS:
+        return "crudo"
+    return "texto"
+
+
+def formato_de(ruta):
+    """'npy', 'crudo' o 'texto': por la firma de numpy si el archivo existe, si no por la extensión."""
+    if os.path.exists(ruta):
+        with open(ruta, "rb") as f:
+            if f.read(len(MAGIA_NPY)) == MAGIA_NPY:
+                return "npy"
+    return _formato_por_extension(ruta)
+
+
+def _encabezado_npy(cantidad):
+    """Encabezado .npy versión 1.0 de _LARGO_ENCABEZADO bytes para `cantidad` float64."""
+    texto = repr({"descr": TIPO.str, "fortran_order": False, "shape": (cantidad,)})
+    relleno = _LARGO_ENCABEZADO - len(MAGIA_NPY) - 4 - len(texto) - 1
+    return (MAGIA_NPY + b"\x01\x00" + (_LARGO_ENCABEZADO - len(MAGIA_NPY) - 4).to_bytes(2, "little")
+            + texto.encode("latin1") + b" " * relleno + b"\n")
+
+
+def textos_de_bloque(bloque, decimales=None):
+    """
+    Líneas de texto de un bloque en cadenas de a lo más _VALORES_POR_TEXTO
+    números, cada una armada de una vez (sin un write por número). Sin
+    `decimales`, cada número se escribe como str(float).
+    """
+    formato = "%r\n" if decimales is None else f"%.{decimales}f\n"
+    bloque = np.asarray(bloque, dtype=float).reshape(-1)
+    for inicio in range(0, len(bloque), _VALORES_POR_TEXTO):
+        valores = bloque[inicio:inicio + _VALORES_POR_TEXTO].tolist()
+        yield (formato * len(valores)) % tuple(valores)
+
+
+def texto_de_bloque(bloque, decimales=None):
+    """Todas las líneas de texto de un bloque en una sola cadena (ver textos_de_bloque)."""
+    return "".join(textos_de_bloque(bloque, decimales))
+
+
+class EscritorMuestra:
+    """
+    Escribe una muestra bloque a bloque en `ruta` (formato según la
+    extensión). Se usa como contexto:
+
+        with EscritorMuestra("datos.npy") as escritor:
+            for bloque in generador.bloques(n):
+                escritor.agregar(bloque)
+
+    Parámetros:
+        ruta (str): archivo de salida.
+        decimales (int, opcional): solo texto; por defecto str(float).
+        encabezado (str, opcional): solo texto; primera línea del archivo.
+    """
+
+    def __init__(self, ruta, decimales=None, encabezado=None):
+        self.ruta = ruta
+        self.formato = _formato_por_extension(ruta)
+        self.decimales = decimales
+        self.cantidad = 0
+        self._archivo = open(ruta, "wb")
+        if self.formato == "npy":
+            self._archivo.write(_encabezado_npy(0))
+        elif encabezado:
+            self._archivo.write((encabezado + "\n").encode("utf-8"))
+
+    def agregar(self, bloque):
+        if self.formato == "texto":
+            for texto in textos_de_bloque(bloque, self.decimales):
+                self._archivo.write(texto.encode("utf-8"))
+        else:
+            self._archivo.write(np.ascontiguousarray(bloque, dtype=TIPO).tobytes())
+        self.cantidad += len(bloque)
+
+    def cerrar(self):
+        if self._archivo.closed:
+            return
+        if self.formato == "npy":
+            self._archivo.seek(0)
+            self._archivo.write(_encabezado_npy(self.cantidad))
+        self._archivo.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excepcion):
+        self.cerrar()
+
+
+def guardar_muestra(ruta, datos, decimales=None, encabezado=None):
+    """
+    Guarda `datos` (arreglo, lista o iterable de bloques) en `ruta`.
+    Retorna la cantidad de valores escritos.
+    """
+    if isinstance(datos, (np.ndarray, list, tuple)):
+        datos = [datos]
+    with EscritorMuestra(ruta, decimales, encabezado) as escritor:
+        for bloque in datos:
+            escritor.agregar(bloque)
+    return escritor.cantidad
+
+
+def _numeros(texto):
+    try:
+        return np.array(texto.split(), dtype=float)
+    except ValueError:
+        # Hay líneas de texto (títulos): se filtran una por una
+        numeros = []
+        for linea in texto.splitlines():
+            try:
+                numeros.extend(float(x) for x in linea.split())
+            except ValueError:
+                continue
+        return np.array(numeros, dtype=float)
+
+
+def _bloques_texto(archivo, bytes_por_bloque=_BYTES_POR_BLOQUE):
+    """Arreglos con los números de un archivo de texto abierto en binario (ignora líneas no numéricas)."""
+    resto = b""
+    while True:
+        leido = archivo.read(bytes_por_bloque)
+        if not leido:
+            break
+        texto = resto + leido
+        corte = texto.rfind(b"\n") + 1
+        texto, resto = texto[:corte], texto[corte:]
+        if texto:
+            yield _numeros(texto)
+    if resto:
+        yield _numeros(resto)
+
+
+def leer_muestra(ruta, mmap=True):
+    """
+    Lee una muestra detectando el formato. Los binarios se abren como
+    memmap de solo lectura (sin copiar) salvo con mmap=False; el texto
+    se carga en un arreglo float64.
+    """
+    formato = formato_de(ruta)
+    if formato == "npy":
+        return np.load(ruta, mmap_mode="r" if mmap else None)
+    if formato == "crudo":
+        if not mmap:
+            return np.fromfile(ruta, dtype=TIPO)
+        if os.path.getsize(ruta) == 0:
+            return np.empty(0, dtype=TIPO)
+        return np.memmap(ruta, dtype=TIPO, mode="r")
+    with open(ruta, "rb") as f:
+        partes = list(_bloques_texto(f))
+    return np.concatenate(partes) if partes else np.empty(0)
+
+
+def leer_bloques(ruta, valores_por_bloque=_BYTES_POR_BLOQUE // TIPO.itemsize):
+    """
+    Arreglos sucesivos con los valores de `ruta`: tramos del memmap para
+    los binarios (sin copiar) y partes leídas del archivo para el texto.
+    """
+    if formato_de(ruta) != "texto":
+        datos = leer_muestra(ruta)
+        for i in range(0, len(datos), valores_por_bloque):
+            yield datos[i:i + valores_por_bloque]
+        return
+    with open(ruta, "rb") as f:
+        yield from _bloques_texto(f, valores_por_bloque * TIPO.itemsize)
+
+
+def convertir(origen, destino):
+    """
+    Convierte `origen` (cualquier formato) a `destino` (formato según la
+    extensión) leyendo por partes. Retorna la cantidad de valores.
+    """
+    return guardar_muestra(destino, leer_bloques(origen))
+
+
+# ===== Ejecución (valores fijos, sin input) =====
+if __name__ == "__main__":
+    import tempfile
+    import time
+
+    from generadores import GeneradorNumpy
+
+    n = 10**6
+    datos = GeneradorNumpy(12345).uniformes(n)
+    with tempfile.TemporaryDirectory() as carpeta:
+        for nombre in ("muestra.npy", "muestra.f64", "muestra.txt"):
+            ruta = os.path.join(carpeta, nombre)
+            inicio = time.perf_counter()
+            guardar_muestra(ruta, datos)
+            escritura = time.perf_counter() - inicio
+            inicio = time.perf_counter()
+            leidos = leer_muestra(ruta)
+            lectura = time.perf_counter() - inicio
+            print(f"{nombre:<12} {os.path.getsize(ruta) / 1e6:6.1f} MB  escritura {escritura:.3f} s  "
+                  f"lectura {lectura:.3f} s  ({type(leidos).__name__}, iguales: {np.array_equal(leidos, datos)})")
@@ -0,0 +1,398 @@
+"""
+=========================================
+ALGORITMO : Batería de pruebas de aleatoriedad en una sola pasada
+-----------------------------------------
+Propósito:
+    Evaluar un generador de números U(0,1) con varias pruebas a la vez
+    (frecuencias χ², corridas, series y Kolmogorov–Smirnov) generando la
+    secuencia una sola vez: con 10^8 valores se paga una sola pasada de
+    generación y la memoria no depende de n.
+
+Descripción:
+    - El generador (cualquiera de generadores.py) entrega los valores por
+      bloques; cada bloque se pasa a los acumuladores de todas las pruebas:
+          frecuencias   flujos.HistogramaEnLinea              (χ² de clases)
+          corridas      prueba_corridas_aleat.AcumuladorCorridas
+          series        Prueba_series.ConteoSeries            (pares por defecto)
+          ks            Prueba_kolmogorov_smirnov.KSEnLinea   (contra U(0,1))
+    - Con `procesos=True` cada prueba corre en su propio proceso: los
+      bloques se escriben una vez en memoria compartida (varias ranuras,
+      para generar el siguiente mientras se procesa el actual) y cada
+      proceso los lee sin copiarlos.
+    - El reporte reúne, por prueba, el estadístico, el valor-p, si se
+      aprueba (p > alpha) y el tiempo de procesamiento; además el tiempo
+      de generación y el total.
+    - `Monitor` mantiene las mismas pruebas abiertas sobre un generador
+      que sigue produciendo: se actualiza valor a valor en O(1) y da el
+      reporte actual cuando se pida.
+=========================================
+"""
+
+# determinista: no
+
+import multiprocessing
+import queue
+import sys
+import time
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from flujos import HistogramaEnLinea
+from generadores import BLOQUE, obtener_generador
+from prueba_corridas_aleat import AcumuladorCorridas
+from Prueba_kolmogorov_smirnov import KSEnLinea
+from Prueba_series import ConteoSeries
+
+PRUEBAS = ("frecuencias", "corridas", "series", "ks")
+# Bloques en memoria compartida a la vez con procesos=True
+RANURAS = 3
+# Celdas máximas de la prueba de series con m por defecto (2^20 enteros: 8 MB)
+CELDAS_SERIES_MAX = 1 << 20
+
+
+# ============================================================
+# Pruebas: creación del acumulador y lectura del resultado
+# ============================================================
+
+def clases_frecuencias(n):
+    """Clases del χ² de frecuencias: 100, o menos para que haya al menos 5 esperados por clase."""
+    return max(2, min(100, n // 5))
+
+
+def m_series(n, k=2):
+    """Intervalos por eje de la prueba de series: al menos 5 esperados por celda y a lo más CELDAS_SERIES_MAX celdas."""
+    return max(2, min(int((n / 5) ** (1 / k)), int(round(CELDAS_SERIES_MAX ** (1 / k)))))
+
+
+def crear_prueba(nombre, n, k_series=2):
+    """Acumulador de la prueba `nombre` para una secuencia de n valores."""
+    if nombre == "frecuencias":
+        return HistogramaEnLinea.uniforme(clases_frecuencias(n))
+    if nombre == "corridas":
+        return AcumuladorCorridas()
+    if nombre == "series":
+        return ConteoSeries(m_series(n, k_series), k_series)
+    if nombre == "ks":
+        return KSEnLinea()
+    raise ValueError(f"Prueba desconocida: {nombre}. Opciones: {', '.join(PRUEBAS)}.")
+
+
+def resultado_prueba(nombre, acumulador, alpha):
+    """(estadístico, valor-p, detalle) del acumulador de la prueba `nombre`."""
+    if nombre == "frecuencias":
+        detalle = acumulador.chi_cuadrado(alpha=alpha)
+        return detalle["chi2_calc"], detalle["p_valor"], detalle
+    if nombre == "corridas":
+        detalle = acumulador.resultado(alpha)
+        return detalle["Z"], detalle["p_valor"], detalle
+    if nombre == "series":
+        detalle = acumulador.resultado(alpha, mostrar=False)
+        return detalle["chi2_calc"], detalle["p_valor"], detalle
+    detalle = acumulador.resultado(alpha)
+    return detalle["D"], detalle["p_valor"], detalle
+
+
+# ============================================================
+# Ejecución en un proceso o con un proceso por prueba
+# ============================================================
+
+def _en_proceso(bloques, nombres, n, alpha, k_series):
+    acumuladores = {nombre: crear_prueba(nombre, n, k_series) for nombre in nombres}
+    tiempos = dict.fromkeys(nombres, 0.0)
+    generacion = 0.0
+    inicio = time.perf_counter()
+    for bloque in bloques:
+        generacion += time.perf_counter() - inicio
+        for nombre, acumulador in acumuladores.items():
+            inicio = time.perf_counter()
+            acumulador.agregar(bloque)
+            tiempos[nombre] += time.perf_counter() - inicio
+        inicio = time.perf_counter()
+    generacion += time.perf_counter() - inicio
+
+    resultados = {}
+    for nombre, acumulador in acumuladores.items():
+        inicio = time.perf_counter()
+        resultados[nombre] = resultado_prueba(nombre, acumulador, alpha)
+        tiempos[nombre] += time.perf_counter() - inicio
+    return resultados, tiempos, generacion
+
+
+def _trabajador(nombre, n, alpha, k_series, memoria, tamano, entrada, listos, salida):
+    """Proceso de una prueba: lee bloques (ranura, largo) de la memoria compartida hasta recibir None."""
+    compartida = shared_memory.SharedMemory(name=memoria)
+    ranuras = np.ndarray((RANURAS, tamano), dtype=np.float64, buffer=compartida.buf)
+    error = None
+    try:
+        acumulador = crear_prueba(nombre, n, k_series)
+    except Exception as e:
+        error = e
+    tiempo = 0.0
+    # Ante un error se siguen liberando las ranuras para no detener a los demás
+    while (mensaje := entrada.get()) is not None:
+        ranura, largo = mensaje
+        if error is None:
+            inicio = time.perf_counter()
+            try:
+                acumulador.agregar(ranuras[ranura, :largo])
+            except Exception as e:
+                error = e
+            tiempo += time.perf_counter() - inicio
+        listos.put(ranura)
+    ranuras = None
+    compartida.close()
+    if error is None:
+        inicio = time.perf_counter()
+        try:
+            resultado = resultado_prueba(nombre, acumulador, alpha)
+        except Exception as e:
+            error = e
+        tiempo += time.perf_counter() - inicio
+    salida.put((nombre, resultado if error is None else error, tiempo))
+
+
+def _esperar(cola, procesos):
+    """Siguiente mensaje de `cola`; RuntimeError si algún proceso terminó sin responder."""
+    while True:
+        try:
+            return cola.get(timeout=1)
+        except queue.Empty:
+            caidos = [p for p in procesos if p.exitcode not in (None, 0)]
+            if caidos:
+                raise RuntimeError(f"Un proceso de la batería terminó con código {caidos[0].exitcode}.")
+
+
+def _con_procesos(bloques, nombres, n, alpha, k_series, tamano):
+    contexto = multiprocessing.get_context("spawn")
+    compartida = shared_memory.SharedMemory(create=True, size=RANURAS * tamano * 8)
+    ranuras = np.ndarray((RANURAS, tamano), dtype=np.float64, buffer=compartida.buf)
+    procesos = []
+    try:
+        listos, salida = contexto.Queue(), contexto.Queue()
+        entradas = {}
+        for nombre in nombres:
+            entradas[nombre] = contexto.Queue()
+            proceso = contexto.Process(target=_trabajador, args=(
+                nombre, n, alpha, k_series, compartida.name, tamano, entradas[nombre], listos, salida))
+            proceso.start()
+            procesos.append(proceso)
+
+        # Una ranura se reutiliza cuando todas las pruebas terminaron con ella
+        pendientes = [0] * RANURAS
+        generacion = 0.0
+        inicio = time.perf_counter()
+        for i, bloque in enumerate(bloques):
+            generacion += time.perf_counter() - inicio
+            ranura = i % RANURAS
+            while pendientes[ranura]:
+                pendientes[_esperar(listos, procesos)] -= 1
+            ranuras[ranura, :len(bloque)] = bloque
+            pendientes[ranura] = len(nombres)
+            for entrada in entradas.values():
+                entrada.put((ranura, len(bloque)))
+            inicio = time.perf_counter()
+        generacion += time.perf_counter() - inicio
+        for entrada in entradas.values():
+            entrada.put(None)
+
+        resultados, tiempos = {}, {}
+        for _ in nombres:
+            nombre, resultado, tiempo = _esperar(salida, procesos)
+            if isinstance(resultado, Exception):
+                raise resultado
+            resultados[nombre], tiempos[nombre] = resultado, tiempo
+        # Mismo orden que las pruebas pedidas, no el de llegada
+        return {nombre: resultados[nombre] for nombre in nombres}, tiempos, generacion
+    finally:
+        for proceso in procesos:
+            proceso.join(timeout=5)
+            if proceso.is_alive():
+                proceso.terminate()
+        ranuras = None
+        compartida.close()
+        compartida.unlink()
+
+
+def _procesos_disponibles():
+    # Los procesos daemon (p. ej. los trabajadores del servidor) no pueden
+    # crear hijos, y un módulo cargado sin importar no se puede enviar a otro proceso
+    if multiprocessing.current_process().daemon:
+        return False
+    modulo = sys.modules.get(__name__)
+    return modulo is not None and getattr(modulo, "_trabajador", None) is _trabajador
+
+
+# ============================================================
+# Batería
+# ============================================================
+
+def _nombres_pruebas(pruebas):
+    """Lista de pruebas (acepta texto separado por comas) sin repetidos; ValueError si alguna no existe."""
+    if isinstance(pruebas, str):
+        pruebas = [p.strip() for p in pruebas.split(",") if p.strip()]
+    nombres = list(dict.fromkeys(pruebas))
+    if not nombres:
+        raise ValueError("Indique al menos una prueba.")
+    for nombre in nombres:
+        if nombre not in PRUEBAS:
+            raise ValueError(f"Prueba desconocida: {nombre}. Opciones: {', '.join(PRUEBAS)}.")
+    return nombres
+
+
+def _reporte_pruebas(resultados, tiempos, alpha):
+    """({nombre: estadistico, p_valor, aprobada, segundos, detalle}, cantidad aprobada)."""
+    reporte = {}
+    for nombre, (estadistico, p_valor, detalle) in resultados.items():
+        reporte[nombre] = {
+            "estadistico": estadistico,
+            "p_valor": p_valor,
+            "aprobada": p_valor is not None and p_valor > alpha,
+            "segundos": tiempos[nombre],
+            "detalle": detalle,
+        }
+    return reporte, sum(r["aprobada"] for r in reporte.values())
+
+
+def bateria(n=1_000_000, generador="numpy", semilla=None, alpha=0.05, pruebas=PRUEBAS,
+            procesos=False, k_series=2, tamano=BLOQUE, mostrar=True):
+    """
+    Aplica las pruebas a n uniformes de `generador` (nombre, objeto o numpy
+    Generator; ver generadores.obtener_generador) en una sola pasada.
+
+    Parámetros:
+        pruebas : nombres de PRUEBAS (lista o texto separado por comas).
+        procesos : True para un proceso por prueba (si el entorno lo permite).
+        k_series : largo de las tuplas de la prueba de series.
+        tamano : valores por bloque.
+
+    Retorna:
+        dict : generador, n, alpha, pruebas {nombre: estadistico, p_valor,
+               aprobada, segundos, detalle}, aprobadas, total, segundos de
+               generación y totales, y un mensaje de resumen.
+    """
+    nombres = _nombres_pruebas(pruebas)
+    if n < 3:
+        raise ValueError("La batería requiere al menos 3 números.")
+
+    fuente = obtener_generador(generador, semilla)
+    bloques = fuente.bloques(n, tamano)
+    inicio = time.perf_counter()
+    paralelo = bool(procesos) and len(nombres) > 1 and _procesos_disponibles()
+    if paralelo:
+        resultados, tiempos, generacion = _con_procesos(bloques, nombres, n, alpha, k_series, tamano)
+    else:
+        resultados, tiempos, generacion = _en_proceso(bloques, nombres, n, alpha, k_series)
+    total = time.perf_counter() - inicio
+
+    reporte_pruebas, aprobadas = _reporte_pruebas(resultados, tiempos, alpha)
+    nombre_generador = generador if isinstance(generador, str) else getattr(fuente, "nombre", str(fuente))
+    reporte = {
+        "generador": nombre_generador,
+        "n": n,
+        "alpha": alpha,
+        "pruebas": reporte_pruebas,
+        "aprobadas": aprobadas,
+        "total": len(nombres),
+        "procesos": paralelo,
+        "segundos_generacion": generacion,
+        "segundos_total": total,
+        "mensaje": (f"Generador {nombre_generador} (n = {n}): {aprobadas}/{len(nombres)} pruebas "
+                    f"aprobadas con α = {alpha} en {total:.2f} s."),
+    }
+    if mostrar:
+        mostrar_reporte(reporte)
+    return reporte
+
+
+class Monitor:
+    """
+    Pruebas de la batería sobre un generador que sigue produciendo
+    valores: cada prueba guarda solo su estado compacto (último valor y
+    corrida en curso, matriz de pares, conteos por clase) y se actualiza
+    en O(1) por valor con `agregar_valor`, o por bloques con `agregar`.
+    `reporte()` da los estadísticos actuales en cualquier momento, sin
+    volver a probar la secuencia desde el principio.
+
+    Parámetros:
+        pruebas : nombres de PRUEBAS (lista o texto separado por comas).
+        n_previsto : cantidad de valores esperada; fija las clases de
+            frecuencias y las celdas de la prueba de series.
+        k_series : largo de las tuplas de la prueba de series.
+    """
+
+    def __init__(self, pruebas=PRUEBAS, n_previsto=1_000_000, k_series=2):
+        self.acumuladores = {nombre: crear_prueba(nombre, n_previsto, k_series)
+                             for nombre in _nombres_pruebas(pruebas)}
+        self.tiempos = dict.fromkeys(self.acumuladores, 0.0)
+        self.n = 0
+
+    def agregar_valor(self, x):
+        for nombre, acumulador in self.acumuladores.items():
+            inicio = time.perf_counter()
+            acumulador.agregar_valor(x)
+            self.tiempos[nombre] += time.perf_counter() - inicio
+        self.n += 1
+
+    def agregar(self, bloque):
+        for nombre, acumulador in self.acumuladores.items():
+            inicio = time.perf_counter()
+            acumulador.agregar(bloque)
+            self.tiempos[nombre] += time.perf_counter() - inicio
+        self.n += len(bloque)
+
+    def reporte(self, alpha=0.05):
+        """Estadísticos con los valores recibidos hasta ahora (una prueba sin datos suficientes no se aprueba)."""
+        resultados = {}
+        for nombre, acumulador in self.acumuladores.items():
+            try:
+                resultados[nombre] = resultado_prueba(nombre, acumulador, alpha)
+            except ValueError as e:
+                resultados[nombre] = (float("nan"), None, {"error": str(e)})
+        pruebas, aprobadas = _reporte_pruebas(resultados, self.tiempos, alpha)
+        return {
+            "n": self.n,
+            "alpha": alpha,
+            "pruebas": pruebas,
+            "aprobadas": aprobadas,
+            "total": len(pruebas),
+            "mensaje": f"Monitor (n = {self.n}): {aprobadas}/{len(pruebas)} pruebas aprobadas con α = {alpha}.",
+        }
+
+
+def mostrar_reporte(reporte):
+    """Imprime la tabla de la batería."""
+    print(f"\n=== BATERÍA DE PRUEBAS — {reporte.get('generador', 'monitor')} "
+          f"(n = {reporte['n']}, α = {reporte['alpha']}) ===")
+    print(f"{'Prueba':<13} {'Estadístico':>14} {'Valor-p':>9} {'Tiempo (s)':>11}  Resultado")
+    print("-" * 62)
+    for nombre, r in reporte["pruebas"].items():
+        p_valor = f"{r['p_valor']:.4f}" if r["p_valor"] is not None else "-"
+        print(f"{nombre:<13} {r['estadistico']:>14.6g} {p_valor:>9} {r['segundos']:>11.3f}  "
+              f"{'✅ Aprueba' if r['aprobada'] else '❌ Falla'}")
+    print("-" * 62)
+    if "segundos_total" in reporte:
+        print(f"Generación: {reporte['segundos_generacion']:.3f} s   Total: {reporte['segundos_total']:.3f} s"
+              f"{'   (un proceso por prueba)' if reporte['procesos'] else ''}")
+    print(reporte["mensaje"])
+
+
+# ===== Ejecución (valores fijos, sin input) =====
+if __name__ == "__main__":
+    for nombre in ("numpy", "lcg", "minstd", "cuadrados_medios"):
+        bateria(10**6, nombre, semilla=5735)
+
+    # 10^7 valores del LCG con un proceso por prueba
+    bateria(10**7, "lcg", semilla=12345, procesos=True)
+
+    # Monitoreo valor a valor: el estado de cada prueba se consulta mientras llegan los números
+    for nombre in ("lcg", "cuadrados_medios"):
+        fuente = obtener_generador(nombre, semilla=5735)
+        monitor = Monitor(n_previsto=30000)
+        print(f"\nMonitor de {nombre} (valores-p: {', '.join(monitor.acumuladores)})")
+        for i, x in enumerate(fuente.uniformes(30000), start=1):
+            monitor.agregar_valor(x)
+            if i % 10000 == 0:
+                estado = monitor.reporte()
+                p_valores = "  ".join(f"{r['p_valor']:.4f}" for r in estado["pruebas"].values())
+                print(f"n = {i:>6}  {p_valores}  ({estado['aprobadas']}/{estado['total']})")
@@ -0,0 +1,304 @@
+"""
+=========================================
+ALGORITMO : Cuadrados Medios en aritmética entera + detección de ciclos
+-----------------------------------------
+Propósito:
+    Calcular el método de los cuadrados medios sin convertir a texto en
+    cada paso, para una o muchas semillas a la vez, y saber de antemano
+    cuándo la secuencia cae en un ciclo (o en cero) para dejar de generar.
+
+Descripción:
+    - Con X de d dígitos, Y = X² se completa a 2d dígitos y se toman los
+      d centrales, que en enteros es:
+          Xₙ₊₁ = (Y // 10^(d - d//2)) mod 10^d
+      (idéntico al corte de la cadena `str(Y).zfill(2d)`).
+    - `secuencias_lote` avanza muchas semillas a la vez con numpy
+      (int64 hasta d = 9; con más dígitos, enteros de Python).
+    - `detectar_ciclos` aplica el algoritmo de Brent a todas las semillas
+      en paralelo y reporta la cola (pasos antes de entrar al ciclo), el
+      periodo, el paso en que la secuencia colapsa (primer valor generado
+      que repite uno anterior) y si el ciclo es el cero.
+    - Para d <= 6 el espacio de estados (10^d) se precalcula completo:
+      `tabla_transiciones(d)` (cada paso es una consulta al arreglo) e
+      `indice_semillas(d)` (cola, periodo y entrada al ciclo de todas las
+      semillas). Ambos se guardan como `.npy` en `codigos/.cache/` y se
+      abren con memmap; `calidad_semilla` responde al instante.
+    - `bloques(semilla, d, n)` entrega la secuencia en arreglos de tamaño
+      fijo; con el índice solo calcula hasta el colapso y repite el ciclo.
+=========================================
+"""
+
+import os
+import tempfile
+
+import numpy as np
+
+# Mayor cantidad de dígitos con tabla e índice precalculados (10^6 estados)
+TABLA_MAX_D = 6
+CARPETA_CACHE = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache")
+
+
+def siguiente(x, d):
+    """Un paso del método para una semilla entera (de cualquier cantidad de dígitos)."""
+    y = x * x
+    if x < 10 ** d:
+        return (y // 10 ** (d - d // 2)) % 10 ** d
+    # Semilla con más de d dígitos: Y tiene más de 2d dígitos
+    largo = len(str(y))
+    inicio = (largo - d) // 2
+    return (y // 10 ** (largo - inicio - d)) % 10 ** d
+
+
+def secuencia(semilla, d, n):
+    """Lista con X₁..Xₙ (enteros de d dígitos)."""
+    x = semilla
+    valores = []
+    for _ in range(n):
+        x = siguiente(x, d)
+        valores.append(x)
+    return valores
+
+
+def _como_arreglo(semillas, d):
+    tipo = np.int64 if d <= 9 else object
+    x = np.array(semillas, dtype=tipo).reshape(-1)
+    if len(x) and (x.min() < 0 or x.max() >= 10 ** d):
+        raise ValueError(f"Las semillas deben estar entre 0 y 10^{d} - 1.")
+    return x
+
+
+def _paso(x, d):
+    return (x * x // 10 ** (d - d // 2)) % 10 ** d
+
+
+def secuencias_lote(semillas, d, n, tabla=None):
+    """
+    Arreglo (semillas × n) con X₁..Xₙ de cada semilla, calculado por
+    columnas. Con `tabla` (ver tabla_transiciones) cada paso es una consulta.
+    """
+    x = _como_arreglo(semillas, d)
+    X = np.empty((len(x), n), dtype=x.dtype)
+    for i in range(n):
+        x = tabla[x] if tabla is not None else _paso(x, d)
+        X[:, i] = x
+    return X
+
+
+def detectar_ciclos(semillas, d):
+    """
+    Algoritmo de Brent para cada semilla. Retorna un dict de arreglos:
+        cola    : μ, índice del primer valor del ciclo (X_μ)
+        periodo : λ, largo del ciclo
+        colapso : primer paso n cuyo valor Xₙ ya se generó antes entre
+                  X₁..Xₙ₋₁ (max(μ, 1) + λ); los colapso - 1 valores
+                  anteriores son todos distintos
+        cero    : True si el ciclo es el punto fijo 0
+        entrada : X_μ, primer valor del ciclo
+    """
+    x0 = _como_arreglo(semillas, d)
+    k = len(x0)
+
+    # Fase 1: periodo (la liebre avanza; la tortuga salta a potencias de 2)
+    potencia = np.ones(k, dtype=np.int64)
+    periodo = np.ones(k, dtype=np.int64)
+    tortuga = x0.copy()
+    liebre = _paso(x0, d)
+    activos = tortuga != liebre
+    while activos.any():
+        reinicio = activos & (potencia == periodo)
+        tortuga[reinicio] = liebre[reinicio]
+        potencia[reinicio] *= 2
+        periodo[reinicio] = 0
+        liebre = np.where(activos, _paso(liebre, d), liebre)
+        periodo[activos] += 1
+        activos &= tortuga != liebre
+
+    # Fase 2: la liebre parte λ pasos adelante; se encuentran en X_μ
+    liebre = x0.copy()
+    for i in range(int(periodo.max()) if k else 0):
+        liebre = np.where(i < periodo, _paso(liebre, d), liebre)
+    tortuga = x0.copy()
+    cola = np.zeros(k, dtype=np.int64)
+    activos = tortuga != liebre
+    while activos.any():
+        tortuga = np.where(activos, _paso(tortuga, d), tortuga)
+        liebre = np.where(activos, _paso(liebre, d), liebre)
+        cola[activos] += 1
+        activos &= tortuga != liebre
+
+    return {
+        "cola": cola,
+        "periodo": periodo,
+        "colapso": np.maximum(cola, 1) + periodo,
+        "cero": (tortuga == 0) & (periodo == 1),
+        "entrada": tortuga,
+    }
+
+
+def detectar_ciclo(semilla, d):
+    """`detectar_ciclos` para una sola semilla; retorna un dict de enteros."""
+    resultado = detectar_ciclos([semilla], d)
+    return {clave: int(valor[0]) if clave != "cero" else bool(valor[0]) for clave, valor in resultado.items()}
+
+
+def _guardar_npy(ruta, arreglo):
+    """Escritura atómica: otro proceso nunca ve un archivo a medias."""
+    os.makedirs(os.path.dirname(ruta), exist_ok=True)
+    with tempfile.NamedTemporaryFile(dir=os.path.dirname(ruta), suffix=".tmp", delete=False) as f:
+        np.save(f, arreglo)
+    os.chmod(f.name, 0o644)
+    os.replace(f.name, ruta)
+
+
+def _cargar_o_construir(ruta, construir):
+    if not os.path.exists(ruta):
+        _guardar_npy(ruta, construir())
+    return np.load(ruta, mmap_mode="r")
+
+
+def _validar_d(d):
+    if not 1 <= d <= TABLA_MAX_D:
+        raise ValueError(f"La tabla precalculada requiere 1 <= d <= {TABLA_MAX_D}.")
+
+
+def tabla_transiciones(d, carpeta=CARPETA_CACHE):
+    """Arreglo t con t[x] = siguiente(x, d) para los 10^d estados (memmap)."""
+    _validar_d(d)
+    return _cargar_o_construir(
+        os.path.join(carpeta, f"cuadrados_medios_d{d}_tabla.npy"),
+        lambda: _paso(np.arange(10 ** d, dtype=np.int64), d).astype(np.min_scalar_type(10 ** d - 1)),
+    )
+
+
+def _construir_indice(t):
+    """
+    Cola, periodo y entrada al ciclo de cada estado de la tabla t, con
+    saltos por duplicación (f, f², f⁴, ...) en vez de recorrer cada semilla.
+    """
+    n = len(t)
+    saltos = [np.asarray(t, dtype=np.int64)]
+    while 1 << len(saltos) <= n:
+        saltos.append(saltos[-1][saltos[-1]])
+
+    # Tras n pasos todo estado está en su ciclo; la imagen de f^(2^k) cubre todos los ciclos
+    en_ciclo = np.zeros(n, dtype=bool)
+    en_ciclo[saltos[-1][saltos[-1]]] = True
+
+    # Cola: mayor salto que todavía no llega al ciclo, de mayor a menor
+    actual = np.arange(n, dtype=np.int64)
+    cola = np.zeros(n, dtype=np.int64)
+    fuera = ~en_ciclo
+    for k in range(len(saltos) - 1, -1, -1):
+        siguiente_salto = saltos[k][actual]
+        avanza = fuera & ~en_ciclo[siguiente_salto]
+        actual[avanza] = siguiente_salto[avanza]
+        cola[avanza] += 1 << k
+    actual[fuera] = saltos[0][actual[fuera]]
+    cola[fuera] += 1
+
+    # Periodo: se recorre cada ciclo desde sus propios estados
+    periodo = np.zeros(n, dtype=np.int64)
+    estados = np.flatnonzero(en_ciclo)
+    x = saltos[0][estados]
+    pasos = 1
+    pendientes = np.ones(len(estados), dtype=bool)
+    while pendientes.any():
+        cerrados = pendientes & (x == estados)
+        periodo[estados[cerrados]] = pasos
+        pendientes &= ~cerrados
+        x = saltos[0][x]
+        pasos += 1
+    periodo = periodo[actual]
+
+    columnas = np.stack([cola, periodo, actual], axis=1)
+    return columnas.astype(np.min_scalar_type(int(columnas.max())))
+
+
+def indice_semillas(d, carpeta=CARPETA_CACHE):
+    """
+    Arreglo (10^d × 3) memmap: fila x = (cola, periodo, entrada al ciclo)
+    de la semilla x.
+    """
+    _validar_d(d)
+    return _cargar_o_construir(
+        os.path.join(carpeta, f"cuadrados_medios_d{d}_indice.npy"),
+        lambda: _construir_indice(tabla_transiciones(d, carpeta)),
+    )
+
+
+def bloques(semilla, d, n, tamano=1 << 16):
+    """
+    Itera X₁..Xₙ en arreglos de a lo más `tamano` valores, sin guardar la
+    secuencia completa. Con d <= TABLA_MAX_D solo se calculan los valores
+    hasta el colapso (cola + un periodo, según el índice); el resto repite
+    el ciclo y se obtiene por índices.
+    """
+    if n <= 0:
+        return
+    x1 = siguiente(semilla, d)
+    if d <= TABLA_MAX_D:
+        cola, periodo, _ = (int(v) for v in indice_semillas(d)[x1])
+        # X₁..X_(cola + periodo): X₁ = x1 y luego cola + periodo - 1 pasos
+        previos = np.array([x1] + secuencia(x1, d, min(cola + periodo, n) - 1), dtype=np.int64)
+        for inicio in range(0, n, tamano):
+            j = np.arange(inicio, min(inicio + tamano, n), dtype=np.int64)
+            yield previos[np.where(j < cola, j, cola + (j - cola) % periodo)]
+        return
+
+    x = semilla
+    for inicio in range(0, n, tamano):
+        valores = np.empty(min(tamano, n - inicio), dtype=np.int64 if d <= 9 else object)
+        for i in range(len(valores)):
+            x = siguiente(x, d)
+            valores[i] = x
+        yield valores
+
+
+def calidad_semilla(semilla=5735, d=4):
+    """
+    ¿Qué tan buena es una semilla? Cola, periodo, entrada al ciclo y
+    cantidad de valores distintos antes de repetirse. Usa el índice
+    precalculado si d <= TABLA_MAX_D; si no, el algoritmo de Brent.
+    """
+    if not 0 <= semilla < 10 ** d:
+        raise ValueError(f"La semilla debe estar entre 0 y 10^{d} - 1.")
+    if d <= TABLA_MAX_D:
+        cola, periodo, entrada = (int(v) for v in indice_semillas(d)[semilla])
+    else:
+        info = detectar_ciclo(semilla, d)
+        cola, periodo, entrada = info["cola"], info["periodo"], info["entrada"]
+    colapso = max(cola, 1) + periodo
+    return {
+        "semilla": semilla,
+        "d": d,
+        "cola": cola,
+        "periodo": periodo,
+        "entrada": entrada,
+        "cero": entrada == 0 and periodo == 1,
+        "valores_distintos": colapso - 1,
+        "mensaje": (f"La semilla {semilla} (d={d}) genera {colapso - 1} valores distintos: "
+                    f"{cola} antes de entrar al ciclo y "
+                    + ("luego se queda en 0." if entrada == 0 and periodo == 1
+                       else f"un ciclo de periodo {periodo} que empieza en {entrada}.")),
+    }
+
+
+# ===== Ejecución (valores fijos, sin input) =====
+if __name__ == "__main__":
+    d = 4
+    for semilla in (5735, 1234, 9876, 3792):
+        print(calidad_semilla(semilla, d)["mensaje"])
+
+    # Todas las semillas de 4 dígitos a la vez (índice precalculado)
+    indice = np.asarray(indice_semillas(d), dtype=np.int64)
+    cola, periodo, entrada = indice[:, 0], indice[:, 1], indice[:, 2]
+    distintos = np.maximum(cola, 1) + periodo - 1
+    print(f"\nSemillas de {d} dígitos: {10 ** d}")
+    print(f"Terminan en 0: {int((entrada == 0).sum())}")
+    print(f"Valores distintos (media): {float(distintos.mean()):.2f}")
+    print(f"Valores distintos (máximo): {int(distintos.max())} (semilla {int(np.argmax(distintos))})")
+
+    # Verificación con el algoritmo de Brent
+    brent = detectar_ciclos(np.arange(10 ** d), d)
+    print("Índice == Brent:", bool((brent["cola"] == cola).all() and (brent["periodo"] == periodo).all()
+                                   and (brent["entrada"] == entrada).all()))
@@ -0,0 +1,170 @@
+"""
+=========================================
+ALGORITMO : Procesamiento de muestras por bloques
+-----------------------------------------
+Propósito:
+    Generar, resumir, graficar y guardar muestras de 10^9 valores o más
+    con memoria constante: los datos llegan en arreglos numpy de tamaño
+    fijo y cada consumidor los procesa uno a uno, sin armar la lista
+    completa.
+
+Descripción:
+    - Fuentes de bloques (iteradores de arreglos numpy):
+          FuenteUniforme.bloques(n)              generadores.py
+          GeneradorCongruencial.bloques(n)       generador_Congruencial.py
+          cuadrados_medios_entero.bloques(...)   cuadrados medios
+          muestreo_normal.bloques_normales(n)    normales
+    - `HistogramaEnLinea`: conteos con bordes fijos que se acumulan por
+      bloque (o valor a valor con `agregar_valor`); da la prueba χ² de
+      frecuencias y la gráfica en cualquier momento.
+    - `escribir_texto`: guarda los bloques en un archivo de texto a
+      medida que llegan (para binario, archivos_muestra.EscritorMuestra
+      también sirve como consumidor).
+    - `consumir(bloques, *consumidores)`: recorre los bloques una sola vez
+      y entrega cada uno a todos los consumidores (funciones u objetos con
+      `agregar`).
+=========================================
+"""
+
+# determinista: si
+
+from bisect import bisect_right
+
+import matplotlib.pyplot as plt
+import numpy as np
+from scipy.stats import chi2
+
+from archivos_muestra import textos_de_bloque
+
+
+class HistogramaEnLinea:
+    """
+    Histograma acumulado bloque a bloque.
+
+    Parámetros:
+        bordes (array): bordes de las clases (como en np.histogram).
+    """
+
+    def __init__(self, bordes):
+        self.bordes = np.asarray(bordes, dtype=float)
+        self.conteos = np.zeros(len(self.bordes) - 1, dtype=np.int64)
+        self.total = 0      # valores recibidos (incluye los que caen fuera)
+        self._bordes = self.bordes.tolist()
+
+    @classmethod
+    def uniforme(cls, clases=10):
+        """Histograma de `clases` intervalos iguales en [0, 1)."""
+        return cls(np.linspace(0.0, 1.0, clases + 1))
+
+    def agregar(self, bloque):
+        conteos, _ = np.histogram(bloque, bins=self.bordes)
+        self.conteos += conteos
+        self.total += len(bloque)
+
+    def agregar_valor(self, x):
+        """Agrega un solo valor (búsqueda binaria en los bordes, como np.histogram)."""
+        self.total += 1
+        clase = bisect_right(self._bordes, x) - 1
+        if x == self._bordes[-1]:
+            clase -= 1      # la última clase incluye su borde derecho
+        if 0 <= clase < len(self.conteos):
+            self.conteos[clase] += 1
+
+    @property
+    def fuera(self):
+        """Valores recibidos que no cayeron en ninguna clase."""
+        return self.total - int(self.conteos.sum())
+
+    def chi_cuadrado(self, probabilidades=None, alpha=0.05):
+        """
+        Prueba χ² de frecuencias. Por defecto las probabilidades de cada
+        clase son proporcionales a su ancho (uniforme en el rango). Solo
+        cuentan los valores dentro de los bordes; los demás se informan
+        aparte en `fuera`.
+
+        Retorna:
+            dict : chi2_calc, gl, chi2_crit, p_valor, decision, n y fuera.
+        """
+        dentro = int(self.conteos.sum())
+        if dentro == 0:
+            raise ValueError("El histograma no tiene datos dentro de sus bordes.")
+        if probabilidades is None:
+            anchos = np.diff(self.bordes)
+            probabilidades = anchos / anchos.sum()
+        esperadas = dentro * np.asarray(probabilidades, dtype=float)
+        chi2_calc = float(np.sum((self.conteos - esperadas) ** 2 / esperadas))
+        gl = len(self.conteos) - 1
+        chi2_crit = float(chi2.ppf(1 - alpha, gl))
+        return {
+            "chi2_calc": chi2_calc,
+            "gl": gl,
+            "chi2_crit": chi2_crit,
+            "p_valor": float(chi2.sf(chi2_calc, gl)),
+            "decision": ("Se acepta H₀: frecuencias compatibles." if chi2_calc <= chi2_crit
+                         else "Se rechaza H₀: frecuencias no compatibles."),
+            "n": dentro,
+            "fuera": self.total - dentro,
+        }
+
+    def graficar(self, ruta_guardado, titulo="Histograma", densidad=True):
+        """Guarda el histograma como imagen (sin plt.show())."""
+        alturas = self.conteos / (self.conteos.sum() * np.diff(self.bordes)) if densidad else self.conteos
+        plt.figure(figsize=(8, 5))
+        plt.stairs(alturas, self.bordes, fill=True, color="skyblue", edgecolor="black")
+        plt.title(titulo)
+        plt.xlabel("Valor")
+        plt.ylabel("Densidad" if densidad else "Frecuencia")
+        plt.grid(alpha=0.3)
+        plt.savefig(ruta_guardado)
+        plt.close()
+        print(f"Gráfico guardado en: {ruta_guardado}")
+
+
+def escribir_texto(ruta, bloques, decimales=5, encabezado=None):
+    """Escribe los bloques (un valor por línea) a medida que llegan; retorna la cantidad."""
+    total = 0
+    with open(ruta, "w", encoding="utf-8") as f:
+        if encabezado:
+            f.write(encabezado + "\n")
+        for bloque in bloques:
+            f.writelines(textos_de_bloque(bloque, decimales))
+            total += len(bloque)
+    return total
+
+
+def consumir(bloques, *consumidores):
+    """
+    Entrega cada bloque a todos los consumidores (objetos con `agregar` o
+    funciones de un argumento). Retorna la cantidad de valores procesados.
+    """
+    funciones = [getattr(c, "agregar", c) for c in consumidores]
+    total = 0
+    for bloque in bloques:
+        for funcion in funciones:
+            funcion(bloque)
+        total += len(bloque)
+    return total
+
+
+# ===== Ejecución (valores fijos, sin input) =====
+if __name__ == "__main__":
+    from generadores import GeneradorLCG
+    from muestreo_normal import bloques_normales
+
+    # 10^6 uniformes del LCG sin guardarlas: solo el histograma
+    n = 10**6
+    histograma = HistogramaEnLinea.uniforme(20)
+    consumir(GeneradorLCG(semilla=12345).bloques(n), histograma)
+    resultado = histograma.chi_cuadrado()
+    print(f"Uniformes: n = {histograma.total}  χ² = {resultado['chi2_calc']:.3f}  "
+          f"(gl = {resultado['gl']}, p = {resultado['p_valor']:.3f})")
+    print(resultado["decision"])
+
+    # Normales: histograma de 10^6 valores y archivo con los primeros 10^5
+    normales = HistogramaEnLinea(np.linspace(-4, 4, 41))
+    consumir(bloques_normales(10**6, semilla=12345), normales)
+    print(f"Normales: n = {normales.total}  fuera de [-4, 4] = {normales.fuera}")
+    normales.graficar("static/img/normales_bloques.png", titulo="Normales generadas por bloques")
+    escritos = escribir_texto("numeros_normales_bloques.txt", bloques_normales(10**5, semilla=12345),
+                              encabezado="Números normales N(0,1) generados por bloques")
+    print(f"Archivo guardado: numeros_normales_bloques.txt ({escritos} valores)")
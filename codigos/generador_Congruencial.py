@@ -15,43 +15,159 @@ Descripción:
           Xₙ₊₁ = (a * Xₙ + c) mod m
     - Luego se normaliza cada valor dividiéndolo entre m:
           Uₙ = Xₙ / m
+    - La secuencia se calcula por bloques con numpy: con las potencias
+      precalculadas Aₖ = aᵏ mod m y Cₖ = c(aᵏ⁻¹ + ... + a + 1) mod m,
+          Xₙ₊ₖ = (Aₖ * Xₙ + Cₖ) mod m,   k = 1..B
+      en aritmética entera exacta (mismos valores que el cálculo paso a paso).
+    - `saltar(n)` avanza la semilla n pasos en O(log n) y `subflujo`
+      reparte la secuencia entre varios trabajadores (ver lcg_afin.py).
+    - `generar(n, silencioso=True)` retorna un arreglo sin imprimir;
+      `muestra=k` imprime solo k filas de la tabla.
+    - `bloques(n, tamano)` entrega la misma secuencia en arreglos de
+      `tamano` valores, uno a la vez: memoria constante aunque n sea 10^9.
     - No usa `input()` y está preparado para ejecutarse en entornos web.
 =========================================
 """
 
+import copy
+
+import numpy as np
+
+import lcg_afin
+
+# Valores por bloque (tamaño de las tablas Aₖ y Cₖ)
+TAMANO_BLOQUE = 1 << 16
+
+
+def _mulmod(v, x, m):
+    """(v * x) mod m exacto para un arreglo `v` (< m) y un entero `x` (< m)."""
+    if v.dtype == object:
+        return (v * x) % m
+    if m <= 1 << 31:
+        # v * x < 2^62: cabe en int64
+        return (v * x) % m
+    # m <= 2^46: x se procesa en dígitos de 16 bits; r * 2^16 y v * dígito son
+    # < 2^62, así que su suma es < 2^63 y cabe en int64
+    r = np.zeros_like(v)
+    for desplazamiento in range(48, -1, -16):
+        r = (r * (1 << 16) + v * ((x >> desplazamiento) & 0xFFFF)) % m
+    return r
+
+
 class GeneradorCongruencial:
     def __init__(self, a, X0, c, m):
         self.a = a      # Multiplicador
         self.X0 = X0    # Semilla
         self.c = c      # Incremento
         self.m = m      # Módulo
+        self._tablas = None
 
-    def generar(self, n_iteraciones):
-        """Genera y muestra la secuencia congruencial."""
-        Xn = self.X0
-        resultados = []
+    def _tipo(self):
+        # Con m > 2^46 los productos no caben en int64: enteros de Python
+        return np.int64 if self.m <= 1 << 46 else object
 
-        print("n\tXn\t\tUn")
-        print(f"0\t{Xn}\t\t--")
+    def _potencias(self):
+        """Tablas Aₖ y Cₖ (k = 1..TAMANO_BLOQUE), calculadas por duplicación."""
+        if self._tablas is None:
+            m = self.m
+            A = np.array([self.a % m], dtype=self._tipo())
+            C = np.array([self.c % m], dtype=self._tipo())
+            while len(A) < TAMANO_BLOQUE:
+                # Pasos k+1..2k: A[k+j] = A[j]·Aₖ,  C[k+j] = A[j]·Cₖ + C[j]
+                a_k, c_k = int(A[-1]), int(C[-1])
+                A, C = (np.concatenate((A, _mulmod(A, a_k, m))),
+                        np.concatenate((C, (_mulmod(A, c_k, m) + C) % m)))
+            self._tablas = (A, C)
+        return self._tablas
+
+    def bloques_enteros(self, n_iteraciones, tamano=TAMANO_BLOQUE):
+        """Itera X₁..Xₙ en arreglos de a lo más `tamano` valores (memoria constante)."""
+        A, C = self._potencias()
+        x = self.X0 % self.m
+        for inicio in range(0, n_iteraciones, tamano):
+            bloque = np.empty(min(tamano, n_iteraciones - inicio), dtype=self._tipo())
+            for j in range(0, len(bloque), TAMANO_BLOQUE):
+                b = min(TAMANO_BLOQUE, len(bloque) - j)
+                bloque[j:j + b] = (_mulmod(A[:b], x, self.m) + C[:b]) % self.m
+                x = int(bloque[j + b - 1])
+            yield bloque
+
+    def secuencia(self, n_iteraciones):
+        """Arreglo con X₁..Xₙ (enteros exactos)."""
+        # Un solo bloque del tamaño de la secuencia
+        return next(self.bloques_enteros(n_iteraciones, max(n_iteraciones, 1)),
+                    np.empty(0, dtype=self._tipo()))
 
-        for i in range(1, n_iteraciones + 1):
-            Xn = (self.a * Xn + self.c) % self.m
-            Un = Xn / self.m
-            resultados.append(Un)
-            print(f"{i}\t{Xn}\t\t{Un:.4f}")
+    def _uniformes(self, X):
+        if X.dtype == object:
+            return np.array([int(x) / self.m for x in X], dtype=float)
+        # Xₙ y m < 2^53 son exactos en float64: la división coincide con Xₙ / m
+        return X / float(self.m)
 
+    def bloques(self, n_iteraciones, tamano=TAMANO_BLOQUE):
+        """
+        Itera U₁..Uₙ en arreglos de a lo más `tamano` valores: los mismos
+        que generar(n, silencioso=True), sin guardar la secuencia completa.
+        """
+        for X in self.bloques_enteros(n_iteraciones, tamano):
+            yield self._uniformes(X)
+
+    def saltar(self, n):
+        """Avanza la semilla n pasos en O(log n): X0 <- Xₙ."""
+        self.X0 = lcg_afin.avanzar(self.X0, self.a, self.c, self.m, n)
+
+    def subflujo(self, n_total, k, K):
+        """
+        Generador y cantidad de valores del trabajador k de K. Concatenar en
+        orden de k las secuencias de cada uno reproduce generar(n_total).
+        """
+        inicio, fin = lcg_afin.particion(n_total, k, K)
+        generador = copy.copy(self)
+        generador.saltar(inicio)
+        return generador, fin - inicio
+
+    def generar(self, n_iteraciones, silencioso=False, muestra=None):
+        """
+        Genera la secuencia congruencial.
+
+        silencioso : retorna un arreglo numpy con Uₙ sin imprimir nada.
+        muestra    : imprime solo `muestra` filas de la tabla (repartidas
+                     a lo largo de la secuencia) y no la lista completa.
+        Por defecto imprime la tabla completa y retorna una lista; con
+        `silencioso` o `muestra` retorna el arreglo.
+        """
+        X = self.secuencia(n_iteraciones)
+        U = self._uniformes(X)
+        if silencioso:
+            return U
+
+        if muestra is not None:
+            filas = np.unique(np.linspace(0, n_iteraciones - 1, min(muestra, n_iteraciones)).astype(np.int64))
+        else:
+            filas = range(n_iteraciones)
+
+        print("n\tXn\t\tUn")
+        print(f"0\t{self.X0}\t\t--")
+        for i in filas:
+            print(f"{i + 1}\t{int(X[i])}\t\t{float(U[i]):.4f}")
+
+        if muestra is not None:
+            print(f"\n({len(filas)} de {n_iteraciones} filas mostradas)")
+            return U
+        resultados = U.tolist()
         print("\nSecuencia generada:")
         print(resultados)
         return resultados
 
 
 # ===== Ejecución con valores fijos =====
-# Ejemplo clásico de parámetros LCG
-a = 5       # Multiplicador
-X0 = 7      # Semilla
-c = 3       # Incremento
-m = 7       # Módulo
-n_iter = 10 # Cantidad de valores a generar
-
-generador = GeneradorCongruencial(a, X0, c, m)
-generador.generar(n_iter)
+if __name__ == "__main__":
+    # Ejemplo clásico de parámetros LCG
+    a = 5       # Multiplicador
+    X0 = 7      # Semilla
+    c = 3       # Incremento
+    m = 7       # Módulo
+    n_iter = 10 # Cantidad de valores a generar
+
+    generador = GeneradorCongruencial(a, X0, c, m)
+    generador.generar(n_iter)
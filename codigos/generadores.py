@@ -0,0 +1,203 @@
+"""
+=========================================
+ALGORITMO : Interfaz común de generadores de números aleatorios
+-----------------------------------------
+Propósito:
+    Que todas las simulaciones pidan sus números aleatorios a un mismo
+    tipo de objeto, en arreglos completos, para poder cambiar la fuente
+    (numpy, el LCG del curso, MINSTD, cuadrados medios) sin tocar el código
+    de la simulación.
+
+Descripción:
+    - `FuenteUniforme` define la interfaz: `uniformes(n)` retorna un arreglo
+      de n valores U[0,1); `enteros`, `exponenciales` y `uniforme` se
+      construyen a partir de ella.
+    - Implementaciones:
+        GeneradorNumpy             numpy.random.Generator (PCG64)
+        GeneradorRandom            random.Random (misma secuencia que
+                                   random.seed(s) + random.random())
+        GeneradorLCG               Xₙ₊₁ = (a·Xₙ + c) mod m por bloques
+                                   (GeneradorCongruencial); `minstd(...)`
+        GeneradorCuadradosMedios   cuadrados medios en aritmética entera
+    - Cada generador guarda su propio estado: una simulación por petición
+      no comparte estado global con los demás hilos.
+    - `bloques(n, tamano)` entrega n uniformes en arreglos de `tamano`
+      valores, generados a medida que se piden: memoria constante.
+    - `obtener_generador` acepta un objeto, un numpy Generator o un nombre.
+=========================================
+"""
+
+# determinista: si
+
+import random
+
+import numpy as np
+
+import cuadrados_medios_entero
+from generador_Congruencial import GeneradorCongruencial
+
+# Valores por bloque de `bloques`
+BLOQUE = 1 << 20
+
+
+class FuenteUniforme:
+    """Interfaz: las subclases implementan `uniformes(n)`."""
+
+    nombre = "base"
+
+    def uniformes(self, n):
+        """Arreglo float64 con n valores en [0, 1)."""
+        raise NotImplementedError
+
+    def uniforme(self):
+        return float(self.uniformes(1)[0])
+
+    def bloques(self, n, tamano=BLOQUE):
+        """Itera n uniformes en arreglos de a lo más `tamano` valores."""
+        for inicio in range(0, n, tamano):
+            yield self.uniformes(min(tamano, n - inicio))
+
+    def enteros(self, bajo, alto, n):
+        """n enteros en [bajo, alto) con igual probabilidad (como numpy `integers`)."""
+        return (bajo + np.floor(self.uniformes(n) * (alto - bajo))).astype(np.int64)
+
+    def exponenciales(self, escala, n):
+        """n valores exponenciales de media `escala` por transformada inversa."""
+        # 1 - U está en (0, 1]: nunca log(0)
+        return -escala * np.log1p(-self.uniformes(n))
+
+    def __repr__(self):
+        return f"<{type(self).__name__} {self.nombre}>"
+
+
+class GeneradorNumpy(FuenteUniforme):
+    """Envuelve un numpy.random.Generator (o crea uno con `semilla`)."""
+
+    nombre = "numpy"
+
+    def __init__(self, semilla=None):
+        self.generador = semilla if isinstance(semilla, np.random.Generator) else np.random.default_rng(semilla)
+
+    def uniformes(self, n):
+        return self.generador.random(n)
+
+    def enteros(self, bajo, alto, n):
+        return self.generador.integers(bajo, alto, n)
+
+    def exponenciales(self, escala, n):
+        return self.generador.exponential(escala, n)
+
+
+class GeneradorRandom(FuenteUniforme):
+    """
+    random.Random propio: con la misma semilla reproduce la secuencia de
+    random.seed(semilla) seguido de llamadas a random.random().
+    """
+
+    nombre = "random"
+
+    def __init__(self, semilla=None):
+        self.generador = random.Random(semilla)
+
+    def uniformes(self, n):
+        aleatorio = self.generador.random
+        return np.fromiter((aleatorio() for _ in range(n)), dtype=float, count=n)
+
+
+class GeneradorLCG(FuenteUniforme):
+    """
+    LCG con el motor por bloques de GeneradorCongruencial; el estado avanza
+    entre llamadas. Los valores son Xₙ / m (como en el generador del curso).
+    """
+
+    nombre = "lcg"
+
+    def __init__(self, a=1664525, c=1013904223, m=2**32, semilla=None):
+        if semilla is None:
+            semilla = int(np.random.SeedSequence().entropy % m)
+        self._lcg = GeneradorCongruencial(a, semilla, c, m)
+
+    @classmethod
+    def minstd(cls, semilla=None):
+        """MINSTD (Park–Miller): a = 16807, c = 0, m = 2^31 - 1."""
+        if semilla is None:
+            semilla = int(np.random.SeedSequence().entropy % (2**31 - 2)) + 1
+        generador = cls(16807, 0, 2**31 - 1, semilla)
+        generador.nombre = "minstd"
+        return generador
+
+    @property
+    def estado(self):
+        return self._lcg.X0
+
+    def uniformes(self, n):
+        X = self._lcg.secuencia(n)
+        if n:
+            self._lcg.X0 = int(X[-1])
+        if X.dtype == object:
+            return np.array([int(x) / self._lcg.m for x in X], dtype=float)
+        return X / float(self._lcg.m)
+
+
+class GeneradorCuadradosMedios(FuenteUniforme):
+    """
+    Cuadrados medios con d dígitos (Xₙ / 10^d). Ilustra un generador pobre:
+    la secuencia cae pronto en ciclos cortos o en cero.
+    """
+
+    nombre = "cuadrados_medios"
+
+    def __init__(self, semilla=None, d=4):
+        if semilla is None:
+            semilla = int(np.random.SeedSequence().entropy % 10 ** d)
+        self.x = semilla
+        self.d = d
+
+    def uniformes(self, n):
+        X = np.concatenate([np.empty(0, dtype=np.int64),
+                            *cuadrados_medios_entero.bloques(self.x, self.d, n, max(n, 1))])
+        if n:
+            self.x = int(X[-1])
+        return X.astype(float) / 10 ** self.d
+
+
+GENERADORES = {
+    "numpy": GeneradorNumpy,
+    "random": GeneradorRandom,
+    "lcg": GeneradorLCG,
+    "minstd": GeneradorLCG.minstd,
+    "cuadrados_medios": GeneradorCuadradosMedios,
+}
+
+
+def obtener_generador(generador=None, semilla=None):
+    """
+    Normaliza el argumento `generador=` de las simulaciones:
+        FuenteUniforme         se usa tal cual
+        numpy Generator        se envuelve en GeneradorNumpy
+        nombre (str)           se crea con `semilla` (ver GENERADORES)
+        None                   GeneradorRandom(semilla) si hay semilla (misma
+                               secuencia que random.seed), si no GeneradorNumpy()
+    """
+    if isinstance(generador, FuenteUniforme):
+        return generador
+    if isinstance(generador, np.random.Generator):
+        return GeneradorNumpy(generador)
+    if isinstance(generador, str):
+        if generador not in GENERADORES:
+            raise ValueError(f"Generador desconocido: {generador}. Opciones: {', '.join(GENERADORES)}.")
+        return GENERADORES[generador](semilla=semilla)
+    if generador is None:
+        return GeneradorRandom(semilla) if semilla is not None else GeneradorNumpy()
+    raise ValueError("generador debe ser un FuenteUniforme, un numpy Generator o un nombre.")
+
+
+# ===== Ejecución (valores fijos, sin input) =====
+if __name__ == "__main__":
+    n = 100000
+    for nombre in GENERADORES:
+        generador = obtener_generador(nombre, semilla=5735)
+        u = generador.uniformes(n)
+        distintos = len(np.unique(u))
+        print(f"{nombre:<18} media = {u.mean():.4f}  varianza = {u.var():.4f}  "
+              f"valores distintos = {distintos}")
@@ -0,0 +1,91 @@
+"""
+=========================================
+ALGORITMO : Salto adelante y subflujos para generadores congruenciales
+-----------------------------------------
+Propósito:
+    Avanzar el estado de un LCG n pasos en O(log n) y repartir una misma
+    secuencia entre varios procesos, de forma que juntos reproduzcan
+    exactamente la secuencia de un solo hilo.
+
+Descripción:
+    - Un paso del LCG es la función afín  f(x) = (a·x + c) mod m.
+    - Componer dos funciones afines da otra función afín:
+          (A₁, C₁) ∘ (A₂, C₂) = (A₁·A₂, A₁·C₂ + C₁)  (mod m)
+    - fⁿ se obtiene por exponenciación binaria (elevar al cuadrado y
+      multiplicar), con O(log n) composiciones.
+    - `particion(total, k, K)` asigna al trabajador k de K un tramo
+      contiguo y disjunto de la secuencia; `subflujo` da el estado con el
+      que ese trabajador empieza. Concatenar los tramos en orden de k
+      reproduce la secuencia completa.
+=========================================
+"""
+
+
+def componer(f, g, m):
+    """Función afín f∘g (primero g, luego f), con f y g como pares (A, C)."""
+    return (f[0] * g[0]) % m, (f[0] * g[1] + f[1]) % m
+
+
+def potencia_afin(a, c, m, n):
+    """(Aₙ, Cₙ) tales que aplicar n pasos equivale a x -> (Aₙ·x + Cₙ) mod m."""
+    if n < 0:
+        raise ValueError("n debe ser >= 0.")
+    resultado = (1 % m, 0)
+    base = (a % m, c % m)
+    while n:
+        if n & 1:
+            resultado = componer(base, resultado, m)
+        base = componer(base, base, m)
+        n >>= 1
+    return resultado
+
+
+def avanzar(x, a, c, m, n):
+    """Estado del LCG después de n pasos desde `x`, en O(log n)."""
+    A, C = potencia_afin(a, c, m, n)
+    return (A * x + C) % m
+
+
+def particion(total, k, K):
+    """Tramo [inicio, fin) de `total` valores que corresponde al trabajador k de K."""
+    if K <= 0 or not 0 <= k < K:
+        raise ValueError("Se requiere 0 <= k < K.")
+    return k * total // K, (k + 1) * total // K
+
+
+def subflujo(x0, a, c, m, total, k, K):
+    """
+    Estado inicial y cantidad de valores del trabajador k de K al repartir
+    los `total` valores que siguen a la semilla `x0`.
+    """
+    inicio, fin = particion(total, k, K)
+    return avanzar(x0, a, c, m, inicio), fin - inicio
+
+
+# ===== Ejecución (valores fijos, sin input) =====
+if __name__ == "__main__":
+    a, c, m = 1664525, 1013904223, 2**32
+    semilla = 123456789
+
+    # Salto de un millón de pasos comparado con el cálculo paso a paso
+    x = semilla
+    for _ in range(10**6):
+        x = (a * x + c) % m
+    print(f"Estado tras 10^6 pasos (paso a paso): {x}")
+    print(f"Estado tras 10^6 pasos (salto):       {avanzar(semilla, a, c, m, 10**6)}")
+
+    # Cuatro subflujos que juntos reproducen los primeros 20 valores
+    total, K = 20, 4
+    completa, x = [], semilla
+    for _ in range(total):
+        x = (a * x + c) % m
+        completa.append(x)
+
+    unida = []
+    for k in range(K):
+        x, cantidad = subflujo(semilla, a, c, m, total, k, K)
+        print(f"Trabajador {k}: valores {particion(total, k, K)}, estado inicial {x}")
+        for _ in range(cantidad):
+            x = (a * x + c) % m
+            unida.append(x)
+    print("Subflujos concatenados == secuencia completa:", unida == completa)
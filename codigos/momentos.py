@@ -0,0 +1,192 @@
+"""
+=========================================
+ALGORITMO : Momentos en línea (Welford / Chan / Pébay)
+-----------------------------------------
+Propósito:
+    Calcular cantidad, media, varianza, mínimo, máximo y, si se pide,
+    asimetría y curtosis de una muestra en una sola pasada, bloque a
+    bloque, sin guardar los datos y con resultados estables aunque la
+    muestra tenga 10^9 valores.
+
+Descripción:
+    - No se acumulan Σx y Σx² (que pierden precisión por cancelación),
+      sino la media y las sumas de potencias de las desviaciones:
+          M₂ = Σ(x - x̄)²,  M₃ = Σ(x - x̄)³,  M₄ = Σ(x - x̄)⁴
+    - Cada bloque se resume con numpy (dos pasadas sobre el bloque) y se
+      combina con el acumulado con las fórmulas de Chan y Pébay; con un
+      solo valor, la combinación es la actualización de Welford.
+    - Dos acumuladores (p. ej. de procesos distintos) se combinan igual,
+      con `combinar`: el resultado no depende del orden.
+    - `normalizar(bloque)` aplica (x - x̄) / s con los momentos acumulados.
+=========================================
+"""
+
+# determinista: si
+
+import math
+
+import numpy as np
+
+
+class MomentosEnLinea:
+    """
+    Acumulador de momentos.
+
+    Parámetros:
+        orden (int): 2 (media y varianza) o 4 (además asimetría y
+            curtosis, algo más caro por bloque).
+    """
+
+    def __init__(self, orden=2):
+        if orden not in (2, 4):
+            raise ValueError("orden debe ser 2 o 4.")
+        self.orden = orden
+        self.n = 0
+        self.media = 0.0
+        self.m2 = 0.0
+        self.m3 = 0.0
+        self.m4 = 0.0
+        self.minimo = math.inf
+        self.maximo = -math.inf
+
+    # ---------- acumulación ----------
+
+    def _combinar(self, n, media, m2, m3, m4, minimo, maximo):
+        """Fórmulas de Pébay para unir (self) con un resumen (n, media, M₂, M₃, M₄)."""
+        if n == 0:
+            return
+        na, nb = float(self.n), float(n)
+        total = na + nb
+        delta = media - self.media
+        delta_n = delta / total
+        if self.orden == 4:
+            self.m4 += (m4 + delta * delta_n ** 3 * na * nb * (na * na - na * nb + nb * nb)
+                        + 6 * delta_n ** 2 * (na * na * m2 + nb * nb * self.m2)
+                        + 4 * delta_n * (na * m3 - nb * self.m3))
+            self.m3 += (m3 + delta * delta_n ** 2 * na * nb * (na - nb)
+                        + 3 * delta_n * (na * m2 - nb * self.m2))
+        self.m2 += m2 + delta * delta_n * na * nb
+        self.media += nb * delta_n
+        self.n += n
+        self.minimo = min(self.minimo, minimo)
+        self.maximo = max(self.maximo, maximo)
+
+    def agregar(self, bloque):
+        """Agrega un bloque de valores (cualquier forma; se aplana)."""
+        x = np.asarray(bloque, dtype=float).reshape(-1)
+        if len(x) == 0:
+            return
+        media = float(x.mean())
+        d = x - media
+        d2 = d * d
+        m3 = m4 = 0.0
+        if self.orden == 4:
+            m3 = float(np.dot(d2, d))
+            m4 = float(np.dot(d2, d2))
+        self._combinar(len(x), media, float(d2.sum()), m3, m4, float(x.min()), float(x.max()))
+
+    def agregar_valor(self, x):
+        """Agrega un solo valor (actualización de Welford)."""
+        x = float(x)
+        self._combinar(1, x, 0.0, 0.0, 0.0, x, x)
+
+    def combinar(self, otro):
+        """Suma al acumulador los momentos de `otro` (p. ej. de otro proceso). Retorna self."""
+        if otro.orden < self.orden and otro.n:
+            raise ValueError("No se puede combinar con un acumulador de menor orden.")
+        self._combinar(otro.n, otro.media, otro.m2, otro.m3, otro.m4, otro.minimo, otro.maximo)
+        return self
+
+    @classmethod
+    def de(cls, datos, orden=2):
+        """Acumulador con los momentos de `datos` (un arreglo o un iterable de bloques)."""
+        momentos = cls(orden)
+        if isinstance(datos, (np.ndarray, list, tuple)):
+            datos = [datos]
+        for bloque in datos:
+            momentos.agregar(bloque)
+        return momentos
+
+    # ---------- resultados ----------
+
+    def varianza(self, ddof=0):
+        """Varianza poblacional (ddof=0) o muestral (ddof=1)."""
+        return self.m2 / (self.n - ddof) if self.n > ddof else math.nan
+
+    def desviacion(self, ddof=0):
+        return math.sqrt(self.varianza(ddof))
+
+    @property
+    def asimetria(self):
+        if self.orden < 4 or self.m2 == 0:
+            return math.nan
+        return math.sqrt(self.n) * self.m3 / self.m2 ** 1.5
+
+    @property
+    def curtosis(self):
+        """Exceso de curtosis (0 para la normal)."""
+        if self.orden < 4 or self.m2 == 0:
+            return math.nan
+        return self.n * self.m4 / (self.m2 * self.m2) - 3.0
+
+    def error_estandar(self):
+        """Error estándar de la media, s / √n (s muestral)."""
+        return self.desviacion(1) / math.sqrt(self.n) if self.n > 1 else math.nan
+
+    def normalizar(self, bloque):
+        """(x - x̄) / s con la desviación poblacional acumulada (s = 1 si es 0)."""
+        sigma = self.desviacion() if self.n else 0.0
+        return (np.asarray(bloque, dtype=float) - self.media) / (sigma if sigma != 0 else 1.0)
+
+    def resumen(self):
+        """Diccionario con los estadísticos acumulados."""
+        resultado = {
+            "n": self.n,
+            "media": self.media,
+            "varianza": self.varianza(),
+            "desviacion": self.desviacion() if self.n else math.nan,
+            "minimo": self.minimo,
+            "maximo": self.maximo,
+        }
+        if self.orden == 4:
+            resultado["asimetria"] = self.asimetria
+            resultado["curtosis"] = self.curtosis
+        return resultado
+
+    def __repr__(self):
+        return (f"<MomentosEnLinea n={self.n} media={self.media:.6g} "
+                f"varianza={self.varianza():.6g}>")
+
+
+# ===== Ejecución (valores fijos, sin input) =====
+if __name__ == "__main__":
+    from muestreo_normal import bloques_normales
+
+    # 10^6 normales N(10^9, 1) por bloques: Σx² pierde toda la precisión, M₂ no
+    n = 10**6
+    momentos = MomentosEnLinea(orden=4)
+    suma = suma_cuadrados = 0.0
+    for bloque in bloques_normales(n, mu=1e9, semilla=12345, tamano=1 << 16):
+        momentos.agregar(bloque)
+        suma += float(bloque.sum())
+        suma_cuadrados += float(np.dot(bloque, bloque))
+    ingenua = suma_cuadrados / n - (suma / n) ** 2
+
+    print(f"n = {momentos.n}")
+    print(f"Media       = {momentos.media:.6f}")
+    print(f"Varianza    = {momentos.varianza():.6f}   (Σx²/n - x̄² da {ingenua:.1f})")
+    print(f"Asimetría   = {momentos.asimetria:+.5f}")
+    print(f"Curtosis    = {momentos.curtosis:+.5f}")
+    print(f"Mín / máx   = {momentos.minimo - 1e9:+.3f} / {momentos.maximo - 1e9:+.3f}  (respecto de 10^9)")
+
+    # Combinar acumuladores de varias partes da lo mismo que uno solo
+    datos = np.random.default_rng(1).exponential(2.0, 10**6)
+    partes = [MomentosEnLinea.de(p, orden=4) for p in np.array_split(datos, 7)]
+    unido = partes[0]
+    for parte in partes[1:]:
+        unido.combinar(parte)
+    print("Partes combinadas == numpy:",
+          np.allclose([unido.media, unido.varianza(), unido.asimetria, unido.curtosis],
+                      [datos.mean(), datos.var(),
+                       ((datos - datos.mean()) ** 3).mean() / datos.std() ** 3,
+                       ((datos - datos.mean()) ** 4).mean() / datos.var() ** 2 - 3]))
@@ -27,33 +27,41 @@ Autor:
 =========================================
 """
 
-import random
-import math
+# determinista: no
 
-def simular_MM1(lambd=20/60, mu=1/2, iteraciones=500):
+import numpy as np
+
+from generadores import BLOQUE, obtener_generador
+from momentos import MomentosEnLinea
+
+def simular_MM1(lambd=20/60, mu=1/2, iteraciones=500, generador=None):
     """
     Simulacion Monte Carlo de un sistema M/M/1.
     Retorna un diccionario con resultados analiticos y simulados.
+    `generador`: fuente de numeros aleatorios (ver generadores.py).
     """
-    # Variables acumuladoras
-    tiempos_espera = []
-    tiempos_sistema = []
-    tiempo_actual = 0
-    tiempo_servidor_libre = 0
-
-    # Simulacion Monte Carlo
-    for _ in range(iteraciones):
-        tiempo_llegada = -math.log(random.random()) / lambd
-        tiempo_servicio = -math.log(random.random()) / mu
+    generador = obtener_generador(generador)
 
-        tiempo_actual += tiempo_llegada
+    # Simulacion Monte Carlo por bloques de clientes (memoria constante):
+    # solo se acumulan los momentos y la espera/servicio del ultimo cliente
+    espera = MomentosEnLinea()
+    sistema = MomentosEnLinea()
+    espera_previa, servicio_previo = 0.0, None
+    for inicio in range(0, iteraciones, BLOQUE):
+        b = min(BLOQUE, iteraciones - inicio)
+        tiempo_llegada = generador.exponenciales(1 / lambd, b)
+        tiempo_servicio = generador.exponenciales(1 / mu, b)
 
-        espera = max(0, tiempo_servidor_libre - tiempo_actual)
-        total = espera + tiempo_servicio
-        tiempo_servidor_libre = tiempo_actual + total
+        # Recursion de Lindley: espera_n = max(0, espera_{n-1} + servicio_{n-1} - llegada_n),
+        # sin bucle: con Z = espera_previa + sumas acumuladas, espera_n = Z_n - min(0, Z_1..Z_n)
+        primero = 0.0 if servicio_previo is None else servicio_previo - tiempo_llegada[0]
+        Z = espera_previa + np.cumsum(np.concatenate(([primero], tiempo_servicio[:-1] - tiempo_llegada[1:])))
+        tiempos_espera = Z - np.minimum(np.minimum.accumulate(Z), 0.0)
+        tiempos_sistema = tiempos_espera + tiempo_servicio
 
-        tiempos_espera.append(espera)
-        tiempos_sistema.append(total)
+        espera.agregar(tiempos_espera)
+        sistema.agregar(tiempos_sistema)
+        espera_previa, servicio_previo = float(tiempos_espera[-1]), float(tiempo_servicio[-1])
 
     # Resultados analiticos
     rho = lambd / mu
@@ -61,8 +69,8 @@ def simular_MM1(lambd=20/60, mu=1/2, iteraciones=500):
     Wq_analitico = Lq / lambd if rho < 1 else float('inf')
 
     # Resultados simulados
-    promedio_espera = sum(tiempos_espera) / iteraciones
-    promedio_sistema = sum(tiempos_sistema) / iteraciones
+    promedio_espera = espera.media
+    promedio_sistema = sistema.media
 
     mensaje = (
         "RESULTADOS - SIMULACION M/M/1\n"
@@ -79,6 +87,7 @@ def simular_MM1(lambd=20/60, mu=1/2, iteraciones=500):
         "Wq_analitico": Wq_analitico,
         "promedio_espera_MC": promedio_espera,
         "promedio_sistema_MC": promedio_sistema,
+        "desviacion_espera_MC": espera.desviacion(1) if espera.n > 1 else 0.0,
         "mensaje": mensaje
     }
 
@@ -23,18 +23,26 @@ Guarda el resultado como imagen para visualizacion en dashboard.
 =========================================
 """
 
+# determinista: no
+
 import numpy as np
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
+from matplotlib.patches import Circle
 import os
 
-def estimar_pi_montecarlo(n=1000, ruta_img="static/img/montecarlo_pi.png"):
+from generadores import obtener_generador
+
+def estimar_pi_montecarlo(n=1000, ruta_img="static/img/montecarlo_pi.png", generador=None):
     """
     Simula la estimacion de pi usando el metodo Monte Carlo.
     Retorna un diccionario con los resultados y guarda la imagen.
+    `generador`: fuente de numeros aleatorios (ver generadores.py).
     """
+    generador = obtener_generador(generador)
+
     # Generar puntos
-    x = np.random.uniform(-1, 1, n)
-    y = np.random.uniform(-1, 1, n)
+    x = 2 * generador.uniformes(n) - 1
+    y = 2 * generador.uniformes(n) - 1
 
     # Condicion: puntos dentro del circulo unitario
     dentro = (x**2 + y**2) <= 1
@@ -46,19 +54,19 @@ def estimar_pi_montecarlo(n=1000, ruta_img="static/img/montecarlo_pi.png"):
     # Crear carpeta si no existe
     os.makedirs(os.path.dirname(ruta_img), exist_ok=True)
 
-    # Graficar
-    fig, ax = plt.subplots(figsize=(5, 5))
+    # Graficar (figura propia, sin el estado global de pyplot: se llama desde hilos del servidor)
+    fig = Figure(figsize=(5, 5))
+    ax = fig.subplots()
     ax.scatter(x[dentro], y[dentro], color="blue", s=5, label="Dentro del circulo")
     ax.scatter(x[~dentro], y[~dentro], color="red", s=5, label="Fuera del circulo")
-    circulo = plt.Circle((0, 0), radius=1, edgecolor="black", fill=False, linewidth=2)
+    circulo = Circle((0, 0), radius=1, edgecolor="black", fill=False, linewidth=2)
     ax.add_patch(circulo)
     ax.set_aspect("equal")
     ax.set_xlim(-1, 1)
     ax.set_ylim(-1, 1)
-    plt.title("Estimacion de pi — Metodo de Monte Carlo")
-    plt.legend()
-    plt.savefig(ruta_img)
-    plt.close()
+    ax.set_title("Estimacion de pi — Metodo de Monte Carlo")
+    ax.legend()
+    fig.savefig(ruta_img)
 
     # Resultados
     mensaje = (
@@ -23,36 +23,36 @@ Resultados:
 ==========================================================
 """
 
-import random
+# determinista: no
 
-def caminata_aleatoria_2D(simulaciones=10000, movimientos=10, condicion=2):
+import numpy as np
+
+from generadores import obtener_generador
+
+# Valores aleatorios por bloque de caminatas (acota la memoria)
+VALORES_POR_BLOQUE = 1 << 20
+
+def caminata_aleatoria_2D(simulaciones=10000, movimientos=10, condicion=2, generador=None):
+    """
+    Cada fila de un bloque es una caminata; cada paso es un entero NA en
+    [0, 100] (Este < 25 <= Oeste < 50 <= Sur < 75 <= Norte).
+    `generador`: fuente de números aleatorios (ver generadores.py).
+    """
+    generador = obtener_generador(generador)
     aciertos = 0
-    exitos = []          # 1 si cumple la condicion, 0 si no
-    prob_acumulada = []  # probabilidad acumulada por simulacion
 
-    for i in range(simulaciones):
-        x, y = 0, 0
-        for _ in range(movimientos):
-            NA = random.randint(0, 100)
-            if NA < 25:
-                x += 1  # Este
-            elif NA < 50:
-                x -= 1  # Oeste
-            elif NA < 75:
-                y -= 1  # Sur
-            else:
-                y += 1  # Norte
+    filas_por_bloque = max(1, VALORES_POR_BLOQUE // max(movimientos, 1))
+    for inicio in range(0, simulaciones, filas_por_bloque):
+        filas = min(filas_por_bloque, simulaciones - inicio)
+        NA = generador.enteros(0, 101, filas * movimientos).reshape(filas, movimientos)
+        x = (NA < 25).sum(axis=1) - ((NA >= 25) & (NA < 50)).sum(axis=1)
+        y = (NA >= 75).sum(axis=1) - ((NA >= 50) & (NA < 75)).sum(axis=1)
 
         # Evaluar si cumple la condición |x| + |y| == condicion
-        if abs(x) + abs(y) == condicion:
-            aciertos += 1
-            exitos.append(1)
-        else:
-            exitos.append(0)
+        aciertos += int((np.abs(x) + np.abs(y) == condicion).sum())
 
-        # Probabilidad acumulada hasta la simulacion actual
-        prob_actual = aciertos / (i + 1)
-        prob_acumulada.append(prob_actual)
+    # Probabilidad acumulada al final de todas las simulaciones
+    prob_final = aciertos / simulaciones
 
     mensaje = (
         "=================================================\n"
@@ -63,7 +63,7 @@ def caminata_aleatoria_2D(simulaciones=10000, movimientos=10, condicion=2):
         f"Condicion de exito: |x| + |y| = {condicion}\n"
         "-------------------------------------------------\n"
         f"Exitos observados: {aciertos}\n"
-        f"Probabilidad estimada: {prob_acumulada[-1]:.4f}\n"
+        f"Probabilidad estimada: {prob_final:.4f}\n"
         "=================================================\n"
     )
 
@@ -72,7 +72,7 @@ def caminata_aleatoria_2D(simulaciones=10000, movimientos=10, condicion=2):
         "movimientos": movimientos,
         "condicion": condicion,
         "exitos": aciertos,
-        "probabilidad_estimada": prob_acumulada[-1],
+        "probabilidad_estimada": prob_final,
         "mensaje": mensaje
     }
 
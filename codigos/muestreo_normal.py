@@ -0,0 +1,232 @@
+"""
+=========================================
+ALGORITMO : Muestreo de la normal por bloques (Box–Muller, polar, ziggurat)
+-----------------------------------------
+Propósito:
+    Transformar bloques de uniformes U[0,1) de cualquier generador del
+    proyecto (ver generadores.py) en valores N(μ, σ²) con numpy, sin
+    calcular raíz, logaritmo, seno y coseno elemento por elemento.
+
+Descripción:
+    - Box–Muller: cada par (U₁, U₂) da
+          Z₁ = √(-2 ln U₁) cos(2πU₂),   Z₂ = √(-2 ln U₁) sin(2πU₂)
+      `box_muller(u)` conserva el orden de los scripts del curso (pares
+      intercalados, Z₁ y Z₂ intercalados), así que con las mismas
+      uniformes da los mismos valores.
+    - Polar de Marsaglia: V = 2U - 1; se aceptan los pares con
+      0 < S = V₁² + V₂² < 1 y Zᵢ = Vᵢ √(-2 ln S / S). El rechazo (≈ 21 %)
+      se hace sobre el bloque completo con una máscara.
+    - Ziggurat (Marsaglia–Tsang, 256 capas): ~99 % de los valores se
+      aceptan con una comparación; el resto pasa por la prueba de la cuña
+      o por la cola exacta x > r.
+    - `normales(n, ...)` escribe en un arreglo de salida preasignado, por
+      bloques de BLOQUE valores, pidiendo las uniformes al generador;
+      `bloques_normales(n, ...)` entrega los valores bloque a bloque.
+=========================================
+"""
+
+# determinista: no
+
+import math
+
+import numpy as np
+
+from generadores import obtener_generador
+
+# Valores normales por bloque (memoria acotada para n grandes)
+BLOQUE = 1 << 18
+
+METODOS = ("box_muller", "polar", "ziggurat")
+
+
+# ============================================================
+# Box–Muller
+# ============================================================
+
+def box_muller(u, salida=None):
+    """
+    Normales estándar a partir de 2k uniformes `u` (U₁, U₂ intercalados;
+    U₁ > 0). Retorna (o escribe en `salida`) 2k valores Z₁, Z₂ intercalados.
+    """
+    u = np.asarray(u, dtype=float)
+    if salida is None:
+        salida = np.empty(len(u) - len(u) % 2)
+    u1, u2 = u[0:len(salida):2], u[1:len(salida):2]
+    r = np.sqrt(-2.0 * np.log(u1))
+    theta = (2.0 * np.pi) * u2
+    np.multiply(r, np.cos(theta), out=salida[0::2])
+    np.multiply(r, np.sin(theta), out=salida[1::2])
+    return salida
+
+
+def _bloque_box_muller(fuente, salida):
+    u = fuente.uniformes(len(salida) + len(salida) % 2)
+    # U₁ se toma como 1 - U, en (0, 1]: nunca log(0)
+    np.subtract(1.0, u[0::2], out=u[0::2])
+    if len(salida) % 2:
+        salida[:] = box_muller(u)[:len(salida)]
+    else:
+        box_muller(u, salida)
+
+
+# ============================================================
+# Polar de Marsaglia
+# ============================================================
+
+def _bloque_polar(fuente, salida):
+    llenos = 0
+    while llenos < len(salida):
+        faltan = len(salida) - llenos
+        # Se acepta una fracción π/4 de los pares; se pide un poco de más
+        pares = int((faltan + 1) // 2 / (np.pi / 4) * 1.02) + 16
+        v = 2.0 * fuente.uniformes(2 * pares) - 1.0
+        v1, v2 = v[0::2], v[1::2]
+        s = v1 * v1 + v2 * v2
+        aceptados = (s > 0.0) & (s < 1.0)
+        s = s[aceptados]
+        factor = np.sqrt(-2.0 * np.log(s) / s)
+        z = np.empty(2 * len(s))
+        np.multiply(v1[aceptados], factor, out=z[0::2])
+        np.multiply(v2[aceptados], factor, out=z[1::2])
+        cantidad = min(len(z), faltan)
+        salida[llenos:llenos + cantidad] = z[:cantidad]
+        llenos += cantidad
+
+
+# ============================================================
+# Ziggurat
+# ============================================================
+
+CAPAS = 256
+R_ZIGGURAT = 3.6541528853610088      # inicio de la cola
+AREA_CAPA = 0.00492867323399         # área de cada capa (f sin normalizar)
+
+
+def _tablas_ziggurat():
+    """
+    Bordes X[0..CAPAS] de las capas (X[0] es el ancho virtual de la base,
+    X[1] = r, X[CAPAS] = 0) y F[i] = f(X[i]) con f(x) = exp(-x²/2).
+    """
+    f = lambda x: math.exp(-0.5 * x * x)
+    X = [AREA_CAPA / f(R_ZIGGURAT), R_ZIGGURAT]
+    for _ in range(2, CAPAS):
+        X.append(math.sqrt(-2.0 * math.log(AREA_CAPA / X[-1] + f(X[-1]))))
+    X.append(0.0)
+    X = np.array(X)
+    return X, np.exp(-0.5 * X * X)
+
+
+_X_ZIG, _F_ZIG = _tablas_ziggurat()
+
+
+def _cola_ziggurat(fuente, cantidad):
+    """`cantidad` valores de la normal condicionada a x > r (método de Marsaglia)."""
+    resultado = np.empty(cantidad)
+    llenos = 0
+    while llenos < cantidad:
+        faltan = cantidad - llenos
+        u = fuente.uniformes(2 * faltan)
+        x = -np.log1p(-u[:faltan]) / R_ZIGGURAT
+        y = -np.log1p(-u[faltan:])
+        x = x[2.0 * y > x * x]
+        resultado[llenos:llenos + len(x)] = R_ZIGGURAT + x
+        llenos += len(x)
+    return resultado
+
+
+def _bloque_ziggurat(fuente, salida):
+    llenos = 0
+    while llenos < len(salida):
+        faltan = len(salida) - llenos
+        candidatos = faltan + faltan // 64 + 16
+        # Una uniforme da la capa (8 bits altos) y la posición dentro de ella
+        u = fuente.uniformes(candidatos) * CAPAS
+        capa = u.astype(np.int64)
+        x = (2.0 * (u - capa) - 1.0) * _X_ZIG[capa]
+        valido = np.abs(x) < _X_ZIG[capa + 1]
+
+        lentos = np.flatnonzero(~valido)
+        if len(lentos):
+            capa_lenta = capa[lentos]
+            # Capas 1..255: prueba de la cuña con una uniforme vertical
+            cuna = lentos[capa_lenta > 0]
+            i = capa[cuna]
+            y = _F_ZIG[i] + fuente.uniformes(len(cuna)) * (_F_ZIG[i + 1] - _F_ZIG[i])
+            valido[cuna] = y < np.exp(-0.5 * x[cuna] ** 2)
+            # Capa 0 fuera de [-r, r]: valor exacto de la cola, con el signo de x
+            base = lentos[capa_lenta == 0]
+            x[base] = np.copysign(_cola_ziggurat(fuente, len(base)), x[base])
+            valido[base] = True
+
+        x = x[valido]
+        cantidad = min(len(x), faltan)
+        salida[llenos:llenos + cantidad] = x[:cantidad]
+        llenos += cantidad
+
+
+_BLOQUES = {
+    "box_muller": _bloque_box_muller,
+    "polar": _bloque_polar,
+    "ziggurat": _bloque_ziggurat,
+}
+
+
+def _preparar(metodo, generador, semilla):
+    if metodo not in _BLOQUES:
+        raise ValueError(f"Método desconocido: {metodo}. Opciones: {', '.join(METODOS)}.")
+    return _BLOQUES[metodo], obtener_generador("numpy" if generador is None else generador, semilla)
+
+
+def _rellenar(bloque, fuente, parte, mu, sigma):
+    bloque(fuente, parte)
+    if sigma != 1.0:
+        parte *= sigma
+    if mu != 0.0:
+        parte += mu
+
+
+def normales(n, mu=0.0, sigma=1.0, metodo="box_muller", generador=None, semilla=None, salida=None):
+    """
+    n valores N(mu, sigma²) escritos en `salida` (arreglo float64 de
+    largo n; se crea si no se pasa). `generador` y `semilla` siguen a
+    generadores.obtener_generador; por defecto el PCG64 de numpy.
+    """
+    bloque, fuente = _preparar(metodo, generador, semilla)
+    if salida is None:
+        salida = np.empty(n)
+    elif salida.shape != (n,) or salida.dtype != np.float64:
+        raise ValueError("salida debe ser un arreglo float64 de largo n.")
+
+    for inicio in range(0, n, BLOQUE):
+        _rellenar(bloque, fuente, salida[inicio:inicio + BLOQUE], mu, sigma)
+    return salida
+
+
+def bloques_normales(n, mu=0.0, sigma=1.0, metodo="box_muller", generador=None, semilla=None, tamano=BLOQUE):
+    """
+    Igual que `normales`, pero entrega los n valores en arreglos de a lo
+    más `tamano`, generados a medida que se piden (memoria constante).
+    """
+    bloque, fuente = _preparar(metodo, generador, semilla)
+    for inicio in range(0, n, tamano):
+        parte = np.empty(min(tamano, n - inicio))
+        _rellenar(bloque, fuente, parte, mu, sigma)
+        yield parte
+
+
+# ===== Ejecución (valores fijos, sin input) =====
+if __name__ == "__main__":
+    import time
+
+    from Prueba_kolmogorov_smirnov import prueba_ks
+
+    n = 10**6
+    salida = np.empty(n)
+    for metodo in METODOS:
+        inicio = time.perf_counter()
+        normales(n, metodo=metodo, semilla=12345, salida=salida)
+        segundos = time.perf_counter() - inicio
+        ks = prueba_ks(salida, "normal", parametros={"normal": (0.0, 1.0)}, mostrar=False)["resultados"]["normal"]
+        estadistico, p_valor = ks["D"], ks["p_valor"]
+        print(f"{metodo:<11} media = {salida.mean():+.4f}  sigma = {salida.std():.4f}  "
+              f"KS = {estadistico:.5f} (p = {p_valor:.3f})  {n / segundos / 1e6:.1f} M valores/s")
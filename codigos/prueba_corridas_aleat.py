@@ -13,60 +13,293 @@ Pasos:
          - Si no aumenta → 0
     2 Se cuentan las "corridas": cambios de 0 → 1 o 1 → 0
     3 Se obtiene el número total de corridas C = len(Cambios) + 1
+
+Estadísticos (N = cantidad de números):
+    E[C] = (2N - 1) / 3,   Var[C] = (16N - 29) / 90
+    - Con N <= EXACTO_MAX el valor-p es exacto: la distribución de C se
+      obtiene con la recurrencia de las permutaciones de N elementos con
+      c corridas (f(N, c) = c·f(N-1, c) + 2·f(N-1, c-1) + (N-c)·f(N-1, c-2)).
+      Con N mayor se usa la aproximación normal.
+    - Se reporta la distribución de largos de corrida contra la esperada
+          E[corridas de largo k] = 2[(k² + 3k + 1)N - (k³ + 3k² - k - 4)] / (k + 3)!
+      con una prueba χ² (aproximada: los conteos no son independientes).
+
+Implementación:
+    - `AcumuladorCorridas` procesa la secuencia por bloques con numpy y
+      guarda entre bloques el último valor y la corrida en curso, así que
+      la secuencia puede tener 10^8 valores o más; `agregar_valor` la
+      actualiza valor a valor en O(1) y `resultado` se puede pedir en
+      cualquier momento.
+    - `prueba_corridas(datos)` acepta una lista o arreglo, un iterable de
+      bloques (p. ej. generador.bloques(n)) o la ruta de un archivo
+      (.npy / float64 crudo con memmap, o texto; ver archivos_muestra.py).
 ============================================================
 """
 
+# determinista: si
+
+import math
+
+import numpy as np
+from scipy.stats import chi2, norm
+
+from archivos_muestra import leer_muestra
+
+# Mayor N con valor-p exacto (la recurrencia cuesta O(N²))
+EXACTO_MAX = 2000
+# Largos de corrida contados por separado; los más largos van en la última clase
+MAX_LARGO = 20
+# Valores por bloque al leer arreglos y archivos
+TAMANO_BLOQUE = 1 << 22
+
+
 def compar(lista):
     """
     Genera una lista binaria S indicando si cada elemento
     es mayor (1) o menor/igual (0) que el anterior.
     """
-    S = []
-    for i in range(1, len(lista)):
-        if lista[i] > lista[i-1]:
-            S.append(1)
-        else:
-            S.append(0)
-    return S
+    x = np.asarray(lista, dtype=float)
+    return (x[1:] > x[:-1]).astype(np.int64).tolist()
 
 
 def corridas(S):
     """
     Cuenta las corridas (cambios entre 0 y 1 consecutivos).
     """
-    C = []
-    for i in range(len(S) - 1):
-        if S[i] != S[i + 1]:
-            C.append(1)
-    return C
-
-
-# --- Ejemplo de datos ---
-r = [0.89, 0.26, 0.01, 0.98, 0.13, 0.12, 0.69, 0.11, 0.05, 0.65,
-     0.21, 0.04, 0.03, 0.11, 0.07, 0.97, 0.27, 0.12, 0.95, 0.02, 0.06]
-
-# --- Paso 1: Generar secuencia comparativa ---
-S = compar(r)
-print("S =", S)
-
-# --- Paso 2: Contar corridas ---
-C = corridas(S)
-num_corridas = len(C) + 1
-print(f"Número total de corridas (C) = {num_corridas}")
-
-# --- Paso 3 (opcional): Evaluación estadística ---
-# Si deseas comparar con el valor esperado de corridas bajo H0:
-n = len(S)
-esperado = (2 * n - 1) / 3
-varianza = (16 * n - 29) / 90
-Z = (num_corridas - esperado) / (varianza ** 0.5)
-
-print(f"Valor esperado de corridas (E[C]) = {esperado:.3f}")
-print(f"Varianza teórica (Var[C]) = {varianza:.3f}")
-print(f"Estadístico Z = {Z:.3f}")
-
-# Interpretación (nivel de significancia 5%)
-if abs(Z) < 1.96:
-    print("✅ No se rechaza H₀ → Los números parecen aleatorios.")
-else:
-    print("❌ Se rechaza H₀ → La secuencia no es aleatoria.")
+    S = np.asarray(S)
+    return [1] * int(np.count_nonzero(S[1:] != S[:-1]))
+
+
+# ============================================================
+# Estadísticos
+# ============================================================
+
+def distribucion_corridas(N):
+    """Arreglo p con p[c] = P(C = c) para N valores sin empates (recurrencia exacta)."""
+    p = np.zeros(N + 1)
+    if N < 2:
+        return p
+    p[1] = 1.0                       # N = 2: una sola corrida
+    c = np.arange(N + 1, dtype=float)
+    for m in range(3, N + 1):
+        # f(m, c) / m! a partir de f(m-1, ·) / (m-1)!
+        nuevo = c * p
+        nuevo[1:] += 2.0 * p[:-1]
+        nuevo[2:] += (m - c[2:]) * p[:-2]
+        p = nuevo / m
+    return p
+
+
+def largos_esperados(N, max_largo=MAX_LARGO):
+    """
+    Cantidad esperada de corridas de largo 1..max_largo-1 y, en la
+    última posición, de largo >= max_largo.
+    """
+    esperado_total = (2 * N - 1) / 3 if N >= 2 else 0.0
+    k = np.arange(1, max_largo, dtype=float)
+    factorial = np.array([math.factorial(int(v) + 3) for v in k], dtype=float)
+    esperados = 2.0 * ((k * k + 3 * k + 1) * N - (k ** 3 + 3 * k * k - k - 4)) / factorial
+    # Largos imposibles (k > N - 1) y el caso k = N - 1, que vale 2 / N!
+    esperados[k > N - 1] = 0.0
+    if 1 <= N - 1 < max_largo:
+        esperados[N - 2] = 2.0 / math.factorial(N)
+    return np.append(esperados, max(esperado_total - esperados.sum(), 0.0))
+
+
+# ============================================================
+# Acumulador por bloques
+# ============================================================
+
+class AcumuladorCorridas:
+    """
+    Estado de la prueba de corridas entre bloques.
+
+    Parámetros:
+        max_largo (int): los largos >= max_largo se cuentan juntos.
+    """
+
+    def __init__(self, max_largo=MAX_LARGO):
+        self.max_largo = max_largo
+        self.n = 0                  # valores recibidos
+        self.ultimo = None          # último valor (para comparar con el bloque siguiente)
+        self.signo = None           # sentido de la corrida en curso (True = aumenta)
+        self.largo = 0              # largo de la corrida en curso
+        # conteos[k - 1] = corridas terminadas de largo k (la última clase: >= max_largo)
+        self.conteos = np.zeros(max_largo, dtype=np.int64)
+
+    def _contar(self, largos):
+        self.conteos += np.bincount(np.minimum(largos, self.max_largo) - 1, minlength=self.max_largo)
+
+    def agregar(self, bloque):
+        x = np.asarray(bloque, dtype=float).reshape(-1)
+        if len(x) == 0:
+            return
+        if self.ultimo is not None:
+            x = np.concatenate(([self.ultimo], x))
+            self.n -= 1
+        self.n += len(x)
+        self.ultimo = float(x[-1])
+        s = x[1:] > x[:-1]
+        if len(s) == 0:
+            return
+
+        # Inicio de cada corrida dentro del bloque
+        inicios = np.flatnonzero(s[1:] != s[:-1]) + 1
+        largos = np.diff(np.concatenate(([0], inicios, [len(s)])))
+        if self.signo is not None:
+            if s[0] == self.signo:
+                largos[0] += self.largo          # sigue la corrida del bloque anterior
+            else:
+                self._contar(np.array([self.largo]))
+        # Todas menos la última están terminadas
+        self._contar(largos[:-1])
+        self.largo = int(largos[-1])
+        self.signo = bool(s[-1])
+
+    def agregar_valor(self, x):
+        """Agrega un solo valor en O(1) (para monitorear un generador en vivo)."""
+        x = float(x)
+        self.n += 1
+        if self.ultimo is not None:
+            aumenta = x > self.ultimo
+            if self.signo is None or aumenta == self.signo:
+                self.largo += 1
+            else:
+                self.conteos[min(self.largo, self.max_largo) - 1] += 1
+                self.largo = 1
+            self.signo = aumenta
+        self.ultimo = x
+
+    def conteos_finales(self):
+        """Conteos de largos incluyendo la corrida en curso (sin modificar el estado)."""
+        conteos = self.conteos.copy()
+        if self.largo:
+            conteos[min(self.largo, self.max_largo) - 1] += 1
+        return conteos
+
+    @property
+    def total_corridas(self):
+        return int(self.conteos.sum()) + (1 if self.largo else 0)
+
+    def resultado(self, alpha=0.05):
+        """Estadísticos de la prueba con los valores recibidos hasta ahora."""
+        N = self.n
+        if N < 2:
+            raise ValueError("La prueba de corridas requiere al menos 2 números.")
+        C = self.total_corridas
+        esperado = (2 * N - 1) / 3
+        varianza = (16 * N - 29) / 90
+        Z = (C - esperado) / math.sqrt(varianza) if varianza > 0 else 0.0
+
+        if 2 <= N <= EXACTO_MAX:
+            p = distribucion_corridas(N)
+            distancia = np.abs(np.arange(N + 1) - esperado)
+            p_valor = float(min(1.0, p[distancia >= abs(C - esperado) - 1e-9].sum()))
+            metodo = "exacto"
+        else:
+            p_valor = float(2 * norm.sf(abs(Z)))
+            metodo = "normal"
+
+        # Distribución de largos: se juntan las clases con esperado < 5 en la última
+        observados = self.conteos_finales()
+        esperados = largos_esperados(N, self.max_largo)
+        corte = int(np.argmax(esperados[:-1] < 5)) if (esperados[:-1] < 5).any() else self.max_largo - 1
+        corte = max(corte, 1)
+        obs = np.append(observados[:corte], observados[corte:].sum())
+        esp = np.append(esperados[:corte], esperados[corte:].sum())
+        validos = esp > 0
+        chi2_largos = float(np.sum((obs[validos] - esp[validos]) ** 2 / esp[validos]))
+        gl_largos = max(int(validos.sum()) - 1, 1)
+
+        return {
+            "n": N,
+            "corridas": C,
+            "esperado": esperado,
+            "varianza": varianza,
+            "Z": Z,
+            "p_valor": p_valor,
+            "metodo_p": metodo,
+            "decision": ("No se rechaza H₀ → Los números parecen aleatorios." if p_valor > alpha
+                         else "Se rechaza H₀ → La secuencia no es aleatoria."),
+            "largos": {
+                "largo": list(range(1, self.max_largo)) + [f">={self.max_largo}"],
+                "observados": observados.tolist(),
+                "esperados": esperados.tolist(),
+            },
+            "chi2_largos": chi2_largos,
+            "gl_largos": gl_largos,
+            "p_valor_largos": float(chi2.sf(chi2_largos, gl_largos)),
+        }
+
+
+def _bloques(datos, tamano):
+    if isinstance(datos, str):
+        datos = leer_muestra(datos)
+    if isinstance(datos, (np.ndarray, list, tuple)):
+        datos = np.asarray(datos, dtype=float)
+        return (datos[i:i + tamano] for i in range(0, len(datos), tamano))
+    return datos
+
+
+def prueba_corridas(datos, alpha=0.05, max_largo=MAX_LARGO, tamano=TAMANO_BLOQUE):
+    """
+    Prueba de corridas arriba/abajo.
+
+    Parámetros:
+        datos : lista, arreglo, iterable de bloques o ruta de archivo.
+        alpha : nivel de significancia.
+        max_largo : largos de corrida >= max_largo se cuentan juntos.
+
+    Retorna:
+        dict : corridas, E[C], Var[C], Z, valor-p, decisión y distribución
+               de largos (ver AcumuladorCorridas.resultado).
+    """
+    acumulador = AcumuladorCorridas(max_largo)
+    for bloque in _bloques(datos, tamano):
+        acumulador.agregar(bloque)
+    return acumulador.resultado(alpha)
+
+
+def prueba_corridas_generador(n=100000, generador="numpy", semilla=None, alpha=0.05):
+    """Prueba de corridas sobre n uniformes de un generador (ver generadores.py), por bloques."""
+    from generadores import obtener_generador
+
+    resultado = prueba_corridas(obtener_generador(generador, semilla).bloques(n), alpha)
+    resultado["generador"] = generador
+    resultado["mensaje"] = (f"Prueba de corridas ({generador}, n = {n}): C = {resultado['corridas']}, "
+                            f"E[C] = {resultado['esperado']:.3f}, Z = {resultado['Z']:.3f}, "
+                            f"p = {resultado['p_valor']:.4f}. {resultado['decision']}")
+    return resultado
+
+
+# ===== Ejecución (valores fijos, sin input) =====
+if __name__ == "__main__":
+    # --- Ejemplo de datos ---
+    r = [0.89, 0.26, 0.01, 0.98, 0.13, 0.12, 0.69, 0.11, 0.05, 0.65,
+         0.21, 0.04, 0.03, 0.11, 0.07, 0.97, 0.27, 0.12, 0.95, 0.02, 0.06]
+
+    # --- Paso 1: Generar secuencia comparativa ---
+    S = compar(r)
+    print("S =", S)
+
+    # --- Paso 2: Contar corridas ---
+    C = corridas(S)
+    num_corridas = len(C) + 1
+    print(f"Número total de corridas (C) = {num_corridas}")
+
+    # --- Paso 3: Evaluación estadística (N = cantidad de números) ---
+    resultado = prueba_corridas(r)
+    print(f"Valor esperado de corridas (E[C]) = {resultado['esperado']:.3f}")
+    print(f"Varianza teórica (Var[C]) = {resultado['varianza']:.3f}")
+    print(f"Estadístico Z = {resultado['Z']:.3f}")
+    print(f"Valor-p ({resultado['metodo_p']}) = {resultado['p_valor']:.4f}")
+
+    # Interpretación (nivel de significancia 5%)
+    if resultado["p_valor"] > 0.05:
+        print("✅ No se rechaza H₀ → Los números parecen aleatorios.")
+    else:
+        print("❌ Se rechaza H₀ → La secuencia no es aleatoria.")
+
+    # --- Secuencia larga por bloques ---
+    print()
+    print(prueba_corridas_generador(10**6, "lcg", semilla=12345)["mensaje"])
@@ -9,6 +9,8 @@ Propósito:
 
 
 """
+
+# determinista: si
 """
     Simula colisiones en una red de sensores donde cada nodo transmite
     en un instante aleatorio dentro de [0,1]. Si dos transmisiones
@@ -19,27 +21,36 @@ Propósito:
         delta (float): Diferencia mínima para considerar colisión.
         M (int): Número de simulaciones Monte Carlo.
         seed (int, opcional): Semilla para reproducibilidad.
+        generador (opcional): fuente de uniformes (ver generadores.py); con
+            solo `seed` se usa random.Random(seed), que reproduce los
+            resultados de la versión con random.seed.
 
     Retorna:
         dict: Contiene resultados y mensaje para dashboard:
             - 'nodos', 'delta', 'simulaciones', 'colisiones', 'probabilidad', 'mensaje'
     """
-import random
+import numpy as np
+
+from generadores import obtener_generador
+
+# Valores aleatorios por bloque de simulaciones (acota la memoria)
+VALORES_POR_BLOQUE = 1 << 20
 
-def simulacion_colisiones(N=10, delta=0.05, M=100000, seed=None):
+def simulacion_colisiones(N=10, delta=0.05, M=100000, seed=None, generador=None):
     
     if N <= 0 or delta <= 0 or M <= 0:
         return {"mensaje": "Parámetros inválidos. Todos deben ser mayores que 0."}
 
-    if seed is not None:
-        random.seed(seed)
+    generador = obtener_generador(generador, seed)
 
     colisiones = 0
 
-    for _ in range(M):
-        tiempos = sorted(random.random() for _ in range(N))
-        if any(tiempos[i+1] - tiempos[i] < delta for i in range(N-1)):
-            colisiones += 1
+    # Cada fila es una simulación: N tiempos ordenados y sus diferencias consecutivas
+    filas_por_bloque = max(1, VALORES_POR_BLOQUE // N)
+    for inicio in range(0, M, filas_por_bloque):
+        filas = min(filas_por_bloque, M - inicio)
+        tiempos = np.sort(generador.uniformes(filas * N).reshape(filas, N), axis=1)
+        colisiones += int((np.diff(tiempos, axis=1) < delta).any(axis=1).sum())
 
     probabilidad = colisiones / M
 
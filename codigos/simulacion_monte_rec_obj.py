@@ -13,9 +13,20 @@ Método:
 s
 """
 
-import random
+# determinista: si
+
 import math
 
+import numpy as np
+
+from generadores import obtener_generador
+
+# Celdas por bloque de recorridos simultáneos (acota la memoria)
+CELDAS_POR_BLOQUE = 1 << 22
+
+# Vecinos en el orden en que se consideran: arriba, abajo, izquierda, derecha
+_DESPLAZAMIENTOS = np.array([(-1, 0), (1, 0), (0, -1), (0, 1)])
+
 def validar_parametros(filas, columnas, p, movimientos, M):
     if filas <= 0 or columnas <= 0:
         raise ValueError("filas y columnas deben ser positivos.")
@@ -26,46 +37,59 @@ def validar_parametros(filas, columnas, p, movimientos, M):
     if M <= 0:
         raise ValueError("M (número de simulaciones) debe ser positivo.")
 
-def simular_un_recorrido(filas, columnas, p, movimientos):
-    grid = [[1 if random.random() < p else 0 for _ in range(columnas)] for _ in range(filas)]
-    fila, col = random.randint(0, filas - 1), random.randint(0, columnas - 1)
-    visitadas = {(fila, col)}
-    recolectados = 0
-    if grid[fila][col] == 1:
-        recolectados += 1
-        grid[fila][col] = 0
+def simular_recorridos(filas, columnas, p, movimientos, cantidad, generador):
+    """
+    Simula `cantidad` recorridos a la vez y retorna los objetos recolectados
+    en cada uno. En cada paso el robot elige al azar entre las celdas
+    vecinas no visitadas; si no hay ninguna, se detiene.
+    """
+    b = np.arange(cantidad)
+    grid = (generador.uniformes(cantidad * filas * columnas) < p).reshape(cantidad, filas, columnas)
+    fila = generador.enteros(0, filas, cantidad)
+    col = generador.enteros(0, columnas, cantidad)
+    visitadas = np.zeros((cantidad, filas, columnas), dtype=bool)
+    visitadas[b, fila, col] = True
+    recolectados = grid[b, fila, col].astype(np.int64)
+    activos = np.ones(cantidad, dtype=bool)
+
     for _ in range(movimientos):
-        posibles = []
-        if fila > 0: posibles.append((fila - 1, col))
-        if fila < filas - 1: posibles.append((fila + 1, col))
-        if col > 0: posibles.append((fila, col - 1))
-        if col < columnas - 1: posibles.append((fila, col + 1))
-        posibles = [c for c in posibles if c not in visitadas]
-        if not posibles:
+        nf = fila[:, None] + _DESPLAZAMIENTOS[:, 0]
+        nc = col[:, None] + _DESPLAZAMIENTOS[:, 1]
+        dentro = (nf >= 0) & (nf < filas) & (nc >= 0) & (nc < columnas)
+        posibles = dentro & ~visitadas[b[:, None], np.clip(nf, 0, filas - 1), np.clip(nc, 0, columnas - 1)]
+        k = posibles.sum(axis=1)
+        activos &= k > 0
+        if not activos.any():
             break
-        fila, col = random.choice(posibles)
-        visitadas.add((fila, col))
-        if grid[fila][col] == 1:
-            recolectados += 1
-            grid[fila][col] = 0
+        # Se elige el j-ésimo vecino posible, j uniforme en [0, k)
+        j = np.floor(generador.uniformes(cantidad) * k)
+        eleccion = np.argmax(np.cumsum(posibles, axis=1) > j[:, None], axis=1)
+        fila = np.where(activos, nf[b, eleccion], fila)
+        col = np.where(activos, nc[b, eleccion], col)
+        recolectados += activos & grid[b, fila, col] & ~visitadas[b, fila, col]
+        visitadas[b, fila, col] = True
     return recolectados
 
-def simulacion_robot_recolector(filas=10, columnas=10, p=0.1, movimientos=20, M=10000, objetivo=5, seed=None):
+def simular_un_recorrido(filas, columnas, p, movimientos, generador=None):
+    return int(simular_recorridos(filas, columnas, p, movimientos, 1, obtener_generador(generador))[0])
+
+def simulacion_robot_recolector(filas=10, columnas=10, p=0.1, movimientos=20, M=10000, objetivo=5, seed=None,
+                                generador=None):
     """
     Retorna un diccionario con resultados de la simulación Monte Carlo,
     sin imprimir ni generar gráficos.
+    `generador`: fuente de números aleatorios (ver generadores.py); con
+    solo `seed` se usa numpy con esa semilla.
     """
     validar_parametros(filas, columnas, p, movimientos, M)
-    if seed is not None:
-        random.seed(seed)
+    generador = obtener_generador("numpy" if generador is None else generador, seed)
 
-    exitos = 0
     resultados = []
-    for _ in range(M):
-        recolectados = simular_un_recorrido(filas, columnas, p, movimientos)
-        resultados.append(recolectados)
-        if recolectados >= objetivo:
-            exitos += 1
+    por_bloque = max(1, CELDAS_POR_BLOQUE // (filas * columnas))
+    for inicio in range(0, M, por_bloque):
+        resultados.append(simular_recorridos(filas, columnas, p, movimientos, min(por_bloque, M - inicio), generador))
+    resultados = np.concatenate(resultados)
+    exitos = int((resultados >= objetivo).sum())
 
     prob_estimada = exitos / M
     se = math.sqrt(prob_estimada * (1 - prob_estimada) / M)
@@ -87,7 +111,7 @@ def simulacion_robot_recolector(filas=10, columnas=10, p=0.1, movimientos=20, M=
     )
 
     return {
-        "resultados_simulacion": resultados,
+        "resultados_simulacion": resultados.tolist(),
         "M": M,
         "exitos": exitos,
         "probabilidad_estimada": prob_estimada,
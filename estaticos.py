@@ -0,0 +1,195 @@
+"""
+=========================================
+Archivos estáticos con huella y precomprimidos
+-----------------------------------------
+Propósito:
+    Que el navegador descargue la hoja de estilos, el JavaScript, las
+    imágenes y el PDF una sola vez, y solo vuelva a pedirlos cuando cambian.
+
+Descripción:
+    - `construir()` copia cada archivo de `static/` a `static/dist/` con una
+      huella de su contenido en el nombre (estilos.css -> estilos.<sha>.css)
+      y escribe `manifest.json` con la correspondencia.
+    - Las referencias `url(...)` relativas de las hojas de estilo se
+      reescriben hacia los nombres con huella.
+    - Los archivos de texto se precomprimen con gzip y, si el paquete
+      `brotli` está instalado, también con brotli.
+    - `ManifiestoEstaticos` resuelve rutas para las plantillas y elige la
+      variante comprimida según Accept-Encoding.
+
+Uso:
+    python estaticos.py          (se ejecuta antes de iniciar el servidor)
+=========================================
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import re
+import threading
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+CARPETA_SALIDA = "dist"
+MANIFIESTO = "manifest.json"
+
+# Extensiones que vale la pena comprimir (las imágenes y el PDF ya lo están)
+EXTENSIONES_TEXTO = {".css", ".js", ".svg", ".html", ".json", ".txt", ".map"}
+
+_URL_CSS = re.compile(r"""url\(\s*(['"]?)([^'")]+)\1\s*\)""")
+
+
+def _codificaciones_aceptadas(cabecera):
+    """Codificaciones de un Accept-Encoding sin las rechazadas con q=0 (o con un q inválido)."""
+    aceptadas = set()
+    for entrada in (cabecera or "").lower().split(","):
+        nombre, *parametros = (parte.strip() for parte in entrada.split(";"))
+        q = 1.0
+        for parametro in parametros:
+            clave, _, valor = parametro.partition("=")
+            if clave.strip() == "q":
+                try:
+                    q = float(valor)
+                except ValueError:
+                    q = 0.0
+        if nombre and q > 0:
+            aceptadas.add(nombre)
+    return aceptadas
+
+
+def _con_huella(ruta, contenido):
+    base, extension = os.path.splitext(ruta)
+    return f"{base}.{hashlib.sha256(contenido).hexdigest()[:12]}{extension}"
+
+
+def _escribir(ruta, contenido):
+    os.makedirs(os.path.dirname(ruta), exist_ok=True)
+    temporal = ruta + ".tmp"
+    with open(temporal, "wb") as f:
+        f.write(contenido)
+    os.replace(temporal, ruta)
+
+
+def _reescribir_css(ruta, contenido, manifiesto):
+    """Reemplaza las url(...) relativas de una hoja de estilos por sus nombres con huella."""
+    carpeta = os.path.dirname(ruta)
+
+    def reemplazar(coincidencia):
+        comilla, url = coincidencia.groups()
+        if re.match(r"^([a-z]+:|/|#)", url):
+            return coincidencia.group(0)
+        destino = os.path.normpath(os.path.join(carpeta, url)).replace(os.sep, "/")
+        if destino not in manifiesto:
+            return coincidencia.group(0)
+        nueva = os.path.relpath(manifiesto[destino], carpeta or ".").replace(os.sep, "/")
+        return f"url({comilla}{nueva}{comilla})"
+
+    return _URL_CSS.sub(reemplazar, contenido.decode("utf-8")).encode("utf-8")
+
+
+def construir(carpeta_static):
+    """
+    Genera `static/dist/` y su manifiesto. Borra las salidas de
+    construcciones anteriores que ya no corresponden. Retorna el manifiesto.
+    """
+    salida = os.path.join(carpeta_static, CARPETA_SALIDA)
+    archivos = []
+    for raiz, carpetas, nombres in os.walk(carpeta_static):
+        if raiz == carpeta_static and CARPETA_SALIDA in carpetas:
+            carpetas.remove(CARPETA_SALIDA)
+        for nombre in nombres:
+            relativa = os.path.relpath(os.path.join(raiz, nombre), carpeta_static).replace(os.sep, "/")
+            archivos.append(relativa)
+
+    # Las hojas de estilo van al final: referencian a los demás archivos
+    archivos.sort(key=lambda r: (r.endswith(".css"), r))
+    manifiesto = {}
+    generados = {MANIFIESTO}
+    for relativa in archivos:
+        with open(os.path.join(carpeta_static, relativa), "rb") as f:
+            contenido = f.read()
+        if relativa.endswith(".css"):
+            contenido = _reescribir_css(relativa, contenido, manifiesto)
+        destino = _con_huella(relativa, contenido)
+        manifiesto[relativa] = destino
+        generados.add(destino)
+
+        ruta_destino = os.path.join(salida, destino)
+        if not os.path.exists(ruta_destino):
+            _escribir(ruta_destino, contenido)
+        if os.path.splitext(relativa)[1] in EXTENSIONES_TEXTO:
+            variantes = [(".gz", lambda c: gzip.compress(c, 9, mtime=0))]
+            if brotli is not None:
+                variantes.append((".br", lambda c: brotli.compress(c, quality=11)))
+            for sufijo, comprimir in variantes:
+                generados.add(destino + sufijo)
+                if not os.path.exists(ruta_destino + sufijo):
+                    _escribir(ruta_destino + sufijo, comprimir(contenido))
+
+    # Salidas viejas (de versiones anteriores de los archivos)
+    for raiz, _, nombres in os.walk(salida):
+        for nombre in nombres:
+            ruta = os.path.join(raiz, nombre)
+            if os.path.relpath(ruta, salida).replace(os.sep, "/") not in generados:
+                os.remove(ruta)
+
+    _escribir(os.path.join(salida, MANIFIESTO), json.dumps(manifiesto, indent=2, sort_keys=True).encode("utf-8"))
+    return manifiesto
+
+
+class ManifiestoEstaticos:
+    """
+    Lee `static/dist/manifest.json` (se recarga si cambia). Sin manifiesto,
+    las rutas se sirven tal cual desde `static/`.
+
+    Parámetros:
+        carpeta_static (str): carpeta `static/` de la aplicación.
+    """
+
+    def __init__(self, carpeta_static):
+        self.carpeta = os.path.join(carpeta_static, CARPETA_SALIDA)
+        self._ruta = os.path.join(self.carpeta, MANIFIESTO)
+        self._manifiesto = {}
+        self._mtime = None
+        self._lock = threading.Lock()
+
+    def _actual(self):
+        try:
+            mtime = os.stat(self._ruta).st_mtime_ns
+        except OSError:
+            mtime = None
+        with self._lock:
+            if mtime != self._mtime:
+                try:
+                    with open(self._ruta, "r", encoding="utf-8") as f:
+                        self._manifiesto = json.load(f)
+                except (OSError, ValueError):
+                    self._manifiesto = {}
+                self._mtime = mtime
+            return self._manifiesto
+
+    def archivo(self, ruta):
+        """Ruta dentro de `static/` para `ruta` (la versión con huella, si existe)."""
+        destino = self._actual().get(ruta)
+        return f"{CARPETA_SALIDA}/{destino}" if destino else ruta
+
+    def variante(self, archivo, aceptadas):
+        """
+        Para `archivo` (relativo a `static/dist/`) retorna (ruta, codificación)
+        del mejor archivo precomprimido que acepte el cliente, o (archivo, None).
+        """
+        aceptadas = _codificaciones_aceptadas(aceptadas)
+        for codificacion, sufijo in (("br", ".br"), ("gzip", ".gz")):
+            if codificacion in aceptadas and os.path.isfile(os.path.join(self.carpeta, archivo + sufijo)):
+                return archivo + sufijo, codificacion
+        return archivo, None
+
+
+if __name__ == "__main__":
+    carpeta = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
+    resultado = construir(carpeta)
+    print(f"{len(resultado)} archivos estáticos con huella en {os.path.join(carpeta, CARPETA_SALIDA)}")
@@ -0,0 +1,156 @@
+"""
+=========================================
+Métricas de ejecución de scripts
+-----------------------------------------
+Propósito:
+    Saber cuánto cuesta cada ejecución de /run para decidir qué
+    simulaciones optimizar y cómo dimensionar los trabajadores.
+
+Descripción:
+    - Por ejecución se registra: tiempo de reloj, CPU de usuario y de
+      sistema, RSS máximo, código de salida, bytes de salida y espera en cola.
+    - `prometheus()` produce el formato de texto de Prometheus
+      (contadores e histogramas por script).
+    - `resumen()` retorna un diccionario con los scripts más lentos.
+=========================================
+"""
+
+import threading
+
+# Límites superiores (segundos) de los histogramas de duración y espera
+LIMITES_SEGUNDOS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120)
+
+
+class _Histograma:
+    def __init__(self, limites):
+        self.limites = limites
+        self.cubetas = [0] * len(limites)
+        self.suma = 0.0
+        self.cuenta = 0
+
+    def observar(self, valor):
+        self.suma += valor
+        self.cuenta += 1
+        for i, limite in enumerate(self.limites):
+            if valor <= limite:
+                self.cubetas[i] += 1
+                break
+
+    def lineas(self, nombre, etiquetas):
+        acumulado = 0
+        for limite, cantidad in zip(self.limites, self.cubetas):
+            acumulado += cantidad
+            yield f'{nombre}_bucket{{{etiquetas},le="{limite}"}} {acumulado}'
+        yield f'{nombre}_bucket{{{etiquetas},le="+Inf"}} {self.cuenta}'
+        yield f"{nombre}_sum{{{etiquetas}}} {self.suma:.6f}"
+        yield f"{nombre}_count{{{etiquetas}}} {self.cuenta}"
+
+
+class _MetricasScript:
+    def __init__(self):
+        self.ejecuciones = {}  # código de salida -> cantidad
+        self.aciertos_cache = 0
+        self.duracion = _Histograma(LIMITES_SEGUNDOS)
+        self.espera = _Histograma(LIMITES_SEGUNDOS)
+        self.cpu_usuario = 0.0
+        self.cpu_sistema = 0.0
+        self.rss_max_bytes = 0
+        self.bytes_salida = 0
+        self.duracion_max = 0.0
+
+
+def _etiqueta(valor):
+    """Escapa un valor de etiqueta según el formato de Prometheus."""
+    return str(valor).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class RegistroMetricas:
+    """Acumula métricas por script (seguro entre hilos)."""
+
+    def __init__(self):
+        self._scripts = {}
+        self._lock = threading.Lock()
+
+    def _script(self, nombre):
+        if nombre not in self._scripts:
+            self._scripts[nombre] = _MetricasScript()
+        return self._scripts[nombre]
+
+    def registrar(self, nombre, duracion, codigo, bytes_salida, espera=0.0, recursos=None):
+        """Registra una ejecución real de `nombre`."""
+        with self._lock:
+            m = self._script(nombre)
+            m.ejecuciones[codigo] = m.ejecuciones.get(codigo, 0) + 1
+            m.duracion.observar(duracion)
+            m.espera.observar(espera)
+            m.duracion_max = max(m.duracion_max, duracion)
+            m.bytes_salida += bytes_salida
+            if recursos:
+                m.cpu_usuario += recursos["cpu_usuario"]
+                m.cpu_sistema += recursos["cpu_sistema"]
+                m.rss_max_bytes = max(m.rss_max_bytes, recursos["rss_max_bytes"])
+
+    def registrar_acierto_cache(self, nombre):
+        with self._lock:
+            self._script(nombre).aciertos_cache += 1
+
+    def prometheus(self):
+        """Texto en formato de exposición de Prometheus."""
+        lineas = []
+        with self._lock:
+            scripts = sorted(self._scripts.items())
+
+            def serie(nombre, tipo, ayuda, valores):
+                lineas.append(f"# HELP {nombre} {ayuda}")
+                lineas.append(f"# TYPE {nombre} {tipo}")
+                lineas.extend(valores)
+
+            serie("dashboard_ejecuciones_total", "counter", "Ejecuciones de scripts por código de salida.", [
+                f'dashboard_ejecuciones_total{{script="{_etiqueta(s)}",codigo="{c}"}} {n}'
+                for s, m in scripts for c, n in sorted(m.ejecuciones.items())
+            ])
+            serie("dashboard_cache_aciertos_total", "counter", "Ejecuciones servidas desde la caché.", [
+                f'dashboard_cache_aciertos_total{{script="{_etiqueta(s)}"}} {m.aciertos_cache}' for s, m in scripts
+            ])
+            serie("dashboard_duracion_segundos", "histogram", "Tiempo de reloj por ejecución.", [
+                l for s, m in scripts for l in m.duracion.lineas("dashboard_duracion_segundos", f'script="{_etiqueta(s)}"')
+            ])
+            serie("dashboard_espera_segundos", "histogram", "Espera en cola antes de ejecutar.", [
+                l for s, m in scripts for l in m.espera.lineas("dashboard_espera_segundos", f'script="{_etiqueta(s)}"')
+            ])
+            serie("dashboard_cpu_usuario_segundos_total", "counter", "CPU de usuario consumida.", [
+                f'dashboard_cpu_usuario_segundos_total{{script="{_etiqueta(s)}"}} {m.cpu_usuario:.6f}' for s, m in scripts
+            ])
+            serie("dashboard_cpu_sistema_segundos_total", "counter", "CPU de sistema consumida.", [
+                f'dashboard_cpu_sistema_segundos_total{{script="{_etiqueta(s)}"}} {m.cpu_sistema:.6f}' for s, m in scripts
+            ])
+            serie("dashboard_rss_maximo_bytes", "gauge", "Mayor RSS observado en una ejecución.", [
+                f'dashboard_rss_maximo_bytes{{script="{_etiqueta(s)}"}} {m.rss_max_bytes}' for s, m in scripts
+            ])
+            serie("dashboard_salida_bytes_total", "counter", "Bytes escritos en la salida estándar.", [
+                f'dashboard_salida_bytes_total{{script="{_etiqueta(s)}"}} {m.bytes_salida}' for s, m in scripts
+            ])
+        return "\n".join(lineas) + "\n"
+
+    def resumen(self, limite=10):
+        """Scripts ordenados por duración media (los más lentos primero)."""
+        with self._lock:
+            filas = []
+            for nombre, m in self._scripts.items():
+                n = m.duracion.cuenta
+                if not n:
+                    continue
+                filas.append({
+                    "script": nombre,
+                    "ejecuciones": n,
+                    "errores": sum(c for codigo, c in m.ejecuciones.items() if codigo != 0),
+                    "aciertos_cache": m.aciertos_cache,
+                    "duracion_media": m.duracion.suma / n,
+                    "duracion_max": m.duracion_max,
+                    "espera_media": m.espera.suma / n,
+                    "cpu_media": (m.cpu_usuario + m.cpu_sistema) / n,
+                    "rss_max_bytes": m.rss_max_bytes,
+                    "bytes_salida_medio": m.bytes_salida / n,
+                })
+        filas.sort(key=lambda f: f["duracion_media"], reverse=True)
+        return {"mas_lentos": filas[:limite]}
@@ -0,0 +1,378 @@
+"""
+=========================================
+Pool de intérpretes precalentados
+-----------------------------------------
+Propósito:
+    Evitar que cada clic en "Ejecutar" pague el arranque completo de
+    Python más la importación de numpy, scipy, matplotlib y pandas.
+
+Descripción:
+    - Se mantienen `tamano` procesos trabajadores de larga vida que ya
+      tienen importadas las librerías pesadas.
+    - Cada script se ejecuta en un hijo bifurcado (fork) del trabajador,
+      de modo que parte de un estado limpio y no contamina al trabajador.
+    - La salida estándar del hijo se captura a nivel de descriptor, igual
+      que con `subprocess.check_output`.
+    - Un trabajador se recicla después de `max_ejecuciones` scripts.
+    - En plataformas sin `os.fork` se usa un subproceso normal.
+=========================================
+"""
+
+import atexit
+import codecs
+import importlib
+import multiprocessing
+import os
+import queue
+import runpy
+import signal
+import subprocess
+import sys
+import threading
+import time
+import traceback
+
+# Librerías que se importan una sola vez en cada trabajador
+LIBRERIAS_PRECARGADAS = (
+    "numpy",
+    "scipy",
+    "scipy.stats",
+    "matplotlib",
+    "matplotlib.pyplot",
+    "pandas",
+)
+
+
+def _precargar_librerias():
+    """Importa las librerías pesadas (las que falten se ignoran)."""
+    os.environ.setdefault("MPLBACKEND", "Agg")
+    for nombre in LIBRERIAS_PRECARGADAS:
+        try:
+            importlib.import_module(nombre)
+        except ImportError:
+            pass
+
+
+def _codigo_de_salida(exc):
+    """Traduce un SystemExit al código que devolvería el intérprete."""
+    if exc.code is None:
+        return 0
+    if isinstance(exc.code, int):
+        return exc.code
+    print(exc.code, file=sys.stderr)
+    return 1
+
+
+def _ejecutar_en_hijo(ruta, directorio, escritura):
+    """Cuerpo del proceso hijo bifurcado. Nunca retorna."""
+    codigo = 1
+    try:
+        os.dup2(escritura, 1)
+        os.close(escritura)
+        if directorio:
+            os.chdir(directorio)
+        sys.stdout.reconfigure(line_buffering=True)
+        sys.argv = [ruta]
+        sys.path.insert(0, os.path.dirname(ruta))
+        try:
+            runpy.run_path(ruta, run_name="__main__")
+            codigo = 0
+        except SystemExit as e:
+            codigo = _codigo_de_salida(e)
+        except BaseException:
+            traceback.print_exc()
+        sys.stdout.flush()
+        sys.stderr.flush()
+    finally:
+        os._exit(codigo)
+
+
+def _ejecutar_aislado(ruta, directorio, conexion):
+    """
+    Bifurca el trabajador, ejecuta `ruta` en el hijo y reenvía por `conexion`
+    ("inicio", pid), luego ("salida", bytes) a medida que llega y, al final,
+    ("fin", (codigo, recursos)) con el uso de CPU y memoria del hijo.
+    """
+    lectura, escritura = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.close(lectura)
+        _ejecutar_en_hijo(ruta, directorio, escritura)
+
+    os.close(escritura)
+    completo = False
+    try:
+        conexion.send(("inicio", pid))
+        for bloque in iter(lambda: os.read(lectura, 65536), b""):
+            conexion.send(("salida", bloque))
+        completo = True
+    finally:
+        os.close(lectura)
+        if not completo:
+            _matar(pid)
+        _, estado, uso = os.wait4(pid, 0)
+    recursos = {
+        "cpu_usuario": uso.ru_utime,
+        "cpu_sistema": uso.ru_stime,
+        # ru_maxrss está en KiB en Linux y en bytes en macOS
+        "rss_max_bytes": uso.ru_maxrss if sys.platform == "darwin" else uso.ru_maxrss * 1024,
+    }
+    conexion.send(("fin", (os.waitstatus_to_exitcode(estado), recursos)))
+
+
+def _matar(pid):
+    """Envía SIGKILL a `pid` si todavía existe."""
+    try:
+        os.kill(pid, getattr(signal, "SIGKILL", signal.SIGTERM))
+    except ProcessLookupError:
+        pass
+
+
+def _bucle_trabajador(conexion):
+    """Bucle principal de un trabajador: recibe rutas y devuelve salidas."""
+    _precargar_librerias()
+    try:
+        conexion.send(("listo", None))
+    except OSError:
+        return
+    while True:
+        try:
+            peticion = conexion.recv()
+        except EOFError:
+            break
+        if peticion is None:
+            break
+        try:
+            _ejecutar_aislado(*peticion, conexion)
+        except OSError:
+            # El pool cerró la conexión (ejecución abandonada o cancelada)
+            break
+
+
+class ControlEjecucion:
+    """
+    Permite cancelar una ejecución desde otro hilo.
+
+    Se pasa a `PoolInterpretes.ejecutar_flujo`; al llamar `cancelar()` el
+    proceso del script recibe SIGKILL (o no llega a iniciarse).
+
+    Al terminar la ejecución también informa:
+        espera (float): segundos esperando un trabajador libre (más la espera
+            previa que haya sumado quien creó el control).
+        recursos (dict | None): cpu_usuario, cpu_sistema (s) y
+            rss_max_bytes del proceso del script.
+    """
+
+    def __init__(self):
+        self.cancelado = False
+        self.espera = 0.0
+        self.recursos = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def _asignar(self, pid):
+        with self._lock:
+            self._pid = pid
+            if self.cancelado:
+                _matar(pid)
+
+    def _liberar(self):
+        with self._lock:
+            self._pid = None
+
+    def cancelar(self):
+        with self._lock:
+            self.cancelado = True
+            if self._pid is not None:
+                _matar(self._pid)
+
+
+class _Trabajador:
+    """Proceso de larga vida con las librerías ya importadas."""
+
+    def __init__(self, contexto):
+        self.conexion, extremo_hijo = contexto.Pipe()
+        self.proceso = contexto.Process(target=_bucle_trabajador, args=(extremo_hijo,), daemon=True)
+        self.proceso.start()
+        extremo_hijo.close()
+        self.ejecuciones = 0
+        self.pid_hijo = None
+        self.listo = False
+
+    def esperar_listo(self):
+        """Bloquea hasta que el trabajador termine de precargar las librerías."""
+        if not self.listo:
+            self.conexion.recv()
+            self.listo = True
+
+    def ejecutar(self, ruta, directorio, control):
+        """Genera los mensajes ("salida", bytes) y ("fin", codigo) del script."""
+        self.ejecuciones += 1
+        self.conexion.send((ruta, directorio))
+        while True:
+            tipo, valor = self.conexion.recv()
+            if tipo == "inicio":
+                self.pid_hijo = valor
+                control._asignar(valor)
+                continue
+            if tipo == "fin":
+                self.pid_hijo = None
+                control._liberar()
+                valor, control.recursos = valor
+            yield tipo, valor
+            if tipo == "fin":
+                return
+
+    def cerrar(self, forzar=False):
+        if forzar and self.pid_hijo is not None:
+            _matar(self.pid_hijo)
+        try:
+            if not forzar:
+                self.conexion.send(None)
+        except (OSError, ValueError):
+            pass
+        self.conexion.close()
+        self.proceso.join(timeout=1 if forzar else 5)
+        if self.proceso.is_alive():
+            self.proceso.kill()
+            self.proceso.join()
+
+
+class PoolInterpretes:
+    """
+    Pool de trabajadores precalentados.
+
+    Parámetros:
+        tamano (int): número de trabajadores (ejecuciones simultáneas).
+        max_ejecuciones (int): scripts que ejecuta un trabajador antes de
+            ser reemplazado por uno nuevo.
+    """
+
+    def __init__(self, tamano=2, max_ejecuciones=50):
+        if tamano <= 0 or max_ejecuciones <= 0:
+            raise ValueError("tamano y max_ejecuciones deben ser positivos.")
+        self.tamano = tamano
+        self.max_ejecuciones = max_ejecuciones
+        self._contexto = multiprocessing.get_context("spawn")
+        self._libres = queue.Queue()
+        self._todos = []
+        self._lock = threading.Lock()
+        self._iniciado = False
+
+    @staticmethod
+    def disponible():
+        """Indica si la plataforma permite bifurcar procesos."""
+        return hasattr(os, "fork")
+
+    def _iniciar(self):
+        with self._lock:
+            if self._iniciado:
+                return
+            for _ in range(self.tamano):
+                self._agregar_trabajador()
+            self._iniciado = True
+            atexit.register(self.cerrar)
+
+    def _agregar_trabajador(self):
+        trabajador = _Trabajador(self._contexto)
+        self._todos.append(trabajador)
+        self._libres.put(trabajador)
+
+    def _reemplazar(self, trabajador, forzar=False):
+        trabajador.cerrar(forzar)
+        with self._lock:
+            self._todos.remove(trabajador)
+            self._agregar_trabajador()
+
+    def ejecutar(self, ruta, control=None, directorio=None):
+        """
+        Ejecuta el script `ruta` y retorna (codigo_salida, salida_estandar).
+        """
+        partes = []
+        for tipo, valor in self.ejecutar_flujo(ruta, control, directorio):
+            if tipo == "salida":
+                partes.append(valor)
+            else:
+                return valor, "".join(partes)
+
+    def ejecutar_flujo(self, ruta, control=None, directorio=None):
+        """
+        Ejecuta el script `ruta` generando ("salida", texto) a medida que el
+        script escribe y, al terminar, ("fin", codigo_salida).
+
+        `control` (ControlEjecucion) permite cancelar desde otro hilo; un
+        script cancelado termina con código -9. Si el consumidor abandona el
+        generador antes del final, el trabajador y su hijo se descartan.
+
+        `directorio` es el directorio de trabajo del script (por defecto, el
+        del servidor).
+        """
+        control = control or ControlEjecucion()
+        if not self.disponible():
+            yield from _ejecutar_subproceso(ruta, control, directorio)
+            return
+        if not self._iniciado:
+            self._iniciar()
+
+        decodificador = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        inicio_espera = time.perf_counter()
+        trabajador = self._libres.get()
+        try:
+            trabajador.esperar_listo()
+        except (EOFError, OSError):
+            self._reemplazar(trabajador, forzar=True)
+            yield "salida", "Error en el trabajador del pool: no pudo iniciarse."
+            yield "fin", 1
+            return
+        control.espera += time.perf_counter() - inicio_espera
+        if control.cancelado:
+            self._libres.put(trabajador)
+            yield "fin", -signal.SIGKILL
+            return
+        codigo = None
+        try:
+            for tipo, valor in trabajador.ejecutar(ruta, directorio, control):
+                if tipo == "fin":
+                    codigo = valor
+                    break
+                texto = decodificador.decode(valor)
+                if texto:
+                    yield "salida", texto
+        except (EOFError, OSError) as e:
+            # El trabajador murió: se informa el error y se reemplaza abajo
+            yield "salida", f"Error en el trabajador del pool: {e}"
+        finally:
+            if codigo is None:
+                self._reemplazar(trabajador, forzar=True)
+            elif trabajador.ejecuciones >= self.max_ejecuciones:
+                self._reemplazar(trabajador)
+            else:
+                self._libres.put(trabajador)
+
+        resto = decodificador.decode(b"", final=True)
+        if resto:
+            yield "salida", resto
+        yield "fin", 1 if codigo is None else codigo
+
+    def cerrar(self):
+        """Detiene todos los trabajadores."""
+        with self._lock:
+            for trabajador in self._todos:
+                trabajador.cerrar()
+            self._todos.clear()
+            self._iniciado = False
+
+
+def _ejecutar_subproceso(ruta, control, directorio):
+    """Alternativa sin fork: un intérprete nuevo por ejecución."""
+    proceso = subprocess.Popen([sys.executable, "-u", ruta], stdout=subprocess.PIPE, text=True, cwd=directorio)
+    control._asignar(proceso.pid)
+    try:
+        for linea in proceso.stdout:
+            yield "salida", linea
+    finally:
+        proceso.stdout.close()
+        if proceso.poll() is None:
+            proceso.kill()
+        control._liberar()
+    yield "fin", proceso.wait()
@@ -0,0 +1,276 @@
+"""
+=========================================
+API de simulaciones en proceso
+-----------------------------------------
+Propósito:
+    Llamar directamente a las funciones de `codigos/` que ya retornan
+    diccionarios, sin lanzar un proceso ni leer texto impreso.
+
+Descripción:
+    - Cada simulación se registra con su módulo, su función y el esquema
+      de sus parámetros (tipo, valor por defecto, límites u opciones y
+      restricciones entre parámetros). Solo los parámetros que no cumplen
+      el esquema son errores del cliente (400); cualquier otra excepción
+      de la simulación es un error del servidor.
+    - Los módulos se cargan con el backend "Agg" de matplotlib (sin ventanas).
+    - Los módulos se importan una sola vez (se recargan si cambia el archivo).
+    - Los resultados se convierten a JSON: los DataFrame se envían por
+      columnas, los arreglos de numpy como listas y los valores no finitos
+      como null.
+=========================================
+"""
+
+import importlib.util
+import math
+import os
+import sys
+import threading
+
+import matplotlib
+
+
+class ErrorParametros(ValueError):
+    """Parámetros inválidos para una simulación."""
+
+
+class Parametro:
+    """Esquema de un parámetro: tipo, valor por defecto, límites inclusivos y opciones válidas."""
+
+    def __init__(self, tipo, defecto, minimo=None, maximo=None, descripcion="", opciones=None):
+        self.tipo = tipo
+        self.defecto = defecto
+        self.minimo = minimo
+        self.maximo = maximo
+        self.descripcion = descripcion
+        self.opciones = opciones
+
+    def convertir(self, nombre, valor):
+        if valor is None or valor == "":
+            return self.defecto
+        try:
+            if self.tipo is int and isinstance(valor, float) and not valor.is_integer():
+                raise ValueError
+            convertido = self.tipo(valor)
+        except (TypeError, ValueError):
+            raise ErrorParametros(f"'{nombre}' debe ser de tipo {self.tipo.__name__}.")
+        if isinstance(convertido, float) and not math.isfinite(convertido):
+            raise ErrorParametros(f"'{nombre}' debe ser finito.")
+        if self.minimo is not None and convertido < self.minimo:
+            raise ErrorParametros(f"'{nombre}' debe ser >= {self.minimo}.")
+        if self.maximo is not None and convertido > self.maximo:
+            raise ErrorParametros(f"'{nombre}' debe ser <= {self.maximo}.")
+        if self.opciones is not None and convertido not in self.opciones:
+            raise ErrorParametros(f"'{nombre}' debe ser uno de: {', '.join(self.opciones)}.")
+        return convertido
+
+    def a_dict(self):
+        return {
+            "tipo": self.tipo.__name__,
+            "defecto": self.defecto,
+            "minimo": self.minimo,
+            "maximo": self.maximo,
+            "descripcion": self.descripcion,
+            "opciones": list(self.opciones) if self.opciones is not None else None,
+        }
+
+
+class Simulacion:
+    """
+    Función de un módulo de `codigos/` expuesta en la API. `restricciones`
+    son pares (condición, mensaje) sobre los parámetros ya convertidos,
+    para los límites que dependen de más de un parámetro. `fijos` son
+    argumentos que la API siempre pasa y no expone (p. ej. mostrar=False).
+    """
+
+    def __init__(self, modulo, funcion, parametros, parametro_imagen=None, restricciones=(), fijos=None):
+        self.modulo = modulo
+        self.funcion = funcion
+        self.parametros = parametros
+        # Parámetro de la función con la ruta donde guarda su gráfico
+        self.parametro_imagen = parametro_imagen
+        self.restricciones = restricciones
+        self.fijos = fijos or {}
+
+    def validar(self, datos):
+        desconocidos = set(datos) - set(self.parametros)
+        if desconocidos:
+            raise ErrorParametros(f"Parámetros desconocidos: {', '.join(sorted(desconocidos))}.")
+        parametros = {n: p.convertir(n, datos.get(n)) for n, p in self.parametros.items()}
+        for condicion, mensaje in self.restricciones:
+            if not condicion(parametros):
+                raise ErrorParametros(mensaje)
+        return parametros
+
+    def a_dict(self):
+        return {
+            "modulo": self.modulo + ".py",
+            "parametros": {n: p.a_dict() for n, p in self.parametros.items()},
+        }
+
+
+# Nombres de codigos/generadores.GENERADORES y de codigos/bateria_pruebas.PRUEBAS
+_GENERADORES = ("numpy", "random", "lcg", "minstd", "cuadrados_medios")
+_PRUEBAS = ("frecuencias", "corridas", "series", "ks")
+
+# Fuente de números aleatorios (ver codigos/generadores.py); cada petición usa la suya
+_GENERADOR = Parametro(str, None, descripcion="Generador: numpy, random, lcg, minstd o cuadrados_medios",
+                       opciones=_GENERADORES)
+
+
+def _pruebas_validas(pruebas):
+    nombres = [p.strip() for p in pruebas.split(",") if p.strip()]
+    return bool(nombres) and all(nombre in _PRUEBAS for nombre in nombres)
+
+
+SIMULACIONES = {
+    "simulacion_colisiones": Simulacion("simulacion_monte_carlo_colision", "simulacion_colisiones", {
+        "N": Parametro(int, 10, 2, 1000, "Número de nodos transmisores"),
+        "delta": Parametro(float, 0.05, 1e-9, 1.0, "Ventana de colisión"),
+        "M": Parametro(int, 100000, 1, 2_000_000, "Simulaciones Monte Carlo"),
+        "seed": Parametro(int, None, 0, None, "Semilla"),
+        "generador": _GENERADOR,
+    }),
+    "caminata_aleatoria_2D": Simulacion("monte_carlo_prob_acumulada", "caminata_aleatoria_2D", {
+        "simulaciones": Parametro(int, 10000, 1, 1_000_000, "Número de caminatas"),
+        "movimientos": Parametro(int, 10, 0, 10_000, "Pasos por caminata"),
+        "condicion": Parametro(int, 2, 0, 10_000, "Distancia de Manhattan objetivo"),
+        "generador": _GENERADOR,
+    }),
+    "simular_MM1": Simulacion("monte_carlo_cafeteria", "simular_MM1", {
+        "lambd": Parametro(float, 20 / 60, 1e-9, None, "Tasa de llegadas"),
+        "mu": Parametro(float, 1 / 2, 1e-9, None, "Tasa de servicio"),
+        "iteraciones": Parametro(int, 500, 1, 2_000_000, "Clientes simulados"),
+        "generador": _GENERADOR,
+    }),
+    "simular_cola_banco": Simulacion("Teoria_colas_monte", "simular_cola_banco", {
+        "num_clientes": Parametro(int, 50, 1, 200_000, "Clientes simulados"),
+        "tasa_llegada": Parametro(float, 0.8, 1e-9, None, "Tasa de llegadas"),
+        "tasa_servicio": Parametro(float, 1.0, 1e-9, None, "Tasa de servicio"),
+        "generador": _GENERADOR,
+    }),
+    "simulacion_call_center": Simulacion("monte_carlo_centrodellamadas", "simulacion_call_center", {
+        "c_min": Parametro(int, 3, 1, 500, "Operadores mínimos a evaluar"),
+        "c_max": Parametro(int, 50, 1, 500, "Operadores máximos a evaluar"),
+        "umbral_segundos": Parametro(float, 30, 1e-9, None, "Espera máxima deseada (s)"),
+    }, restricciones=[(lambda p: p["c_min"] <= p["c_max"], "'c_min' debe ser <= 'c_max'.")]),
+    "simulacion_robot_recolector": Simulacion("simulacion_monte_rec_obj", "simulacion_robot_recolector", {
+        "filas": Parametro(int, 10, 1, 1000, "Filas de la cuadrícula"),
+        "columnas": Parametro(int, 10, 1, 1000, "Columnas de la cuadrícula"),
+        "p": Parametro(float, 0.1, 0.0, 1.0, "Probabilidad de objeto por celda"),
+        "movimientos": Parametro(int, 20, 0, 100_000, "Movimientos del robot"),
+        "M": Parametro(int, 10000, 1, 1_000_000, "Simulaciones Monte Carlo"),
+        "objetivo": Parametro(int, 5, 0, None, "Objetos a recolectar"),
+        "seed": Parametro(int, None, 0, None, "Semilla"),
+        "generador": _GENERADOR,
+    }),
+    "estimar_pi_montecarlo": Simulacion("monte_carlo_calculo_pi", "estimar_pi_montecarlo", {
+        "n": Parametro(int, 1000, 1, 5_000_000, "Puntos generados"),
+        "generador": _GENERADOR,
+    }, parametro_imagen="ruta_img"),
+    "calidad_semilla": Simulacion("cuadrados_medios_entero", "calidad_semilla", {
+        "semilla": Parametro(int, 5735, 0, None, "Semilla X0 (menor que 10^d)"),
+        "d": Parametro(int, 4, 1, 8, "Dígitos del método de cuadrados medios"),
+    }, restricciones=[(lambda p: p["semilla"] < 10 ** p["d"], "'semilla' debe ser menor que 10^d.")]),
+    "prueba_corridas": Simulacion("prueba_corridas_aleat", "prueba_corridas_generador", {
+        "n": Parametro(int, 100000, 2, 10_000_000, "Números generados (se prueban por bloques)"),
+        "generador": Parametro(str, "numpy", descripcion=_GENERADOR.descripcion, opciones=_GENERADORES),
+        "semilla": Parametro(int, None, 0, None, "Semilla"),
+        "alpha": Parametro(float, 0.05, 1e-6, 0.5, "Nivel de significancia"),
+    }),
+    "prueba_series": Simulacion("Prueba_series", "prueba_series_generador", {
+        "n": Parametro(int, 100000, 3, 20_000_000, "Números generados"),
+        "generador": Parametro(str, "numpy", descripcion=_GENERADOR.descripcion, opciones=_GENERADORES),
+        "semilla": Parametro(int, None, 0, None, "Semilla"),
+        "m": Parametro(int, None, 2, 100_000, "Intervalos por eje (por defecto n^(1/k))"),
+        "k": Parametro(int, 2, 1, 8, "Largo de las tuplas"),
+        "alpha": Parametro(float, 0.05, 1e-6, 0.5, "Nivel de significancia"),
+    }, parametro_imagen="ruta_grafico", restricciones=[
+        (lambda p: p["n"] >= p["k"], "'n' debe ser >= 'k'."),
+        (lambda p: p["m"] is None or p["m"] ** p["k"] < 1 << 63, "m^k debe ser menor que 2^63."),
+    ], fijos={"mostrar": False}),
+    "bateria_pruebas": Simulacion("bateria_pruebas", "bateria", {
+        "n": Parametro(int, 1_000_000, 3, 10_000_000, "Números generados (una sola pasada)"),
+        "generador": Parametro(str, "numpy", descripcion=_GENERADOR.descripcion, opciones=_GENERADORES),
+        "semilla": Parametro(int, None, 0, None, "Semilla"),
+        "alpha": Parametro(float, 0.05, 1e-6, 0.5, "Nivel de significancia"),
+        "pruebas": Parametro(str, "frecuencias,corridas,series,ks", descripcion="Pruebas separadas por comas"),
+    }, restricciones=[(lambda p: _pruebas_validas(p["pruebas"]),
+                       f"'pruebas' debe listar al menos una de: {', '.join(_PRUEBAS)}.")],
+        fijos={"mostrar": False}),
+}
+
+
+class CargadorModulos:
+    """Importa módulos de `carpeta` una sola vez (los recarga si cambia el archivo)."""
+
+    def __init__(self, carpeta):
+        # Antes de cargar cualquier módulo: sin ventanas en el servidor
+        matplotlib.use("Agg")
+        self.carpeta = carpeta
+        self._modulos = {}
+        self._lock = threading.Lock()
+        if carpeta not in sys.path:
+            sys.path.insert(0, carpeta)
+
+    def obtener(self, nombre):
+        ruta = os.path.join(self.carpeta, nombre + ".py")
+        mtime = os.stat(ruta).st_mtime_ns
+        with self._lock:
+            guardado = self._modulos.get(nombre)
+            if guardado and guardado[0] == mtime:
+                return guardado[1]
+            spec = importlib.util.spec_from_file_location(nombre, ruta)
+            modulo = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(modulo)
+            self._modulos[nombre] = (mtime, modulo)
+            return modulo
+
+
+def a_json(valor):
+    """Convierte recursivamente un resultado a tipos serializables en JSON."""
+    if isinstance(valor, dict):
+        return {str(k): a_json(v) for k, v in valor.items()}
+    if isinstance(valor, (list, tuple)):
+        # Atajo para listas largas de enteros o textos (no requieren conversión)
+        if all(type(v) in (int, str, bool) for v in valor):
+            return list(valor)
+        return [a_json(v) for v in valor]
+    if hasattr(valor, "columns") and hasattr(valor, "to_dict"):
+        # DataFrame: formato columnar, más compacto que una lista de filas
+        return {"columnas": [str(c) for c in valor.columns],
+                "datos": {str(k): a_json(v) for k, v in valor.to_dict(orient="list").items()}}
+    if hasattr(valor, "tolist"):
+        # Arreglos y escalares de numpy
+        return a_json(valor.tolist())
+    if isinstance(valor, float) and not math.isfinite(valor):
+        return None
+    return valor
+
+
+def ejecutar_simulacion(cargador, nombre, datos, almacen):
+    """
+    Valida `datos`, llama a la simulación `nombre` y retorna su resultado
+    convertido a JSON. Si la simulación guarda un gráfico, se escribe en una
+    carpeta propia y se publica en `almacen` (clave "artefactos").
+    Lanza KeyError si la simulación no existe y ErrorParametros si los
+    parámetros no cumplen el esquema; los errores de la simulación misma
+    se propagan sin cambios.
+    """
+    simulacion = SIMULACIONES[nombre]
+    parametros = simulacion.validar(datos)
+    funcion = getattr(cargador.obtener(simulacion.modulo), simulacion.funcion)
+
+    carpeta = None
+    if simulacion.parametro_imagen:
+        carpeta = almacen.crear_carpeta_ejecucion()
+        parametros[simulacion.parametro_imagen] = os.path.join(carpeta, "static", "img", nombre + ".png")
+    try:
+        resultado = funcion(**parametros, **simulacion.fijos)
+        if carpeta:
+            resultado["artefactos"] = almacen.publicar(almacen.leer_ejecucion(carpeta))
+            if resultado["artefactos"] and "ruta_imagen" in resultado:
+                resultado["ruta_imagen"] = resultado["artefactos"][0]["url"]
+    finally:
+        if carpeta:
+            almacen.eliminar_ejecucion(carpeta)
+    return a_json(resultado)
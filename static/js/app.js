@@ -81,22 +81,86 @@ function ejecutarPrograma(nombreArchivo) {
 }
 
 // Ejecutar programas Python sin recargar la página
+// La salida llega línea por línea (Server-Sent Events); si el navegador no
+// soporta EventSource o la conexión falla antes de recibir datos, se usa POST.
+// Muestra los archivos generados por la ejecución (imágenes en línea, el resto como enlace)
+function mostrarArtefactos(artefactos) {
+    const contenedor = document.getElementById("artefactos");
+    contenedor.innerHTML = "";
+    artefactos.forEach(artefacto => {
+        if (/\.(png|jpe?g|gif|svg)$/i.test(artefacto.nombre)) {
+            const imagen = document.createElement("img");
+            imagen.src = artefacto.url;
+            imagen.alt = artefacto.nombre;
+            contenedor.appendChild(imagen);
+        } else {
+            const enlace = document.createElement("a");
+            enlace.href = artefacto.url;
+            enlace.textContent = artefacto.nombre;
+            enlace.download = artefacto.nombre.split("/").pop();
+            contenedor.appendChild(enlace);
+        }
+    });
+}
+
+async function ejecutarConPost(archivo, salida) {
+    try {
+        const respuesta = await fetch(`/run/${archivo}`, { method: "POST" });
+        const data = await respuesta.json();
+        salida.textContent = data.salida;
+        mostrarArtefactos(data.artefactos || []);
+    } catch (error) {
+        salida.textContent = "Error al ejecutar el programa: " + error;
+    }
+}
+
+function ejecutarEnVivo(archivo, salida) {
+    if (!window.EventSource) {
+        ejecutarConPost(archivo, salida);
+        return;
+    }
+
+    const fuente = new EventSource(`/run/${encodeURIComponent(archivo)}/stream`);
+    let recibido = false;
+
+    fuente.onmessage = (e) => {
+        if (!recibido) {
+            salida.textContent = "";
+            recibido = true;
+        }
+        salida.appendChild(document.createTextNode(e.data + "\n"));
+    };
+
+    fuente.addEventListener("artefactos", (e) => {
+        mostrarArtefactos(JSON.parse(e.data));
+    });
+
+    fuente.addEventListener("fin", (e) => {
+        fuente.close();
+        const fin = JSON.parse(e.data);
+        if (!recibido && fin.codigo !== 0) {
+            salida.textContent = `El programa terminó con código de salida ${fin.codigo}.`;
+        }
+    });
+
+    fuente.onerror = () => {
+        fuente.close();
+        if (!recibido) {
+            ejecutarConPost(archivo, salida);
+        }
+    };
+}
+
 document.addEventListener("DOMContentLoaded", () => {
     const botones = document.querySelectorAll(".btn-ejecutar");
     const salida = document.getElementById("salida");
 
     botones.forEach(boton => {
-        boton.addEventListener("click", async () => {
+        boton.addEventListener("click", () => {
             const archivo = boton.dataset.archivo;
             salida.textContent = "Ejecutando " + archivo + "...\n";
-
-            try {
-                const respuesta = await fetch(`/run/${archivo}`, { method: "POST" });
-                const data = await respuesta.json();
-                salida.textContent = data.salida;
-            } catch (error) {
-                salida.textContent = "Error al ejecutar el programa: " + error;
-            }
+            mostrarArtefactos([]);
+            ejecutarEnVivo(archivo, salida);
         });
     });
 });
@@ -0,0 +1,49 @@
+import os
+import sys
+
+import pytest
+
+os.environ.setdefault("MPLBACKEND", "Agg")
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CODIGOS = os.path.join(RAIZ, "codigos")
+for ruta in (RAIZ, CODIGOS):
+    if ruta not in sys.path:
+        sys.path.insert(0, ruta)
+
+
+@pytest.fixture(scope="session")
+def aplicacion(tmp_path_factory):
+    """app.py con la caché y los artefactos en una carpeta temporal."""
+    carpeta = tmp_path_factory.mktemp("servidor")
+    os.environ["ARTEFACTOS"] = str(carpeta / "artefactos")
+    os.environ["CACHE_RESULTADOS"] = str(carpeta / "resultados")
+    os.environ.setdefault("POOL_TAMANO", "1")
+    import app
+    return app
+
+
+@pytest.fixture
+def cliente(aplicacion):
+    return aplicacion.app.test_client()
+
+
+@pytest.fixture
+def scripts(aplicacion, tmp_path, monkeypatch):
+    """
+    Carpeta de scripts propia para /run: retorna crear(nombre, fuente).
+    La caché de resultados y las métricas también son nuevas.
+    """
+    from cache_resultados import CacheResultados
+    from metricas import RegistroMetricas
+
+    carpeta = tmp_path / "codigos"
+    carpeta.mkdir()
+    monkeypatch.setattr(aplicacion, "RUTA_CODIGOS", str(carpeta))
+    monkeypatch.setattr(aplicacion, "cache", CacheResultados(str(carpeta), str(tmp_path / "resultados")))
+    monkeypatch.setattr(aplicacion, "metricas", RegistroMetricas())
+
+    def crear(nombre, fuente):
+        (carpeta / nombre).write_text(fuente, encoding="utf-8")
+        return nombre
+    return crear
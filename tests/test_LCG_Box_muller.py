@@ -0,0 +1,31 @@
+import numpy as np
+
+from LCG_Box_muller import Aleatorio
+
+
+def test_saltar_equivale_a_generar():
+    generador = Aleatorio(12345, 10)
+    completa = generador.lcg(1000)
+    generador.saltar(700)
+    assert generador.lcg(300) == completa[700:]
+
+
+def test_subflujos_reproducen_la_secuencia():
+    generador = Aleatorio(12345, 10)
+    completa = generador.lcg(1001)
+    partes = []
+    for k in range(4):
+        subflujo, cantidad = generador.subflujo(1001, k, 4)
+        partes += subflujo.lcg(cantidad)
+    assert partes == completa
+    assert generador.seed == 12345
+
+
+def test_bloques_normales_igual_a_generar_normal():
+    generador = Aleatorio(777, 5001)
+    completa = np.array(generador.generar_normal())
+    por_bloques = np.concatenate(list(generador.bloques_normales(tamano=1000)))
+    assert len(completa) == 5001 + 5001 // 2
+    np.testing.assert_allclose(por_bloques, completa, rtol=0, atol=1e-12)
+    assert abs(completa.mean()) < 1e-12
+    assert abs(completa.std() - 1) < 1e-12
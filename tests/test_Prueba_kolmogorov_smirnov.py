@@ -0,0 +1,74 @@
+import numpy as np
+import pytest
+from scipy import stats
+
+import Prueba_kolmogorov_smirnov as ks
+
+DISTRIBUCIONES_SCIPY = {
+    "weibull": lambda forma, escala: stats.weibull_min(forma, scale=escala),
+    "normal": lambda mu, sigma: stats.norm(mu, sigma),
+    "exponencial": lambda escala: stats.expon(scale=escala),
+    "uniforme": lambda a, b: stats.uniform(a, b - a),
+}
+
+
+@pytest.fixture
+def datos():
+    return 5.19 * np.random.default_rng(11).weibull(1.38, 3000)
+
+
+@pytest.mark.parametrize("nombre", list(ks.DISTRIBUCIONES))
+def test_igual_a_scipy_kstest(datos, nombre):
+    resultado = ks.prueba_ks(datos, nombre, mostrar=False)["resultados"][nombre]
+    esperado = stats.kstest(datos, DISTRIBUCIONES_SCIPY[nombre](*resultado["parametros"].values()).cdf,
+                            method="exact")
+    assert resultado["D"] == pytest.approx(esperado.statistic, abs=1e-12)
+    assert resultado["p_valor"] == pytest.approx(esperado.pvalue, rel=1e-6, abs=1e-300)
+
+
+def test_estimacion_weibull_igual_a_scipy(datos):
+    forma, _, escala = stats.weibull_min.fit(datos, floc=0)
+    assert ks.estimar_weibull(np.sort(datos)) == pytest.approx((forma, escala), rel=1e-5)
+
+
+def test_por_bloques_igual_a_completo(datos):
+    ordenados = np.sort(datos)
+    cdf = lambda x: ks.cdf_weibull(x, 1.38, 5.19)
+    assert ks.estadistico_ks(ordenados, cdf, tamano=97) == ks.estadistico_ks(ordenados, cdf)
+
+
+def test_muestra_constante():
+    with pytest.raises(ValueError):
+        ks.prueba_ks(np.full(50, 3.0), mostrar=False)
+
+
+@pytest.mark.parametrize("nombre, parametros", [
+    ("normal", (0.0, 0.0)), ("uniforme", (1.0, 1.0)), ("exponencial", (np.nan,)), ("weibull", (1.0, -2.0)),
+])
+def test_parametros_degenerados(nombre, parametros):
+    resultados = ks.prueba_ks_ordenados(np.linspace(0.1, 0.9, 20), (nombre, "uniforme"),
+                                        parametros={nombre: parametros})
+    assert "error" in resultados[nombre]
+    with pytest.raises(ValueError):
+        ks.KSEnLinea(nombre, parametros)
+
+
+def test_en_linea_acota_al_exacto():
+    datos = np.random.default_rng(4).random(20_000)
+    en_linea = ks.KSEnLinea(clases=4096)
+    for bloque in np.array_split(datos, 3):
+        en_linea.agregar(bloque)
+    D_minimo, D = en_linea.estadistico()
+    exacto = stats.kstest(datos, "uniform").statistic
+    assert D_minimo <= exacto <= D <= exacto + 1 / 4096
+
+
+def test_en_linea_valor_a_valor_igual_a_bloque():
+    datos = np.random.default_rng(6).normal(2.0, 3.0, 5000)
+    por_bloque = ks.KSEnLinea("normal", (2.0, 3.0), clases=256)
+    por_bloque.agregar(datos)
+    por_valor = ks.KSEnLinea("normal", (2.0, 3.0), clases=256)
+    for x in datos:
+        por_valor.agregar_valor(x)
+    np.testing.assert_array_equal(por_valor.conteos, por_bloque.conteos)
+    assert por_valor.resultado() == por_bloque.resultado()
@@ -0,0 +1,121 @@
+import numpy as np
+import pytest
+
+import Prueba_series as ps
+from archivos_muestra import guardar_muestra
+
+
+@pytest.fixture
+def datos():
+    return np.random.default_rng(7).random(50_001)
+
+
+def conteo_completo(datos, m, k, solapados):
+    conteo = ps.ConteoSeries(m, k, solapados)
+    conteo.agregar(datos)
+    return conteo
+
+
+@pytest.mark.parametrize("k, solapados", [(2, True), (3, True), (3, False), (4, False)])
+def test_por_bloques_igual_a_completo(datos, k, solapados):
+    completo = conteo_completo(datos, 10, k, solapados)
+    por_bloques = ps.ConteoSeries(10, k, solapados)
+    for i in range(0, len(datos), 997):
+        por_bloques.agregar(datos[i:i + 997])
+    assert por_bloques.tuplas == completo.tuplas
+    np.testing.assert_array_equal(por_bloques.conteos, completo.conteos)
+
+
+@pytest.mark.parametrize("k, solapados", [(2, True), (3, True), (2, False), (3, False)])
+@pytest.mark.parametrize("partes", [1, 2, 5])
+def test_tramos_cubren_las_tuplas(datos, k, solapados, partes):
+    total = ps.ConteoSeries(10, k, solapados)
+    for a, b in ps._tramos(len(datos), k, solapados, partes):
+        total.combinar(conteo_completo(datos[a:b], 10, k, solapados))
+    completo = conteo_completo(datos, 10, k, solapados)
+    assert total.tuplas == completo.tuplas
+    np.testing.assert_array_equal(total.conteos, completo.conteos)
+
+
+@pytest.mark.parametrize("nombre", ["serie.npy", "serie.f64", "serie.txt"])
+def test_archivo_igual_a_memoria(tmp_path, datos, nombre):
+    ruta = str(tmp_path / nombre)
+    guardar_muestra(ruta, datos, decimales=17)
+    conteo = ps.contar_archivo(ruta, m=20, k=2, procesos=1, tamano=4096)
+    completo = conteo_completo(datos, 20, 2, True)
+    assert conteo.n == len(datos)
+    np.testing.assert_array_equal(conteo.conteos, completo.conteos)
+
+
+def test_archivo_en_paralelo(tmp_path, datos):
+    ruta = str(tmp_path / "serie.npy")
+    guardar_muestra(ruta, datos)
+    resultado = ps.prueba_series_archivo(ruta, m=10, k=3, procesos=2)
+    esperado = conteo_completo(datos, 10, 3, True).resultado(mostrar=False)
+    assert resultado["tuplas"] == esperado["tuplas"]
+    assert resultado["chi2_calc"] == pytest.approx(esperado["chi2_calc"])
+
+
+def chi_cuadrado_lazo(datos, m, k):
+    """χ² de las k-tuplas solapadas con el conteo valor a valor (antes de vectorizar)."""
+    conteos = {}
+    for i in range(len(datos) - k + 1):
+        celda = tuple(min(int(x * m), m - 1) for x in datos[i:i + k])
+        conteos[celda] = conteos.get(celda, 0) + 1
+    tuplas = len(datos) - k + 1
+    E = tuplas / m ** k
+    vacias = m ** k - len(conteos)
+    return sum((O - E) ** 2 / E for O in conteos.values()) + vacias * E
+
+
+@pytest.mark.parametrize("m, k", [(5, 2), (4, 3), (3, 4)])
+def test_chi_cuadrado_igual_al_lazo(datos, m, k):
+    muestra = datos[:2000]
+    resultado = ps.prueba_series(muestra, m=m, k=k, ruta_grafico=None)
+    assert resultado["chi2_calc"] == pytest.approx(chi_cuadrado_lazo(muestra, m, k))
+    assert resultado["gl"] == m ** k - 1
+
+
+def test_valor_critico_y_p_de_scipy(datos):
+    from scipy.stats import chi2
+    resultado = ps.prueba_series(datos, alpha=0.01, m=10, ruta_grafico=None)
+    assert resultado["chi2_crit"] == pytest.approx(chi2.ppf(0.99, 99))
+    assert resultado["p_valor"] == pytest.approx(chi2.sf(resultado["chi2_calc"], 99))
+
+
+def test_disperso_igual_a_denso(datos, monkeypatch):
+    denso = ps.prueba_series(datos, m=30, k=3, ruta_grafico=None)
+    monkeypatch.setattr(ps, "CELDAS_DENSAS_MAX", 0)
+    conteo = ps.ConteoSeries(30, 3)
+    conteo.agregar(datos[:20_000])
+    for x in datos[20_000:20_500]:
+        conteo.agregar_valor(x)
+    conteo.agregar(datos[20_500:])
+    assert conteo.disperso
+    assert conteo.chi_cuadrado() == pytest.approx(denso["chi2_calc"])
+
+
+def test_generador_sin_grados_de_libertad():
+    resultado = ps.prueba_series_generador(n=100, semilla=1, m=1, k=2, ruta_grafico=None)
+    assert resultado["p_valor"] is None
+    assert "p = -." in resultado["mensaje"]
+
+
+@pytest.mark.parametrize("k, solapados", [(2, True), (3, True), (2, False), (3, False)])
+def test_valor_a_valor_igual_a_bloque(datos, k, solapados):
+    completo = conteo_completo(datos[:3001], 10, k, solapados)
+    mezclado = ps.ConteoSeries(10, k, solapados)
+    mezclado.agregar(datos[:1000])
+    for x in datos[1000:2001]:
+        mezclado.agregar_valor(x)
+    mezclado.agregar(datos[2001:3001])
+    assert (mezclado.n, mezclado.tuplas) == (completo.n, completo.tuplas)
+    np.testing.assert_array_equal(mezclado.conteos, completo.conteos)
+
+
+def test_mostrar(datos, capsys):
+    ps.prueba_series(datos[:1000], m=5, ruta_grafico=None, mostrar=False)
+    ps.prueba_series_generador(n=1000, semilla=1, m=5, ruta_grafico=None, mostrar=False)
+    assert capsys.readouterr().out == ""
+    ps.prueba_series(datos[:1000], m=5, ruta_grafico=None)
+    assert "PRUEBA DE SERIES" in capsys.readouterr().out
@@ -0,0 +1,86 @@
+import json
+import time
+
+
+def eventos(respuesta):
+    """Lista de (tipo, datos) de una respuesta SSE."""
+    resultado = []
+    for bloque in respuesta.get_data(as_text=True).split("\n\n"):
+        if not bloque:
+            continue
+        tipo, datos = "message", []
+        for linea in bloque.split("\n"):
+            if linea.startswith("event: "):
+                tipo = linea[len("event: "):]
+            elif linea.startswith("data: "):
+                datos.append(linea[len("data: "):])
+        resultado.append((tipo, "\n".join(datos)))
+    return resultado
+
+
+def test_stream_linea_por_linea(cliente, scripts):
+    nombre = scripts("lineas.py", "import sys, random\nrandom.random()\n"
+                                  "sys.stdout.write('uno\\ndo')\nsys.stdout.flush()\nprint('s\\ntres', end='')\n")
+    respuesta = cliente.get(f"/run/{nombre}/stream")
+    assert respuesta.mimetype == "text/event-stream"
+    assert respuesta.headers["Cache-Control"] == "no-cache"
+    lista = eventos(respuesta)
+    assert lista[:3] == [("message", "uno"), ("message", "dos"), ("message", "tres")]
+    assert lista[3][0] == "artefactos"
+    assert lista[-1] == ("fin", json.dumps({"codigo": 0, "cache": False}))
+
+
+def test_stream_desde_cache(cliente, scripts):
+    nombre = scripts("fijo.py", "print('a')\nprint('b')\n")
+    cliente.get(f"/run/{nombre}/stream").get_data()
+    lista = eventos(cliente.get(f"/run/{nombre}/stream"))
+    assert lista[:2] == [("message", "a"), ("message", "b")]
+    assert json.loads(lista[-1][1]) == {"codigo": 0, "cache": True}
+
+
+def test_stream_codigo_de_error(cliente, scripts):
+    nombre = scripts("falla.py", "import sys\nprint('antes')\nsys.exit(2)\n")
+    lista = eventos(cliente.get(f"/run/{nombre}/stream"))
+    assert lista[0] == ("message", "antes")
+    assert json.loads(lista[-1][1])["codigo"] == 2
+
+
+def test_eventos_de_un_trabajo(cliente, scripts):
+    nombre = scripts("trabajo.py", "import time\nprint('uno', flush=True)\ntime.sleep(0.3)\nprint('dos')\n")
+    id_trabajo = cliente.post(f"/run/{nombre}?asincrono=1").get_json()["trabajo"]
+    lista = eventos(cliente.get(f"/trabajos/{id_trabajo}/eventos"))
+    assert lista[:2] == [("message", "uno"), ("message", "dos")]
+    assert lista[2][0] == "artefactos"
+    assert json.loads(lista[-1][1]) == {"estado": "completado", "codigo": 0}
+    assert cliente.get("/trabajos/no-existe/eventos").status_code == 404
+
+
+def esperar_trabajo(cliente, id_trabajo, timeout=20):
+    limite = time.time() + timeout
+    while time.time() < limite:
+        estado = cliente.get(f"/trabajos/{id_trabajo}").get_json()
+        if estado["estado"] not in ("en_cola", "ejecutando"):
+            return estado
+        time.sleep(0.05)
+    raise AssertionError("el trabajo no terminó")
+
+
+def test_trabajo_asincrono(cliente, scripts):
+    nombre = scripts("asincrono.py", "print('hola')\nprint('chao')\n")
+    respuesta = cliente.post(f"/run/{nombre}", data={"asincrono": "1"})
+    assert respuesta.status_code == 202
+    id_trabajo = respuesta.get_json()["trabajo"]
+    estado = esperar_trabajo(cliente, id_trabajo)
+    assert (estado["estado"], estado["codigo"], estado["salida"]) == ("completado", 0, "hola\nchao\n")
+    assert cliente.get(f"/trabajos/{id_trabajo}?desde=5").get_json()["salida"] == "chao\n"
+    assert cliente.post(f"/trabajos/{id_trabajo}/cancelar").status_code == 409
+
+
+def test_cancelar_trabajo(cliente, scripts):
+    nombre = scripts("largo.py", "import time\nprint('inicio', flush=True)\ntime.sleep(60)\n")
+    id_trabajo = cliente.post(f"/run/{nombre}?asincrono=1").get_json()["trabajo"]
+    while "inicio" not in cliente.get(f"/trabajos/{id_trabajo}").get_json()["salida"]:
+        time.sleep(0.05)
+    assert cliente.post(f"/trabajos/{id_trabajo}/cancelar").status_code == 200
+    assert esperar_trabajo(cliente, id_trabajo)["estado"] == "cancelado"
+    assert cliente.get("/trabajos/no-existe").status_code == 404
@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+
+import archivos_muestra as am
+
+
+@pytest.fixture
+def datos():
+    return np.random.default_rng(9).random(10_007)
+
+
+@pytest.mark.parametrize("nombre, formato", [("m.npy", "npy"), ("m.f64", "crudo"), ("m.txt", "texto")])
+def test_ida_y_vuelta(tmp_path, datos, nombre, formato):
+    ruta = str(tmp_path / nombre)
+    assert am.guardar_muestra(ruta, iter(np.array_split(datos, 4))) == len(datos)
+    assert am.formato_de(ruta) == formato
+    np.testing.assert_array_equal(am.leer_muestra(ruta), datos)
+    np.testing.assert_array_equal(np.concatenate(list(am.leer_bloques(ruta, 1000))), datos)
+
+
+def test_npy_legible_por_numpy(tmp_path, datos):
+    ruta = str(tmp_path / "m.npy")
+    am.guardar_muestra(ruta, iter(np.array_split(datos, 3)))
+    np.testing.assert_array_equal(np.load(ruta), datos)
+
+
+def test_texto_por_tramos(monkeypatch, datos):
+    monkeypatch.setattr(am, "_VALORES_POR_TEXTO", 100)
+    textos = list(am.textos_de_bloque(datos[:1050], decimales=4))
+    assert len(textos) == 11
+    assert "".join(textos) == "".join(f"{x:.4f}\n" for x in datos[:1050])
+
+
+def test_texto_con_encabezado_y_convertir(tmp_path, datos):
+    texto, binario = str(tmp_path / "m.txt"), str(tmp_path / "m.npy")
+    am.guardar_muestra(texto, datos, decimales=6, encabezado="Números de prueba")
+    assert am.convertir(texto, binario) == len(datos)
+    np.testing.assert_allclose(am.leer_muestra(binario), datos, atol=5e-7)
+
+
+@pytest.mark.parametrize("nombre", ["v.npy", "v.f64", "v.txt"])
+def test_muestra_vacia(tmp_path, nombre):
+    ruta = str(tmp_path / nombre)
+    assert am.guardar_muestra(ruta, np.empty(0)) == 0
+    assert len(am.leer_muestra(ruta)) == 0
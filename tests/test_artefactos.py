@@ -0,0 +1,59 @@
+import os
+import time
+
+import pytest
+
+from artefactos import AlmacenArtefactos
+
+
+@pytest.fixture
+def almacen(tmp_path):
+    return AlmacenArtefactos(str(tmp_path / "artefactos"), max_bytes=25, max_edad=3600)
+
+
+def test_carpetas_de_ejecucion_independientes(almacen):
+    una, otra = almacen.crear_carpeta_ejecucion(), almacen.crear_carpeta_ejecucion()
+    assert una != otra
+    for carpeta, contenido in ((una, b"a"), (otra, b"b")):
+        with open(os.path.join(carpeta, "static", "img", "grafico.png"), "wb") as f:
+            f.write(contenido)
+    assert almacen.leer_ejecucion(una) == {"static/img/grafico.png": b"a"}
+    assert almacen.leer_ejecucion(otra) == {"static/img/grafico.png": b"b"}
+    almacen.eliminar_ejecucion(una)
+    assert not os.path.exists(una)
+
+
+def test_nombres_por_contenido(almacen):
+    publicados = almacen.publicar({"static/img/g.png": b"uno", "datos mal/nombre?.txt": b"uno"})
+    assert [p["nombre"] for p in publicados] == ["datos mal/nombre?.txt", "static/img/g.png"]
+    urls = [p["url"] for p in publicados]
+    assert urls[0].startswith("/artefactos/") and urls[0].endswith("-nombre_.txt")
+    assert urls[0].split("-")[0] == urls[1].split("-")[0]
+    assert almacen.publicar({"static/img/g.png": b"uno"})[0]["url"] == urls[1]
+    assert almacen.publicar({"static/img/g.png": b"dos"})[0]["url"] != urls[1]
+
+
+def test_desalojo_por_tamano_y_edad(almacen):
+    viejo = almacen.guardar("viejo.txt", b"x" * 10)
+    ruta_viejo = os.path.join(almacen.carpeta, viejo)
+    os.utime(ruta_viejo, (time.time() - 100, time.time() - 100))
+    nuevo = almacen.guardar("nuevo.txt", b"y" * 10)
+    almacen.guardar("otro.txt", b"z" * 10)
+    almacen.limpiar(forzar=True)
+    restantes = set(os.listdir(almacen.carpeta)) - {".ejecuciones"}
+    assert viejo not in restantes and nuevo in restantes
+
+    almacen.max_edad = 0
+    os.utime(os.path.join(almacen.carpeta, nuevo), (time.time() - 10, time.time() - 10))
+    almacen.limpiar(forzar=True)
+    assert nuevo not in os.listdir(almacen.carpeta)
+
+
+def test_run_publica_los_graficos(cliente, scripts):
+    nombre = scripts("grafico.py", "open('static/img/g.png', 'wb').write(b'imagen')\nprint('listo')\n")
+    respuesta = cliente.post(f"/run/{nombre}").get_json()
+    (artefacto,) = respuesta["artefactos"]
+    assert (artefacto["nombre"], artefacto["bytes"]) == ("static/img/g.png", 6)
+    imagen = cliente.get(artefacto["url"])
+    assert imagen.data == b"imagen"
+    assert "immutable" in imagen.headers["Cache-Control"]
@@ -0,0 +1,87 @@
+import numpy as np
+import pytest
+from scipy.stats import chisquare, kstest
+
+import bateria_pruebas as bp
+import Prueba_series
+import prueba_corridas_aleat
+from generadores import obtener_generador
+
+
+def sin_tiempos(reporte):
+    return {nombre: (r["estadistico"], r["p_valor"], r["aprobada"]) for nombre, r in reporte["pruebas"].items()}
+
+
+def test_igual_a_cada_prueba_por_separado():
+    n = 50_000
+    reporte = bp.bateria(n, "lcg", semilla=12345, tamano=7000, mostrar=False)
+    datos = obtener_generador("lcg", 12345).uniformes(n)
+    pruebas = reporte["pruebas"]
+    assert (reporte["n"], reporte["total"], reporte["procesos"]) == (n, 4, False)
+
+    conteos = np.histogram(datos, bins=bp.clases_frecuencias(n), range=(0, 1))[0]
+    assert pruebas["frecuencias"]["estadistico"] == pytest.approx(chisquare(conteos).statistic)
+    assert pruebas["frecuencias"]["p_valor"] == pytest.approx(chisquare(conteos).pvalue)
+
+    corridas = prueba_corridas_aleat.prueba_corridas(datos)
+    assert (pruebas["corridas"]["estadistico"], pruebas["corridas"]["p_valor"]) == (corridas["Z"], corridas["p_valor"])
+
+    series = Prueba_series.prueba_series(datos, m=bp.m_series(n), ruta_grafico=None)
+    assert pruebas["series"]["estadistico"] == pytest.approx(series["chi2_calc"])
+
+    ks = pruebas["ks"]["detalle"]
+    assert ks["D_minimo"] <= kstest(datos, "uniform").statistic <= ks["D"]
+
+
+def test_con_procesos_igual_que_en_un_proceso():
+    en_proceso = bp.bateria(30_000, "minstd", semilla=7, tamano=4096, mostrar=False)
+    paralelo = bp.bateria(30_000, "minstd", semilla=7, tamano=4096, procesos=True, mostrar=False)
+    assert paralelo["procesos"] is True
+    assert list(paralelo["pruebas"]) == list(bp.PRUEBAS)
+    assert sin_tiempos(paralelo) == sin_tiempos(en_proceso)
+    assert paralelo["aprobadas"] == en_proceso["aprobadas"]
+
+
+def test_generador_pobre_falla():
+    reporte = bp.bateria(20_000, "cuadrados_medios", semilla=5735, mostrar=False)
+    assert reporte["aprobadas"] == 0
+    assert "0/4" in reporte["mensaje"]
+
+
+def test_seleccion_de_pruebas(capsys):
+    reporte = bp.bateria(1000, "numpy", semilla=1, pruebas="ks, corridas,ks")
+    assert list(reporte["pruebas"]) == ["ks", "corridas"]
+    assert "BATERÍA DE PRUEBAS" in capsys.readouterr().out
+    with pytest.raises(ValueError, match="desconocida"):
+        bp.bateria(1000, pruebas=["ks", "poker"])
+    with pytest.raises(ValueError):
+        bp.bateria(1000, pruebas="")
+    with pytest.raises(ValueError):
+        bp.bateria(2)
+
+
+def test_tamanos_de_las_pruebas():
+    assert bp.clases_frecuencias(100) == 20 and bp.clases_frecuencias(10**6) == 100
+    assert bp.m_series(10**12) ** 2 <= bp.CELDAS_SERIES_MAX
+    assert bp.m_series(5000) ** 2 * 5 <= 5000
+
+
+def test_monitor_igual_a_la_bateria():
+    n = 20_000
+    datos = obtener_generador("lcg", 5).uniformes(n)
+    monitor = bp.Monitor(n_previsto=n)
+    for x in datos[:5000]:
+        monitor.agregar_valor(x)
+    monitor.agregar(datos[5000:])
+    reporte = monitor.reporte()
+    assert reporte["n"] == n
+    assert sin_tiempos(reporte) == sin_tiempos(bp.bateria(n, "lcg", semilla=5, mostrar=False))
+
+
+def test_monitor_sin_datos_suficientes():
+    monitor = bp.Monitor(pruebas="corridas,ks")
+    monitor.agregar_valor(0.5)
+    reporte = monitor.reporte()
+    assert reporte["pruebas"]["corridas"]["aprobada"] is False
+    assert "error" in reporte["pruebas"]["corridas"]["detalle"]
+    assert reporte["pruebas"]["ks"]["p_valor"] is not None
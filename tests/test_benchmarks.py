@@ -0,0 +1,60 @@
+import json
+
+import pytest
+
+import benchmarks
+
+
+def test_carga_sin_la_demo(tmp_path, capsys):
+    ruta = tmp_path / "modulo.py"
+    ruta.write_text(
+        '"""Docstring."""\n'
+        "import math\n"
+        "LIMITE = max(10, int(math.sqrt(16)))\n"
+        "print('efecto')\n"
+        "datos = open('no_existe.txt').read()\n"
+        "DERIVADO = len(datos)\n"
+        "def doble(x):\n"
+        "    return 2 * x\n"
+        "if __name__ == '__main__':\n"
+        "    print('demo')\n", encoding="utf-8")
+    modulo = benchmarks.cargar_sin_efectos(str(ruta))
+    assert capsys.readouterr().out == ""
+    assert (modulo.LIMITE, modulo.doble(3)) == (10, 6)
+    assert not hasattr(modulo, "datos") and not hasattr(modulo, "DERIVADO")
+
+
+def test_todos_los_casos_se_ejecutan():
+    casos = {c.nombre: c for c in benchmarks.CASOS}
+    assert len(casos) == len(benchmarks.CASOS)
+    for caso in casos.values():
+        if caso.tamanos:
+            caso = benchmarks.Caso(caso.nombre, caso.script, caso.preparar, caso.tamanos[:1])
+        resultado = benchmarks.ejecutar_casos([caso], (1000,), calentamiento=0, repeticiones=1)
+        (estadisticas,) = resultado[caso.nombre].values()
+        assert estadisticas["repeticiones"] == 1
+
+
+def test_cronometrar_corta_las_corridas_largas():
+    llamadas = []
+    tiempos = benchmarks.cronometrar(lambda: llamadas.append(1), calentamiento=1, repeticiones=3)
+    assert len(tiempos) == 3 and len(llamadas) == 4
+    assert len(benchmarks.cronometrar(lambda: None, calentamiento=2, repeticiones=5, max_segundos=-1)) == 1
+
+
+def test_comparar():
+    anterior = {"a": {"1000": {"mediana": 0.010}, "10": {"mediana": 0.0001}}}
+    actual = {"a": {"1000": {"mediana": 0.020}, "10": {"mediana": 0.0003}, "5": {"mediana": 1.0}},
+              "b": {"1000": {"mediana": 1.0}}}
+    filas = {f["n"]: f for f in benchmarks.comparar(anterior, actual)}
+    assert set(filas) == {1000, 10}
+    assert filas[1000]["regresion"] and filas[1000]["razon"] == pytest.approx(2.0)
+    assert not filas[10]["regresion"]   # más lento, pero por debajo del ruido
+
+
+def test_main_guarda_la_base(tmp_path, monkeypatch):
+    base = tmp_path / "base.json"
+    benchmarks.main(["--solo", "generar", "--tamanos", "1e3", "--repeticiones", "1", "--base", str(base)])
+    datos = json.loads(base.read_text(encoding="utf-8"))
+    assert list(datos["resultados"]) == ["generar"]
+    assert list(datos["resultados"]["generar"]) == ["1000"]
@@ -0,0 +1,166 @@
+import shutil
+import threading
+
+import pytest
+
+from cache_resultados import CacheResultados
+from conftest import CODIGOS
+
+
+@pytest.fixture
+def codigos(tmp_path):
+    carpeta = tmp_path / "codigos"
+    carpeta.mkdir()
+    (carpeta / "util.py").write_text("def doble(x):\n    return 2 * x\n", encoding="utf-8")
+    return carpeta
+
+
+@pytest.fixture
+def cache(tmp_path, codigos):
+    return CacheResultados(str(codigos), str(tmp_path / "disco"), capacidad=2)
+
+
+@pytest.mark.parametrize("fuente, determinista", [
+    ("print(1 + 1)\n", True),
+    ("import random\nprint(random.random())\n", False),
+    ("import random\nrandom.seed(42)\nprint(random.random())\n", True),
+    ("import numpy as np\nprint(np.random.default_rng().random())\n", False),
+    ("import numpy as np\nprint(np.random.default_rng(7).random())\n", True),
+    ("# determinista: no\nprint(1)\n", False),
+    ("# determinista: sí\nimport random\nprint(random.random())\n", True),
+    ("print(\n", False),
+])
+def test_deteccion_de_determinismo(cache, codigos, fuente, determinista):
+    (codigos / "script.py").write_text(fuente, encoding="utf-8")
+    assert (cache.clave("script.py") is not None) == determinista
+
+
+def test_clave_depende_de_los_modulos_importados(cache, codigos):
+    (codigos / "script.py").write_text("from util import doble\nprint(doble(2))\n", encoding="utf-8")
+    antes = cache.clave("script.py")
+    (codigos / "util.py").write_text("def doble(x):\n    return x + x\n", encoding="utf-8")
+    assert cache.clave("script.py") not in (None, antes)
+    (codigos / "util.py").write_text("import random\ndef doble(x):\n    return random.random()\n",
+                                     encoding="utf-8")
+    assert cache.clave("script.py") is None
+
+
+@pytest.mark.parametrize("dependencia, determinista", [
+    # La semilla de la demo de una dependencia no siembra su azar al importarla
+    ("import numpy as np\ndef valor():\n    return np.random.random()\n"
+     "if __name__ == '__main__':\n    np.random.seed(1)\n", False),
+    # El azar que solo usa la demo de una dependencia no corre al importarla
+    ("def valor():\n    return 3\nif __name__ == '__main__':\n    import random\n    print(random.random())\n",
+     True),
+    ("import random\n_azar = random.Random(5)\ndef valor():\n    return _azar.random()\n", True),
+])
+def test_azar_de_las_dependencias(cache, codigos, dependencia, determinista):
+    (codigos / "dep.py").write_text(dependencia, encoding="utf-8")
+    (codigos / "script.py").write_text("from dep import valor\nprint(valor())\n", encoding="utf-8")
+    assert (cache.clave("script.py") is not None) == determinista
+
+
+def test_semilla_del_script_no_siembra_a_las_dependencias(cache, codigos):
+    (codigos / "dep.py").write_text("import random\ndef valor():\n    return random.Random().random()\n",
+                                    encoding="utf-8")
+    (codigos / "script.py").write_text(
+        "import random\nfrom dep import valor\nrandom.seed(3)\nprint(random.random(), valor())\n",
+        encoding="utf-8")
+    assert cache.clave("script.py") is None
+
+
+def test_demo_de_una_dependencia_no_es_dependencia(cache, codigos):
+    (codigos / "azar.py").write_text("import random\nprint(random.random())\n", encoding="utf-8")
+    (codigos / "dep.py").write_text("def valor():\n    return 1\nif __name__ == '__main__':\n    import azar\n",
+                                    encoding="utf-8")
+    (codigos / "script.py").write_text("from dep import valor\nprint(valor())\n", encoding="utf-8")
+    assert set(cache._fuentes("script.py")) == {"script", "dep"}
+    assert cache.clave("script.py") is not None
+
+
+@pytest.mark.parametrize("nombre, determinista", [
+    ("Teoria_colas_monte.py", False),
+    ("monte_carlo_cafeteria.py", False),
+    ("monte_carlo_calculo_pi.py", False),
+    ("prueba_corridas_aleat.py", True),
+    ("simulacion_monte_carlo_colision.py", True),
+    ("cuadrados_medios_entero.py", True),
+])
+def test_scripts_del_curso(tmp_path, nombre, determinista):
+    cache = CacheResultados(CODIGOS, str(tmp_path))
+    assert (cache.clave(nombre) is not None) == determinista
+
+
+def test_script_inexistente(cache):
+    assert cache.clave("no_existe.py") is None
+
+
+def test_guardar_y_obtener_de_disco(tmp_path, cache, codigos):
+    cache.guardar("s.py", "abc", "salida\n", {"static/img/g.png": b"png"})
+    assert cache.obtener("s.py", "abc") == {"salida": "salida\n", "artefactos": {"static/img/g.png": b"png"}}
+    nueva = CacheResultados(str(codigos), str(tmp_path / "disco"))
+    assert nueva.obtener("s.py", "abc") == {"salida": "salida\n", "artefactos": {"static/img/g.png": b"png"}}
+    assert nueva.obtener("s.py", "otra") is None
+
+
+def test_guardar_concurrente_de_la_misma_clave(tmp_path, cache, codigos):
+    inicio = threading.Barrier(8)
+    errores = []
+
+    def guardar():
+        inicio.wait()
+        try:
+            cache.guardar("s.py", "abc", "salida\n", {f"static/img/g{i}.png": b"png" * i for i in range(20)})
+        except Exception as e:
+            errores.append(e)
+
+    hilos = [threading.Thread(target=guardar) for _ in range(8)]
+    for hilo in hilos:
+        hilo.start()
+    for hilo in hilos:
+        hilo.join()
+    assert errores == []
+    assert sorted(p.name for p in (tmp_path / "disco" / "s.py").iterdir()) == ["abc"]
+    guardado = CacheResultados(str(codigos), str(tmp_path / "disco")).obtener("s.py", "abc")
+    assert guardado["salida"] == "salida\n" and len(guardado["artefactos"]) == 20
+
+
+def test_lru_en_memoria(cache):
+    for clave in ("a", "b", "c"):
+        cache.guardar("s.py", clave, clave, {})
+    assert list(cache._memoria) == [("s.py", "b"), ("s.py", "c")]
+    assert cache.obtener("s.py", "a") == {"salida": "a", "artefactos": {}}
+    assert list(cache._memoria) == [("s.py", "c"), ("s.py", "a")]
+
+
+def test_invalidar(cache):
+    cache.guardar("s.py", "a", "x", {})
+    cache.guardar("t.py", "a", "y", {})
+    cache.invalidar("s.py")
+    assert cache.obtener("s.py", "a") is None
+    assert cache.obtener("t.py", "a") == {"salida": "y", "artefactos": {}}
+
+
+def test_run_usa_la_cache(cliente, scripts):
+    nombre = scripts("fijo.py", "print('resultado fijo')\n")
+    primera = cliente.post(f"/run/{nombre}").get_json()
+    segunda = cliente.post(f"/run/{nombre}").get_json()
+    assert (primera["cache"], segunda["cache"]) == (False, True)
+    assert primera["salida"] == segunda["salida"] == "resultado fijo\n"
+
+
+def test_run_no_guarda_scripts_con_azar(cliente, scripts):
+    nombre = scripts("azar.py", "import random\nprint(random.random())\n")
+    cliente.post(f"/run/{nombre}")
+    assert cliente.post(f"/run/{nombre}").get_json()["cache"] is False
+
+
+def test_run_no_guarda_fuentes_de_generadores_sin_semilla(aplicacion, cliente, scripts):
+    for modulo in ("generadores", "generador_Congruencial", "cuadrados_medios_entero", "lcg_afin"):
+        shutil.copy(f"{CODIGOS}/{modulo}.py", aplicacion.RUTA_CODIGOS)
+    nombre = scripts("cola.py", "from generadores import obtener_generador\n"
+                                "print(obtener_generador().uniformes(3))\n")
+    primera = cliente.post(f"/run/{nombre}").get_json()
+    segunda = cliente.post(f"/run/{nombre}").get_json()
+    assert (primera["cache"], segunda["cache"]) == (False, False)
+    assert primera["salida"] != segunda["salida"]
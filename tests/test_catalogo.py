@@ -0,0 +1,79 @@
+import os
+
+import pytest
+
+import catalogo
+from catalogo import CatalogoScripts, analizar_script
+from conftest import CODIGOS
+
+DOCSTRING = '''"""
+=========================================
+ALGORITMO : Método de prueba
+-----------------------------------------
+Propósito:
+    Primera línea del propósito
+    y su continuación.
+
+Descripción:
+    - Detalle.
+=========================================
+"""
+
+def publica():
+    pass
+
+def _privada():
+    pass
+
+class Clase:
+    pass
+'''
+
+
+@pytest.fixture
+def carpeta(tmp_path):
+    (tmp_path / "metodo.py").write_text(DOCSTRING, encoding="utf-8")
+    (tmp_path / "roto.py").write_text("def f(:\n", encoding="utf-8")
+    (tmp_path / "notas.txt").write_text("no es un script", encoding="utf-8")
+    return tmp_path
+
+
+def test_metadatos(carpeta):
+    entrada = analizar_script(str(carpeta / "metodo.py"))
+    assert entrada["titulo"] == "Método de prueba"
+    assert entrada["resumen"] == "Primera línea del propósito y su continuación."
+    assert (entrada["funciones"], entrada["clases"], entrada["valido"]) == (["publica"], ["Clase"], True)
+    roto = analizar_script(str(carpeta / "roto.py"))
+    assert (roto["titulo"], roto["valido"], roto["resumen"]) == ("Roto", False, None)
+
+
+def test_solo_reanaliza_lo_que_cambia(carpeta, monkeypatch):
+    analizados = []
+    original = catalogo.analizar_script
+    monkeypatch.setattr(catalogo, "analizar_script", lambda ruta: analizados.append(os.path.basename(ruta))
+                        or original(ruta))
+    scripts = CatalogoScripts(str(carpeta))
+    assert [e["nombre"] for e in scripts.entradas()] == ["metodo.py", "roto.py"]
+    scripts.entradas()
+    assert sorted(analizados) == ["metodo.py", "roto.py"]
+
+    (carpeta / "nuevo.py").write_text("x = 1\n", encoding="utf-8")
+    (carpeta / "roto.py").unlink()
+    assert [e["nombre"] for e in scripts.entradas()] == ["metodo.py", "nuevo.py"]
+    assert sorted(analizados) == ["metodo.py", "nuevo.py", "roto.py"]
+
+    (carpeta / "metodo.py").write_text('"""Otro título."""\n', encoding="utf-8")
+    scripts.invalidar("metodo.py")
+    assert scripts.obtener("metodo.py")["titulo"] == "Otro título."
+    assert analizados.count("metodo.py") == 2
+
+
+def test_catalogo_de_codigos():
+    entradas = CatalogoScripts(CODIGOS).entradas()
+    assert len(entradas) == len([n for n in os.listdir(CODIGOS) if n.endswith(".py")])
+    assert all(e["valido"] for e in entradas)
+
+
+def test_api_catalogo(cliente):
+    entradas = cliente.get("/api/catalogo").get_json()
+    assert {"nombre", "titulo", "resumen", "hash", "funciones"} <= set(entradas[0])
@@ -0,0 +1,116 @@
+import numpy as np
+import pytest
+
+import cuadrados_medios_entero as cm
+from aleatorio_NO_congruencial import cuadrados_medios
+
+
+def siguiente_texto(x, d):
+    """Paso original: dígitos centrales de str(x²) completada a 2d dígitos."""
+    y = str(x * x).zfill(2 * d)
+    inicio = (len(y) - d) // 2
+    return int(y[inicio:inicio + d])
+
+
+def ciclo_fuerza_bruta(semilla, d):
+    vistos, x, i = {}, semilla, 0
+    while x not in vistos:
+        vistos[x] = i
+        x = siguiente_texto(x, d)
+        i += 1
+    cola = vistos[x]
+    return {"cola": cola, "periodo": i - cola, "entrada": x, "colapso": max(cola, 1) + i - cola}
+
+
+@pytest.mark.parametrize("d", [1, 2, 3, 4, 5, 8, 10, 13])
+def test_siguiente_igual_al_corte_de_texto(d):
+    semillas = np.random.default_rng(d).integers(0, 10 ** d, 200, dtype=np.uint64).tolist() + [0, 10 ** d - 1]
+    for x in semillas:
+        assert cm.siguiente(x, d) == siguiente_texto(x, d)
+
+
+@pytest.mark.parametrize("d", [4, 10])
+def test_lote_igual_a_cada_secuencia(d):
+    semillas = [5735, 1234, 9876, 3792, 0] if d == 4 else [1234567890, 9876543210]
+    X = cm.secuencias_lote(semillas, d, 30)
+    assert X.shape == (len(semillas), 30)
+    for fila, semilla in zip(X, semillas):
+        assert [int(x) for x in fila] == cm.secuencia(semilla, d, 30)
+    with pytest.raises(ValueError):
+        cm.secuencias_lote([10 ** d], d, 3)
+
+
+@pytest.mark.parametrize("d", [2, 3])
+def test_brent_igual_a_fuerza_bruta(d):
+    resultado = cm.detectar_ciclos(np.arange(10 ** d), d)
+    for semilla in range(10 ** d):
+        esperado = ciclo_fuerza_bruta(semilla, d)
+        for clave, valor in esperado.items():
+            assert int(resultado[clave][semilla]) == valor, (semilla, clave)
+        assert bool(resultado["cero"][semilla]) == (esperado["entrada"] == 0 and esperado["periodo"] == 1)
+
+
+def test_colapso_es_el_primer_valor_repetido():
+    for semilla in (5735, 1234, 3792, 2100, 0):
+        info = cm.detectar_ciclo(semilla, 4)
+        valores = cm.secuencia(semilla, 4, info["colapso"])
+        assert len(set(valores[:-1])) == info["colapso"] - 1
+        assert valores[-1] in valores[:-1]
+    info = cm.detectar_ciclo(12345678, 8)
+    assert {clave: info[clave] for clave in ("cola", "periodo", "entrada", "colapso")} == \
+        ciclo_fuerza_bruta(12345678, 8)
+
+
+def test_cuadrados_medios_se_detiene_en_el_ciclo(capsys):
+    info = cm.detectar_ciclo(5735, 4)
+    assert cuadrados_medios(5735, 4, 50) == [x / 10**4 for x in cm.secuencia(5735, 4, 50)]
+    detenida = cuadrados_medios(5735, 4, 50, detener_en_ciclo=True)
+    assert len(detenida) == info["colapso"] - 1 < 50
+    assert len(set(detenida)) == len(detenida)
+    capsys.readouterr()
+
+
+@pytest.mark.parametrize("d", [1, 2, 3, 4])
+def test_tabla_e_indice_iguales_a_fuerza_bruta(tmp_path, d):
+    tabla = cm.tabla_transiciones(d, str(tmp_path))
+    assert [int(x) for x in tabla] == [siguiente_texto(x, d) for x in range(10 ** d)]
+    indice = cm.indice_semillas(d, str(tmp_path))
+    assert indice.shape == (10 ** d, 3)
+    for semilla in range(0, 10 ** d, max(10 ** d // 500, 1)):
+        esperado = ciclo_fuerza_bruta(semilla, d)
+        assert [int(v) for v in indice[semilla]] == [esperado["cola"], esperado["periodo"], esperado["entrada"]]
+
+
+def test_tabla_se_reutiliza_desde_el_disco(tmp_path):
+    primera = cm.indice_semillas(3, str(tmp_path))
+    archivos = sorted(p.name for p in tmp_path.iterdir())
+    assert archivos == ["cuadrados_medios_d3_indice.npy", "cuadrados_medios_d3_tabla.npy"]
+    segunda = cm.indice_semillas(3, str(tmp_path))
+    assert isinstance(segunda, np.memmap)
+    np.testing.assert_array_equal(primera, segunda)
+    with pytest.raises(ValueError):
+        cm.tabla_transiciones(cm.TABLA_MAX_D + 1, str(tmp_path))
+
+
+def test_lote_con_tabla_igual_a_sin_tabla(tmp_path):
+    tabla = cm.tabla_transiciones(4, str(tmp_path))
+    semillas = np.arange(0, 10**4, 37)
+    np.testing.assert_array_equal(cm.secuencias_lote(semillas, 4, 40, tabla=tabla),
+                                  cm.secuencias_lote(semillas, 4, 40))
+
+
+@pytest.mark.parametrize("semilla, d", [(5735, 4), (3792, 4), (0, 4), (123, 3), (1234567, 7)])
+def test_calidad_semilla_y_bloques(semilla, d):
+    calidad = cm.calidad_semilla(semilla, d)
+    esperado = ciclo_fuerza_bruta(semilla, d)
+    assert (calidad["cola"], calidad["periodo"], calidad["entrada"]) == \
+        (esperado["cola"], esperado["periodo"], esperado["entrada"])
+    assert calidad["valores_distintos"] == esperado["colapso"] - 1
+    n = esperado["colapso"] + 3 * esperado["periodo"] + 5
+    por_bloques = np.concatenate(list(cm.bloques(semilla, d, n, tamano=7)))
+    assert por_bloques.tolist() == cm.secuencia(semilla, d, n)
+
+
+def test_calidad_semilla_fuera_de_rango():
+    with pytest.raises(ValueError):
+        cm.calidad_semilla(10**4, 4)
@@ -0,0 +1,68 @@
+import gzip
+import os
+
+import estaticos
+from estaticos import ManifiestoEstaticos, construir
+
+
+def crear_static(carpeta):
+    (carpeta / "img").mkdir(parents=True)
+    (carpeta / "css").mkdir()
+    (carpeta / "img" / "logo.png").write_bytes(b"\x89PNG logo")
+    (carpeta / "css" / "estilos.css").write_text(
+        "body { background: url('../img/logo.png'); }\n"
+        "a { background: url(https://ejemplo.com/x.png); }\n", encoding="utf-8")
+    return str(carpeta)
+
+
+def test_construir_con_huellas(tmp_path):
+    static = crear_static(tmp_path / "static")
+    manifiesto = construir(static)
+    logo, css = manifiesto["img/logo.png"], manifiesto["css/estilos.css"]
+    assert logo.startswith("img/logo.") and logo.endswith(".png")
+    salida = os.path.join(static, estaticos.CARPETA_SALIDA)
+    texto = open(os.path.join(salida, css), encoding="utf-8").read()
+    assert f"url('../{logo}')" in texto
+    assert "url(https://ejemplo.com/x.png)" in texto
+    with gzip.open(os.path.join(salida, css + ".gz"), "rt", encoding="utf-8") as f:
+        assert f.read() == texto
+    assert not os.path.exists(os.path.join(salida, logo + ".gz"))
+
+
+def test_construir_borra_salidas_viejas(tmp_path):
+    static = crear_static(tmp_path / "static")
+    viejo = construir(static)["img/logo.png"]
+    (tmp_path / "static" / "img" / "logo.png").write_bytes(b"\x89PNG nuevo")
+    nuevo = construir(static)
+    salida = os.path.join(static, estaticos.CARPETA_SALIDA)
+    assert nuevo["img/logo.png"] != viejo
+    assert not os.path.exists(os.path.join(salida, viejo))
+    # La hoja de estilos cambia de huella porque referencia al logo nuevo
+    assert os.path.exists(os.path.join(salida, nuevo["css/estilos.css"]))
+
+
+def test_manifiesto_y_variantes(tmp_path):
+    static = crear_static(tmp_path / "static")
+    manifiesto = ManifiestoEstaticos(static)
+    assert manifiesto.archivo("css/estilos.css") == "css/estilos.css"
+    css = construir(static)["css/estilos.css"]
+    assert manifiesto.archivo("css/estilos.css") == f"dist/{css}"
+    assert manifiesto.variante(css, "gzip, deflate") == (css + ".gz", "gzip")
+    assert manifiesto.variante(css, "identity") == (css, None)
+    assert manifiesto.variante(css, None) == (css, None)
+
+
+def test_variantes_respetan_q_cero(tmp_path):
+    static = crear_static(tmp_path / "static")
+    css = construir(static)["css/estilos.css"]
+    ruta = os.path.join(static, estaticos.CARPETA_SALIDA, css)
+    if not os.path.exists(ruta + ".br"):
+        with open(ruta + ".br", "wb") as f:
+            f.write(b"br")
+    manifiesto = ManifiestoEstaticos(static)
+    assert manifiesto.variante(css, "gzip, br") == (css + ".br", "br")
+    assert manifiesto.variante(css, "br;q=0, gzip") == (css + ".gz", "gzip")
+    assert manifiesto.variante(css, "br; q=0.0, gzip;q=0.5") == (css + ".gz", "gzip")
+    assert manifiesto.variante(css, "br;q=0,gzip;q=0") == (css, None)
+    assert manifiesto.variante(css, "BR;Q=0.8") == (css + ".br", "br")
+    assert manifiesto.variante(css, "br;q=abc, gzip") == (css + ".gz", "gzip")
@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+from scipy.stats import chisquare
+
+from flujos import HistogramaEnLinea, consumir, escribir_texto
+
+
+@pytest.fixture
+def datos():
+    return np.random.default_rng(3).random(100_000)
+
+
+def test_por_bloques_igual_a_np_histogram(datos):
+    histograma = HistogramaEnLinea.uniforme(20)
+    consumir(np.array_split(datos, 7), histograma)
+    np.testing.assert_array_equal(histograma.conteos, np.histogram(datos, bins=20, range=(0, 1))[0])
+    assert histograma.total == len(datos)
+
+
+def test_valor_a_valor_igual_a_bloques():
+    valores = [-0.5, 0.0, 0.05, 0.1, 0.5, 0.999, 1.0, 1.5]
+    por_bloque = HistogramaEnLinea.uniforme(10)
+    por_bloque.agregar(np.array(valores))
+    por_valor = HistogramaEnLinea.uniforme(10)
+    for x in valores:
+        por_valor.agregar_valor(x)
+    np.testing.assert_array_equal(por_valor.conteos, por_bloque.conteos)
+    assert por_valor.fuera == por_bloque.fuera == 2
+
+
+def test_chi_cuadrado_igual_a_scipy(datos):
+    histograma = HistogramaEnLinea.uniforme(20)
+    histograma.agregar(datos)
+    resultado = histograma.chi_cuadrado()
+    esperado = chisquare(histograma.conteos)
+    assert resultado["chi2_calc"] == pytest.approx(esperado.statistic)
+    assert resultado["p_valor"] == pytest.approx(esperado.pvalue)
+
+
+def test_chi_cuadrado_ignora_los_valores_fuera(datos):
+    dentro = HistogramaEnLinea.uniforme(20)
+    dentro.agregar(datos)
+    con_fuera = HistogramaEnLinea.uniforme(20)
+    con_fuera.agregar(np.concatenate((datos, np.full(5000, 2.0))))
+    resultado = con_fuera.chi_cuadrado()
+    assert resultado["chi2_calc"] == pytest.approx(dentro.chi_cuadrado()["chi2_calc"])
+    assert resultado["n"] == len(datos)
+    assert resultado["fuera"] == 5000
+
+
+def test_chi_cuadrado_sin_datos_dentro():
+    histograma = HistogramaEnLinea.uniforme(10)
+    histograma.agregar(np.array([-1.0, 2.0]))
+    with pytest.raises(ValueError):
+        histograma.chi_cuadrado()
+
+
+def test_escribir_texto(tmp_path, datos):
+    ruta = tmp_path / "datos.txt"
+    escritos = escribir_texto(str(ruta), np.array_split(datos[:1000], 3), decimales=6, encabezado="encabezado")
+    lineas = ruta.read_text(encoding="utf-8").splitlines()
+    assert escritos == 1000
+    assert lineas[0] == "encabezado"
+    np.testing.assert_allclose(np.array(lineas[1:], dtype=float), datos[:1000], atol=5e-7)
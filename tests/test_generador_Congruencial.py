@@ -0,0 +1,39 @@
+import numpy as np
+import pytest
+
+from generador_Congruencial import TAMANO_BLOQUE, GeneradorCongruencial
+
+
+def escalar(a, x, c, m, n):
+    valores = []
+    for _ in range(n):
+        x = (a * x + c) % m
+        valores.append(x)
+    return valores
+
+
+@pytest.mark.parametrize("a, X0, c, m", [
+    (16807, 12345, 0, 2**31 - 1),                       # MINSTD
+    (1664525, 42, 1013904223, 2**32),
+    (2**46 - 3, 123456789012, 98765, 2**46 - 1),        # límite de int64
+    (2**46 + 5, 123456789012345, 98765, 2**46 + 7),     # ya con enteros de Python
+    (2**47 - 3, 123456789012345, 98765, 2**47 - 1),
+    (6364136223846793005, 1, 1442695040888963407, 2**64),
+])
+def test_secuencia_igual_a_la_recurrencia(a, X0, c, m):
+    n = TAMANO_BLOQUE + 1000            # cruza el borde de las tablas
+    generador = GeneradorCongruencial(a, X0, c, m)
+    assert [int(x) for x in generador.secuencia(n)] == escalar(a, X0, c, m, n)
+
+
+def test_bloques_igual_a_secuencia():
+    generador = GeneradorCongruencial(16807, 12345, 0, 2**31 - 1)
+    completa = generador.generar(100_003, silencioso=True)
+    por_bloques = np.concatenate(list(generador.bloques(100_003, tamano=7919)))
+    np.testing.assert_array_equal(por_bloques, completa)
+
+
+def test_generar_silencioso_no_imprime(capsys):
+    U = GeneradorCongruencial(5, 7, 3, 16).generar(20, silencioso=True)
+    assert capsys.readouterr().out == ""
+    np.testing.assert_array_equal(U, np.array(escalar(5, 7, 3, 16, 20)) / 16)
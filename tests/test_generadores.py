@@ -0,0 +1,102 @@
+import random
+
+import numpy as np
+import pytest
+
+import cuadrados_medios_entero
+import generadores as g
+import monte_carlo_cafeteria
+from simulacion_monte_carlo_colision import simulacion_colisiones
+
+
+@pytest.mark.parametrize("nombre", list(g.GENERADORES))
+def test_misma_semilla_misma_secuencia(nombre):
+    a = g.obtener_generador(nombre, semilla=5735)
+    b = g.obtener_generador(nombre, semilla=5735)
+    assert a.nombre == nombre
+    u = a.uniformes(1000)
+    assert u.dtype == np.float64 and u.shape == (1000,)
+    assert ((0 <= u) & (u < 1)).all()
+    np.testing.assert_array_equal(u, b.uniformes(1000))
+
+
+@pytest.mark.parametrize("nombre", list(g.GENERADORES))
+def test_estado_avanza_entre_llamadas_y_bloques(nombre):
+    completa = g.obtener_generador(nombre, semilla=77).uniformes(2500)
+    generador = g.obtener_generador(nombre, semilla=77)
+    np.testing.assert_array_equal(np.concatenate([generador.uniformes(1000), generador.uniformes(0),
+                                                  generador.uniformes(1500)]), completa)
+    por_bloques = list(g.obtener_generador(nombre, semilla=77).bloques(2500, tamano=600))
+    assert [len(b) for b in por_bloques] == [600, 600, 600, 600, 100]
+    np.testing.assert_array_equal(np.concatenate(por_bloques), completa)
+
+
+def test_secuencias_de_referencia():
+    estado = random.Random(3)
+    np.testing.assert_array_equal(g.GeneradorRandom(3).uniformes(50), [estado.random() for _ in range(50)])
+
+    x, esperados = 12345, []
+    for _ in range(50):
+        x = (1664525 * x + 1013904223) % 2**32
+        esperados.append(x / 2**32)
+    lcg = g.GeneradorLCG(semilla=12345)
+    np.testing.assert_array_equal(lcg.uniformes(50), esperados)
+    assert lcg.estado == x
+
+    minstd = g.GeneradorLCG.minstd(semilla=1)
+    assert minstd.uniformes(2).tolist() == [16807 / (2**31 - 1), 282475249 / (2**31 - 1)]
+
+    medios = g.GeneradorCuadradosMedios(5735, d=4).uniformes(30)
+    np.testing.assert_array_equal(medios, np.array(cuadrados_medios_entero.secuencia(5735, 4, 30)) / 10**4)
+
+
+def test_derivadas_de_las_uniformes():
+    generador = g.GeneradorLCG(semilla=9)
+    u = g.GeneradorLCG(semilla=9).uniformes(10_000)
+    enteros = generador.enteros(3, 8, 10_000)
+    np.testing.assert_array_equal(enteros, 3 + np.floor(u * 5))
+    assert set(enteros.tolist()) == {3, 4, 5, 6, 7}
+    exponenciales = g.GeneradorLCG(semilla=9).exponenciales(2.0, 10_000)
+    np.testing.assert_allclose(exponenciales, -2.0 * np.log1p(-u))
+
+
+def test_obtener_generador():
+    propio = g.GeneradorLCG(semilla=1)
+    assert g.obtener_generador(propio) is propio
+    rng = np.random.default_rng(4)
+    envuelto = g.obtener_generador(rng)
+    assert isinstance(envuelto, g.GeneradorNumpy) and envuelto.generador is rng
+    assert isinstance(g.obtener_generador(None, 3), g.GeneradorRandom)
+    assert isinstance(g.obtener_generador(), g.GeneradorNumpy)
+    with pytest.raises(ValueError, match="desconocido"):
+        g.obtener_generador("mersenne")
+    with pytest.raises(ValueError):
+        g.obtener_generador(42)
+
+
+def test_colisiones_con_el_generador_dado():
+    N, M, delta = 5, 2000, 0.05
+    tiempos = np.sort(g.GeneradorLCG(semilla=1).uniformes(M * N).reshape(M, N), axis=1)
+    esperadas = sum(any(b - a < delta for a, b in zip(fila, fila[1:])) for fila in tiempos.tolist())
+    resultado = simulacion_colisiones(N, delta, M, seed=1, generador="lcg")
+    assert resultado["colisiones"] == esperadas
+    assert simulacion_colisiones(N, delta, M, generador=g.GeneradorLCG(semilla=1))["colisiones"] == esperadas
+
+
+def test_mm1_por_bloques_igual_a_lindley(monkeypatch):
+    monkeypatch.setattr(monte_carlo_cafeteria, "BLOQUE", 97)
+    lambd, mu, n = 1 / 3, 1 / 2, 1000
+    resultado = monte_carlo_cafeteria.simular_MM1(lambd, mu, n, generador=g.GeneradorLCG(semilla=5))
+
+    # Misma secuencia de números que consumen los bloques: llegadas y servicios alternados
+    generador = g.GeneradorLCG(semilla=5)
+    llegadas, servicios = [], []
+    for inicio in range(0, n, 97):
+        b = min(97, n - inicio)
+        llegadas += generador.exponenciales(1 / lambd, b).tolist()
+        servicios += generador.exponenciales(1 / mu, b).tolist()
+    esperas = [0.0]
+    for i in range(1, n):
+        esperas.append(max(0.0, esperas[-1] + servicios[i - 1] - llegadas[i]))
+    assert resultado["promedio_espera_MC"] == pytest.approx(np.mean(esperas))
+    assert resultado["promedio_sistema_MC"] == pytest.approx(np.mean(esperas) + np.mean(servicios))
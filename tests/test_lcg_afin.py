@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+
+import lcg_afin
+from DISTRIBUCION_NORMAL import GeneradorNormal
+from generador_Congruencial import GeneradorCongruencial
+
+PARAMETROS = [
+    (16807, 0, 2**31 - 1),
+    (1664525, 1013904223, 2**32),
+    (6364136223846793005, 1442695040888963407, 2**64),
+    (5, 3, 16),
+]
+
+
+def paso_a_paso(x, a, c, m, n):
+    for _ in range(n):
+        x = (a * x + c) % m
+    return x
+
+
+@pytest.mark.parametrize("a, c, m", PARAMETROS)
+@pytest.mark.parametrize("n", [0, 1, 2, 7, 64, 1000, 4097])
+def test_avanzar_igual_a_paso_a_paso(a, c, m, n):
+    assert lcg_afin.avanzar(11, a, c, m, n) == paso_a_paso(11, a, c, m, n)
+
+
+def test_saltos_se_componen():
+    a, c, m = PARAMETROS[1]
+    x = lcg_afin.avanzar(lcg_afin.avanzar(99, a, c, m, 10**6), a, c, m, 3 * 10**6)
+    assert x == lcg_afin.avanzar(99, a, c, m, 4 * 10**6)
+    assert lcg_afin.potencia_afin(a, c, 1, 10) == (0, 0)
+    with pytest.raises(ValueError):
+        lcg_afin.potencia_afin(a, c, m, -1)
+
+
+@pytest.mark.parametrize("total, K", [(0, 3), (10, 3), (1001, 4), (5, 8)])
+def test_particion_disjunta_y_completa(total, K):
+    tramos = [lcg_afin.particion(total, k, K) for k in range(K)]
+    assert tramos[0][0] == 0 and tramos[-1][1] == total
+    assert all(fin == inicio for (_, fin), (inicio, _) in zip(tramos, tramos[1:]))
+    assert max(b - a for a, b in tramos) - min(b - a for a, b in tramos) <= 1
+    for k in (-1, K):
+        with pytest.raises(ValueError):
+            lcg_afin.particion(total, k, K)
+
+
+@pytest.mark.parametrize("a, c, m", PARAMETROS)
+def test_subflujos_reproducen_el_lcg(a, c, m):
+    generador = GeneradorCongruencial(a, 12345, c, m)
+    completa = [int(x) for x in generador.secuencia(1003)]
+    unida = []
+    for k in range(5):
+        x, cantidad = lcg_afin.subflujo(12345, a, c, m, 1003, k, 5)
+        sub, cantidad_generador = generador.subflujo(1003, k, 5)
+        assert (sub.X0, cantidad_generador) == (x, cantidad)
+        unida += [int(v) for v in sub.secuencia(cantidad)]
+    assert unida == completa
+    assert generador.X0 == 12345
+
+
+def test_subflujos_de_normales_conservan_los_pares():
+    generador = GeneradorNormal(123456789)
+    partes = []
+    for k in range(3):
+        sub, cantidad = generador.subflujo(1001, k, 3)
+        assert cantidad % 2 == 0
+        partes.append(sub.generar_muestra(cantidad, 0, 1))
+    completa = GeneradorNormal(123456789).generar_muestra(1001, 0, 1)
+    np.testing.assert_array_equal(np.concatenate(partes), completa)
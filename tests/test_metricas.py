@@ -0,0 +1,52 @@
+import pytest
+
+from metricas import RegistroMetricas
+
+RECURSOS = {"cpu_usuario": 0.5, "cpu_sistema": 0.25, "rss_max_bytes": 1000}
+
+
+@pytest.fixture
+def registro():
+    registro = RegistroMetricas()
+    registro.registrar("lento.py", 2.0, 0, 100, espera=0.5, recursos=RECURSOS)
+    registro.registrar("lento.py", 4.0, 1, 50, recursos={**RECURSOS, "rss_max_bytes": 3000})
+    registro.registrar('raro "x".py', 0.02, 0, 10)
+    registro.registrar_acierto_cache("lento.py")
+    return registro
+
+
+def test_prometheus(registro):
+    texto = registro.prometheus()
+    assert "# TYPE dashboard_duracion_segundos histogram" in texto
+    assert 'dashboard_ejecuciones_total{script="lento.py",codigo="0"} 1' in texto
+    assert 'dashboard_ejecuciones_total{script="lento.py",codigo="1"} 1' in texto
+    assert 'dashboard_cache_aciertos_total{script="lento.py"} 1' in texto
+    assert 'dashboard_duracion_segundos_bucket{script="lento.py",le="2.5"} 1' in texto
+    assert 'dashboard_duracion_segundos_bucket{script="lento.py",le="5"} 2' in texto
+    assert 'dashboard_duracion_segundos_bucket{script="lento.py",le="+Inf"} 2' in texto
+    assert 'dashboard_duracion_segundos_sum{script="lento.py"} 6.000000' in texto
+    assert 'dashboard_rss_maximo_bytes{script="lento.py"} 3000' in texto
+    assert 'dashboard_cpu_usuario_segundos_total{script="lento.py"} 1.000000' in texto
+    assert 'script="raro \\"x\\".py"' in texto
+
+
+def test_resumen(registro):
+    lento, rapido = registro.resumen()["mas_lentos"]
+    assert lento["script"] == "lento.py" and rapido["script"] == 'raro "x".py'
+    assert (lento["ejecuciones"], lento["errores"], lento["aciertos_cache"]) == (2, 1, 1)
+    assert lento["duracion_media"] == pytest.approx(3.0)
+    assert lento["cpu_media"] == pytest.approx(0.75)
+    assert lento["espera_media"] == pytest.approx(0.25)
+    assert registro.resumen(limite=1)["mas_lentos"] == [lento]
+
+
+def test_endpoints_registran_las_ejecuciones(cliente, scripts):
+    nombre = scripts("medido.py", "print('x' * 10)\n")
+    cliente.post(f"/run/{nombre}")
+    cliente.post(f"/run/{nombre}")
+    texto = cliente.get("/metrics").get_data(as_text=True)
+    assert f'dashboard_ejecuciones_total{{script="{nombre}",codigo="0"}} 1' in texto
+    assert f'dashboard_cache_aciertos_total{{script="{nombre}"}} 1' in texto
+    assert f'dashboard_salida_bytes_total{{script="{nombre}"}} 11' in texto
+    fila = cliente.get("/api/metricas").get_json()["mas_lentos"][0]
+    assert fila["script"] == nombre and fila["rss_max_bytes"] > 0
@@ -0,0 +1,67 @@
+import math
+
+import numpy as np
+import pytest
+from scipy.stats import kurtosis, skew
+
+from momentos import MomentosEnLinea
+
+
+@pytest.fixture
+def datos():
+    return np.random.default_rng(5).exponential(2.0, 50_000)
+
+
+def test_igual_a_numpy_y_scipy(datos):
+    momentos = MomentosEnLinea.de(iter(np.array_split(datos, 9)), orden=4)
+    assert momentos.n == len(datos)
+    assert momentos.media == pytest.approx(datos.mean())
+    assert momentos.varianza() == pytest.approx(datos.var())
+    assert momentos.varianza(1) == pytest.approx(datos.var(ddof=1))
+    assert momentos.asimetria == pytest.approx(skew(datos))
+    assert momentos.curtosis == pytest.approx(kurtosis(datos))
+    assert (momentos.minimo, momentos.maximo) == (datos.min(), datos.max())
+
+
+def test_combinar_no_depende_del_orden(datos):
+    partes = [MomentosEnLinea.de(p, orden=4) for p in np.array_split(datos, 5)]
+    ida, vuelta = MomentosEnLinea(orden=4), MomentosEnLinea(orden=4)
+    for parte in partes:
+        ida.combinar(parte)
+    for parte in reversed(partes):
+        vuelta.combinar(parte)
+    completo = MomentosEnLinea.de(datos, orden=4)
+    for m in (ida, vuelta):
+        assert m.media == pytest.approx(completo.media)
+        assert m.m2 == pytest.approx(completo.m2)
+        assert m.m3 == pytest.approx(completo.m3)
+        assert m.m4 == pytest.approx(completo.m4)
+
+
+def test_valor_a_valor_igual_a_bloque(datos):
+    por_valor = MomentosEnLinea(orden=4)
+    for x in datos[:2000]:
+        por_valor.agregar_valor(x)
+    por_bloque = MomentosEnLinea.de(datos[:2000], orden=4)
+    assert por_valor.media == pytest.approx(por_bloque.media)
+    assert por_valor.varianza() == pytest.approx(por_bloque.varianza())
+    assert por_valor.curtosis == pytest.approx(por_bloque.curtosis)
+
+
+def test_estable_con_media_grande():
+    datos = 1e9 + np.random.default_rng(2).standard_normal(100_000)
+    momentos = MomentosEnLinea.de(iter(np.array_split(datos, 10)))
+    assert momentos.varianza() == pytest.approx(datos.var(), rel=1e-6)
+
+
+def test_combinar_con_menor_orden():
+    with pytest.raises(ValueError):
+        MomentosEnLinea(orden=4).combinar(MomentosEnLinea.de([1.0, 2.0]))
+
+
+def test_vacio_y_normalizar():
+    vacio = MomentosEnLinea()
+    assert math.isnan(vacio.varianza())
+    np.testing.assert_array_equal(vacio.normalizar([1.0, 2.0]), [1.0, 2.0])
+    z = MomentosEnLinea.de([1.0, 2.0, 3.0]).normalizar([1.0, 2.0, 3.0])
+    np.testing.assert_allclose(z, [-math.sqrt(1.5), 0.0, math.sqrt(1.5)])
@@ -0,0 +1,70 @@
+import math
+
+import numpy as np
+import pytest
+from scipy import stats
+
+import muestreo_normal as mn
+from DISTRIBUCION_NORMAL import GeneradorNormal
+
+
+def test_box_muller_igual_a_la_formula():
+    u = np.random.default_rng(2).random(1000)
+    u[0::2] = 1.0 - u[0::2]
+    esperado = []
+    for u1, u2 in zip(u[0::2], u[1::2]):
+        r = math.sqrt(-2 * math.log(u1))
+        esperado += [r * math.cos(2 * math.pi * u2), r * math.sin(2 * math.pi * u2)]
+    np.testing.assert_allclose(mn.box_muller(u), esperado, rtol=1e-12, atol=1e-12)
+    assert len(mn.box_muller(u[:7])) == 6
+
+
+@pytest.mark.parametrize("metodo", mn.METODOS)
+def test_distribucion_normal(metodo):
+    z = mn.normales(400_000, metodo=metodo, semilla=12345)
+    assert abs(z.mean()) < 0.01 and abs(z.std() - 1) < 0.01
+    assert abs(stats.skew(z)) < 0.02 and abs(stats.kurtosis(z)) < 0.05
+    assert stats.kstest(z, "norm").pvalue > 0.001
+    # Colas: P(|Z| > 3) = 0.0027 (el ziggurat pasa por la cola exacta desde r ≈ 3.65)
+    colas = int((np.abs(z) > 3).sum())
+    esperado = 400_000 * 2 * stats.norm.sf(3)
+    assert abs(colas - esperado) < 5 * math.sqrt(esperado)
+    assert (np.abs(z) > mn.R_ZIGGURAT).any()
+
+
+@pytest.mark.parametrize("metodo", mn.METODOS)
+def test_media_sigma_y_salida(metodo):
+    salida = np.empty(10_001)
+    z = mn.normales(10_001, mu=5.0, sigma=0.5, metodo=metodo, semilla=3, salida=salida)
+    assert z is salida
+    np.testing.assert_allclose(z, 5.0 + 0.5 * mn.normales(10_001, metodo=metodo, semilla=3))
+    with pytest.raises(ValueError):
+        mn.normales(10, metodo=metodo, salida=np.empty(9))
+
+
+@pytest.mark.parametrize("metodo", mn.METODOS)
+def test_bloques_igual_a_normales(metodo, monkeypatch):
+    monkeypatch.setattr(mn, "BLOQUE", 1000)
+    completa = mn.normales(4500, metodo=metodo, generador="lcg", semilla=8)
+    partes = list(mn.bloques_normales(4500, metodo=metodo, generador="lcg", semilla=8, tamano=1000))
+    assert [len(p) for p in partes] == [1000] * 4 + [500]
+    np.testing.assert_array_equal(np.concatenate(partes), completa)
+
+
+def test_metodo_desconocido():
+    with pytest.raises(ValueError, match="desconocido"):
+        mn.normales(10, metodo="inversa")
+
+
+def test_generador_normal_igual_al_lazo():
+    escalar = GeneradorNormal(123456789)
+    esperado = []
+    for _ in range(250):
+        u1, u2 = escalar._uniforme(), escalar._uniforme()
+        r = math.sqrt(-2 * math.log(u1))
+        esperado += [r * math.cos(2 * math.pi * u2), r * math.sin(2 * math.pi * u2)]
+    generador = GeneradorNormal(123456789)
+    np.testing.assert_allclose(generador.generar_muestra(501, 0, 1), esperado, rtol=1e-12, atol=1e-12)
+    assert generador.x == escalar.x
+    por_bloques = np.concatenate(list(GeneradorNormal(123456789).bloques_muestra(501, 0, 1, tamano=33)))
+    np.testing.assert_array_equal(por_bloques, GeneradorNormal(123456789).generar_muestra(501, 0, 1))
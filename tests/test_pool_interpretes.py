@@ -0,0 +1,72 @@
+import os
+import signal
+import threading
+import time
+
+import pytest
+
+from pool_interpretes import ControlEjecucion, PoolInterpretes, _ejecutar_subproceso
+
+
+@pytest.fixture(scope="module")
+def pool():
+    pool = PoolInterpretes(tamano=1, max_ejecuciones=3)
+    yield pool
+    pool.cerrar()
+
+
+@pytest.fixture
+def script(tmp_path):
+    def crear(codigo):
+        ruta = tmp_path / f"script_{len(list(tmp_path.iterdir()))}.py"
+        ruta.write_text(codigo, encoding="utf-8")
+        return str(ruta)
+    return crear
+
+
+def test_salida_y_codigo(pool, script, tmp_path):
+    control = ControlEjecucion()
+    codigo, salida = pool.ejecutar(script("import os\nprint('hola', os.getcwd())\n"), control, str(tmp_path))
+    assert codigo == 0
+    assert salida == f"hola {tmp_path}\n"
+    assert control.recursos["rss_max_bytes"] > 0
+
+
+@pytest.mark.parametrize("codigo_script, esperado", [
+    ("import sys\nsys.exit(3)\n", 3),
+    ("import sys\nsys.exit()\n", 0),
+    ("raise RuntimeError('falla')\n", 1),
+])
+def test_codigos_de_salida(pool, script, codigo_script, esperado):
+    assert pool.ejecutar(script(codigo_script))[0] == esperado
+
+
+def test_cada_script_parte_de_un_estado_limpio(pool, script):
+    pool.ejecutar(script("import json\njson.MARCA = 1\n"))
+    assert pool.ejecutar(script("import json\nprint(hasattr(json, 'MARCA'))\n"))[1] == "False\n"
+
+
+def test_trabajador_reciclado(pool, script):
+    padre = script("import os\nprint(os.getppid())\n")
+    pids = {pool.ejecutar(padre)[1] for _ in range(pool.max_ejecuciones + 1)}
+    assert len(pids) == 2
+
+
+def test_cancelar(pool, script):
+    control = ControlEjecucion()
+    threading.Timer(0.5, control.cancelar).start()
+    inicio = time.perf_counter()
+    codigo, salida = pool.ejecutar(script("import time\nprint('inicio', flush=True)\ntime.sleep(60)\n"), control)
+    assert codigo == -signal.SIGKILL
+    assert salida == "inicio\n"
+    assert time.perf_counter() - inicio < 30
+
+
+def test_subproceso_sin_fork(script):
+    eventos = list(_ejecutar_subproceso(script("print('a')\nprint('b')\n"), ControlEjecucion(), None))
+    assert eventos == [("salida", "a\n"), ("salida", "b\n"), ("fin", 0)]
+
+
+def test_parametros_invalidos():
+    with pytest.raises(ValueError):
+        PoolInterpretes(tamano=0)
@@ -0,0 +1,121 @@
+import itertools
+import math
+
+import numpy as np
+import pytest
+from scipy.stats import norm
+
+import prueba_corridas_aleat as pc
+from archivos_muestra import guardar_muestra
+
+
+def largos_lazo(x):
+    """Largos de las corridas arriba/abajo, comparando valor a valor."""
+    largos, signo = [], None
+    for a, b in zip(x, x[1:]):
+        aumenta = b > a
+        if aumenta == signo:
+            largos[-1] += 1
+        else:
+            largos.append(1)
+        signo = aumenta
+    return largos
+
+
+def test_compar_y_corridas_iguales_al_lazo():
+    x = np.random.default_rng(1).integers(0, 5, 300).tolist()     # con empates
+    S = pc.compar(x)
+    assert S == [1 if b > a else 0 for a, b in zip(x, x[1:])]
+    cambios = sum(1 for a, b in zip(S, S[1:]) if a != b)
+    assert len(pc.corridas(S)) == cambios
+    assert pc.prueba_corridas(x)["corridas"] == cambios + 1 == len(largos_lazo(x))
+
+
+@pytest.mark.parametrize("N", range(2, 8))
+def test_distribucion_exacta_por_enumeracion(N):
+    conteos = np.zeros(N + 1)
+    for permutacion in itertools.permutations(range(N)):
+        conteos[len(largos_lazo(permutacion))] += 1
+    np.testing.assert_allclose(pc.distribucion_corridas(N), conteos / math.factorial(N), atol=1e-15)
+
+
+def test_momentos_de_la_distribucion_exacta():
+    N = 60
+    p = pc.distribucion_corridas(N)
+    c = np.arange(N + 1)
+    assert p.sum() == pytest.approx(1.0)
+    assert (p * c).sum() == pytest.approx((2 * N - 1) / 3)
+    assert (p * c * c).sum() - (p * c).sum() ** 2 == pytest.approx((16 * N - 29) / 90)
+
+
+@pytest.mark.parametrize("N", [3, 5, 7])
+def test_largos_esperados_por_enumeracion(N):
+    max_largo = 4
+    total = np.zeros(max_largo)
+    for permutacion in itertools.permutations(range(N)):
+        for largo in largos_lazo(permutacion):
+            total[min(largo, max_largo) - 1] += 1
+    np.testing.assert_allclose(pc.largos_esperados(N, max_largo), total / math.factorial(N), atol=1e-12)
+
+
+@pytest.mark.parametrize("tamano", [1, 2, 7, 1000, 10**6])
+def test_bloques_igual_a_completo(tamano):
+    x = np.random.default_rng(5).random(5003)
+    por_bloques = pc.prueba_corridas(x, tamano=tamano)
+    completo = pc.prueba_corridas(x.tolist())
+    assert por_bloques == completo
+    largos = largos_lazo(x.tolist())
+    esperados = np.bincount(np.minimum(largos, pc.MAX_LARGO) - 1, minlength=pc.MAX_LARGO)
+    assert completo["largos"]["observados"] == esperados.tolist()
+
+
+def test_valor_p_exacto_y_normal():
+    x = np.random.default_rng(9).random(pc.EXACTO_MAX + 1)
+    pequeno = pc.prueba_corridas(x[:500])
+    p = pc.distribucion_corridas(500)
+    distancia = abs(np.arange(501) - pequeno["esperado"])
+    assert pequeno["metodo_p"] == "exacto"
+    assert pequeno["p_valor"] == pytest.approx(p[distancia >= abs(pequeno["corridas"] - pequeno["esperado"]) - 1e-9].sum())
+    # Cerca de la normal con corrección por continuidad
+    continuidad = (abs(pequeno["corridas"] - pequeno["esperado"]) - 0.5) / math.sqrt(pequeno["varianza"])
+    assert pequeno["p_valor"] == pytest.approx(2 * norm.sf(continuidad), abs=0.01)
+
+    grande = pc.prueba_corridas(x)
+    assert grande["metodo_p"] == "normal"
+    assert grande["Z"] == pytest.approx((grande["corridas"] - grande["esperado"]) / math.sqrt(grande["varianza"]))
+    assert grande["p_valor"] == pytest.approx(2 * norm.sf(abs(grande["Z"])))
+
+
+def test_secuencia_monotona_se_rechaza():
+    resultado = pc.prueba_corridas(np.arange(100.0))
+    assert resultado["corridas"] == 1 and resultado["p_valor"] < 1e-10
+    with pytest.raises(ValueError):
+        pc.prueba_corridas([0.5])
+
+
+def test_archivo_y_generador(tmp_path):
+    x = np.random.default_rng(11).random(20_000)
+    ruta = str(tmp_path / "datos.npy")
+    guardar_muestra(ruta, x)
+    assert pc.prueba_corridas(ruta, tamano=999) == pc.prueba_corridas(x)
+
+    from generadores import obtener_generador
+    resultado = pc.prueba_corridas_generador(20_000, "lcg", semilla=3)
+    esperado = pc.prueba_corridas(obtener_generador("lcg", 3).uniformes(20_000))
+    assert resultado["corridas"] == esperado["corridas"]
+    assert "lcg" in resultado["mensaje"]
+
+
+def test_valor_a_valor_igual_a_bloques():
+    x = np.random.default_rng(13).integers(0, 4, 3000).astype(float)    # con empates
+    por_bloques = pc.AcumuladorCorridas(max_largo=5)
+    por_bloques.agregar(x)
+    mezclado = pc.AcumuladorCorridas(max_largo=5)
+    for i, parte in enumerate(np.array_split(x, 30)):
+        if i % 2:
+            mezclado.agregar(parte)
+        else:
+            for v in parte:
+                mezclado.agregar_valor(v)
+        assert mezclado.total_corridas == len(largos_lazo(x[:mezclado.n].tolist()))
+    assert mezclado.resultado() == por_bloques.resultado()
@@ -0,0 +1,134 @@
+import types
+
+import pytest
+
+import simulaciones
+from simulaciones import SIMULACIONES, ErrorParametros, ejecutar_simulacion
+
+
+class CargadorFalso:
+    def __init__(self, **funciones):
+        self.modulo = types.SimpleNamespace(**funciones)
+
+    def obtener(self, nombre):
+        return self.modulo
+
+
+def test_nombres_sincronizados_con_codigos():
+    from bateria_pruebas import PRUEBAS
+    from generadores import GENERADORES
+    assert simulaciones._GENERADORES == tuple(GENERADORES)
+    assert simulaciones._PRUEBAS == PRUEBAS
+
+
+def test_valores_por_defecto():
+    parametros = SIMULACIONES["simulacion_colisiones"].validar({})
+    assert parametros == {"N": 10, "delta": 0.05, "M": 100000, "seed": None, "generador": None}
+
+
+@pytest.mark.parametrize("nombre, datos", [
+    ("simulacion_colisiones", {"N": "diez"}),
+    ("simulacion_colisiones", {"N": 1}),
+    ("simulacion_colisiones", {"delta": "nan"}),
+    ("simulacion_colisiones", {"M": 2.5}),
+    ("simulacion_colisiones", {"otro": 1}),
+    ("simulacion_colisiones", {"generador": "mersenne"}),
+    ("prueba_corridas", {"n": 10**8}),
+    ("bateria_pruebas", {"n": 10**8}),
+    ("bateria_pruebas", {"pruebas": "frecuencias,espectral"}),
+    ("bateria_pruebas", {"pruebas": " , "}),
+    ("calidad_semilla", {"semilla": 12345, "d": 4}),
+    ("simulacion_call_center", {"c_min": 10, "c_max": 5}),
+    ("prueba_series", {"n": 5, "k": 8}),
+    ("prueba_series", {"m": 100_000, "k": 8}),
+])
+def test_parametros_invalidos(nombre, datos):
+    with pytest.raises(ErrorParametros):
+        SIMULACIONES[nombre].validar(datos)
+
+
+def test_errores_de_la_simulacion_no_son_de_parametros(monkeypatch):
+    def falla(**parametros):
+        raise ValueError("error interno")
+    monkeypatch.setitem(SIMULACIONES, "falla", simulaciones.Simulacion("falso", "falla", {}))
+    with pytest.raises(ValueError) as error:
+        ejecutar_simulacion(CargadorFalso(falla=falla), "falla", {}, almacen=None)
+    assert not isinstance(error.value, ErrorParametros)
+
+
+def test_api_esquema(cliente):
+    esquema = cliente.get("/api/sim").get_json()
+    assert set(esquema) == set(SIMULACIONES)
+    assert esquema["bateria_pruebas"]["parametros"]["generador"]["opciones"] == list(simulaciones._GENERADORES)
+
+
+def test_api_ejecuta(cliente):
+    respuesta = cliente.get("/api/sim/calidad_semilla?semilla=5735&d=4")
+    assert respuesta.status_code == 200
+    assert isinstance(respuesta.get_json(), dict)
+
+
+def test_api_codigos_de_error(cliente, aplicacion, monkeypatch):
+    assert cliente.get("/api/sim/no_existe").status_code == 404
+    respuesta = cliente.post("/api/sim/bateria_pruebas", json={"n": 10**8})
+    assert respuesta.status_code == 400
+    assert "n" in respuesta.get_json()["error"]
+
+    def falla(**parametros):
+        raise ValueError("error interno")
+    monkeypatch.setitem(SIMULACIONES, "falla", simulaciones.Simulacion("falso", "falla", {}))
+    monkeypatch.setattr(aplicacion, "modulos", CargadorFalso(falla=falla))
+    assert cliente.get("/api/sim/falla").status_code == 500
+
+
+def test_cargador_usa_agg(tmp_path):
+    import matplotlib
+    (tmp_path / "modulo_prueba.py").write_text("import matplotlib\nBACKEND = matplotlib.get_backend()\n")
+    modulo = simulaciones.CargadorModulos(str(tmp_path)).obtener("modulo_prueba")
+    assert modulo.BACKEND.lower() == "agg"
+    assert matplotlib.get_backend().lower() == "agg"
+
+
+def test_api_graficos_concurrentes(aplicacion):
+    import threading
+
+    serie = "/api/sim/prueba_series?n=20000&generador=lcg&semilla=3"
+    rutas = [serie, "/api/sim/estimar_pi_montecarlo?n=20000"] * 4
+
+    def imagen(ruta):
+        cliente = aplicacion.app.test_client()
+        respuesta = cliente.get(ruta)
+        assert respuesta.status_code == 200, respuesta.get_json()
+        (artefacto,) = respuesta.get_json()["artefactos"]
+        return cliente.get(artefacto["url"]).data
+
+    esperada = imagen(serie)
+    inicio = threading.Barrier(len(rutas))
+    imagenes, errores = {}, []
+
+    def pedir(i, ruta):
+        inicio.wait()
+        try:
+            imagenes[i] = imagen(ruta)
+        except Exception as e:
+            errores.append(e)
+
+    hilos = [threading.Thread(target=pedir, args=(i, ruta)) for i, ruta in enumerate(rutas)]
+    for hilo in hilos:
+        hilo.start()
+    for hilo in hilos:
+        hilo.join()
+    assert errores == []
+    for i, ruta in enumerate(rutas):
+        assert imagenes[i].startswith(b"\x89PNG")
+        if ruta == serie:
+            assert imagenes[i] == esperada
+
+
+@pytest.mark.parametrize("nombre", ["prueba_series", "bateria_pruebas"])
+def test_api_no_imprime_en_el_servidor(cliente, capsys, nombre):
+    capsys.readouterr()
+    respuesta = cliente.get(f"/api/sim/{nombre}?n=5000&generador=lcg&semilla=1")
+    assert respuesta.status_code == 200
+    assert "mostrar" not in cliente.get("/api/sim").get_json()[nombre]["parametros"]
+    assert capsys.readouterr().out == ""
@@ -0,0 +1,113 @@
+import threading
+import time
+
+import pytest
+
+import trabajos
+from trabajos import PlanificadorTrabajos, Trabajo
+
+
+def esperar(trabajo, timeout=5):
+    limite = time.time() + timeout
+    while not trabajo.terminado and time.time() < limite:
+        trabajo.esperar_cambio(trabajo.longitud, timeout=0.1)
+    assert trabajo.terminado
+
+
+def ejecutor(nombre, control):
+    """Falso ejecutor: el nombre indica el comportamiento."""
+    if nombre == "error":
+        raise RuntimeError("explotó")
+    if nombre == "lento":
+        while not control.cancelado:
+            time.sleep(0.01)
+        yield "fin", -9
+        return
+    yield "salida", "hola\n"
+    yield "artefactos", [{"url": "/a.png"}]
+    yield "salida", "chao\n"
+    yield "fin", 0 if nombre == "ok" else 1
+
+
+@pytest.fixture
+def planificador():
+    return PlanificadorTrabajos(ejecutor, concurrencia=1, tiempo_limite=0.5, retencion=600)
+
+
+def test_texto_por_sufijos():
+    trabajo = Trabajo("x")
+    partes = ["abc", "", "de", "fghij", "k"]
+    for parte in partes:
+        trabajo._agregar_salida(parte)
+    completo = "".join(partes)
+    assert trabajo.longitud == len(completo)
+    for desde in range(-3, len(completo) + 2):
+        assert trabajo.texto(desde) == completo[desde:]
+
+
+@pytest.mark.parametrize("nombre, estado, codigo", [
+    ("ok", trabajos.COMPLETADO, 0),
+    ("falla", trabajos.FALLIDO, 1),
+    ("error", trabajos.FALLIDO, None),
+])
+def test_estados_finales(planificador, nombre, estado, codigo):
+    trabajo = planificador.enviar(nombre)
+    esperar(trabajo)
+    assert (trabajo.estado, trabajo.codigo) == (estado, codigo)
+    if nombre == "error":
+        assert "explotó" in trabajo.texto()
+    else:
+        assert trabajo.a_dict(desde=5) == {**trabajo.a_dict(), "salida": "chao\n"}
+        assert trabajo.artefactos == [{"url": "/a.png"}]
+
+
+def test_tiempo_agotado(planificador):
+    trabajo = planificador.enviar("lento")
+    esperar(trabajo)
+    assert trabajo.estado == trabajos.TIEMPO_AGOTADO
+
+
+def test_cancelar_en_cola_y_en_ejecucion(planificador):
+    corriendo = planificador.enviar("lento")
+    en_cola = planificador.enviar("ok")
+    while corriendo.estado == trabajos.EN_COLA:
+        time.sleep(0.01)
+    assert planificador.cancelar(en_cola.id)
+    assert en_cola.estado == trabajos.CANCELADO
+    assert planificador.cancelar(corriendo.id)
+    esperar(corriendo)
+    assert corriendo.estado == trabajos.CANCELADO
+    assert not planificador.cancelar(corriendo.id)
+    assert not planificador.cancelar("no-existe")
+
+
+def test_concurrencia_acotada():
+    activos, maximo, lock = [0], [0], threading.Lock()
+
+    def contar(nombre, control):
+        with lock:
+            activos[0] += 1
+            maximo[0] = max(maximo[0], activos[0])
+        time.sleep(0.05)
+        with lock:
+            activos[0] -= 1
+        yield "fin", 0
+
+    planificador = PlanificadorTrabajos(contar, concurrencia=2)
+    enviados = [planificador.enviar(str(i)) for i in range(6)]
+    for trabajo in enviados:
+        esperar(trabajo)
+    assert maximo[0] == 2
+
+
+def test_purga_los_terminados(planificador):
+    planificador.retencion = 0
+    viejo = planificador.enviar("ok")
+    esperar(viejo)
+    planificador.enviar("ok")
+    assert planificador.obtener(viejo.id) is None
+
+
+def test_parametros_invalidos():
+    with pytest.raises(ValueError):
+        PlanificadorTrabajos(ejecutor, concurrencia=0)
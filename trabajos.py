@@ -0,0 +1,221 @@
+"""
+=========================================
+Cola de trabajos asíncronos para /run
+-----------------------------------------
+Propósito:
+    Que una simulación larga no bloquee un worker de gunicorn: la petición
+    encola el trabajo, recibe un id de inmediato y consulta el estado después.
+
+Descripción:
+    - Un número fijo de hilos (`concurrencia`) consume la cola.
+    - Cada trabajo tiene un tiempo límite de reloj; al vencer se cancela.
+    - Un trabajo en cola o en ejecución puede cancelarse.
+    - Los trabajos terminados se olvidan pasados `retencion` segundos.
+=========================================
+"""
+
+import queue
+import threading
+from bisect import bisect_right
+import time
+import uuid
+
+from pool_interpretes import ControlEjecucion
+
+# Estados posibles de un trabajo
+EN_COLA = "en_cola"
+EJECUTANDO = "ejecutando"
+COMPLETADO = "completado"
+FALLIDO = "fallido"
+CANCELADO = "cancelado"
+TIEMPO_AGOTADO = "tiempo_agotado"
+
+ESTADOS_FINALES = {COMPLETADO, FALLIDO, CANCELADO, TIEMPO_AGOTADO}
+
+
+class Trabajo:
+    """Una ejecución encolada de un script de `codigos/`."""
+
+    def __init__(self, nombre):
+        self.id = uuid.uuid4().hex
+        self.nombre = nombre
+        self.estado = EN_COLA
+        self.codigo = None
+        self.salida = []
+        self.longitud = 0       # caracteres de salida acumulados
+        self._inicios = []      # carácter donde empieza cada parte de `salida`
+        self.artefactos = []
+        self.creado = time.time()
+        self.inicio = None
+        self.fin = None
+        self.control = ControlEjecucion()
+        self.cambio = threading.Condition()
+
+    @property
+    def terminado(self):
+        return self.estado in ESTADOS_FINALES
+
+    def texto(self, desde=0):
+        """
+        Salida acumulada a partir del carácter `desde`. Solo se unen las
+        partes nuevas, así que consultar la salida cada poco tiempo cuesta
+        lo que esta creció y no lo acumulado.
+        """
+        with self.cambio:
+            if desde < 0:
+                desde = max(self.longitud + desde, 0)
+            if desde >= self.longitud:
+                return ""
+            parte = bisect_right(self._inicios, desde) - 1
+            return "".join(self.salida[parte:])[desde - self._inicios[parte]:]
+
+    def _agregar_salida(self, texto):
+        with self.cambio:
+            self._inicios.append(self.longitud)
+            self.salida.append(texto)
+            self.longitud += len(texto)
+            self.cambio.notify_all()
+
+    def _cambiar_estado(self, estado, codigo=None):
+        with self.cambio:
+            self.estado = estado
+            if codigo is not None:
+                self.codigo = codigo
+            if estado == EJECUTANDO:
+                self.inicio = time.time()
+            elif estado in ESTADOS_FINALES:
+                self.fin = time.time()
+            self.cambio.notify_all()
+
+    def esperar_cambio(self, longitud_vista, timeout=15):
+        """
+        Bloquea hasta que haya salida más allá de `longitud_vista` caracteres
+        o el trabajo termine (o venza `timeout`).
+        """
+        with self.cambio:
+            self.cambio.wait_for(
+                lambda: self.terminado or self.longitud > longitud_vista,
+                timeout=timeout,
+            )
+
+    def a_dict(self, desde=0):
+        """Representación JSON del trabajo (salida desde el carácter `desde`)."""
+        ahora = time.time()
+        return {
+            "id": self.id,
+            "nombre": self.nombre,
+            "estado": self.estado,
+            "codigo": self.codigo,
+            "espera": round((self.inicio or ahora) - self.creado, 4),
+            "duracion": round((self.fin or ahora) - self.inicio, 4) if self.inicio else None,
+            "salida": self.texto(desde),
+            "artefactos": self.artefactos,
+        }
+
+
+class PlanificadorTrabajos:
+    """
+    Planificador con concurrencia acotada.
+
+    Parámetros:
+        ejecutor (callable): ejecutor(nombre, control) que genera
+            ("salida", texto) ..., opcionalmente ("artefactos", lista),
+            y ("fin", codigo).
+        concurrencia (int): trabajos ejecutándose a la vez.
+        tiempo_limite (float): segundos de reloj antes de cancelar un trabajo.
+        retencion (float): segundos que se conserva un trabajo terminado.
+    """
+
+    def __init__(self, ejecutor, concurrencia=2, tiempo_limite=120, retencion=600):
+        if concurrencia <= 0 or tiempo_limite <= 0:
+            raise ValueError("concurrencia y tiempo_limite deben ser positivos.")
+        self.ejecutor = ejecutor
+        self.concurrencia = concurrencia
+        self.tiempo_limite = tiempo_limite
+        self.retencion = retencion
+        self._cola = queue.Queue()
+        self._trabajos = {}
+        self._lock = threading.Lock()
+        self._hilos = []
+
+    def _iniciar(self):
+        with self._lock:
+            if self._hilos:
+                return
+            for i in range(self.concurrencia):
+                hilo = threading.Thread(target=self._consumir, name=f"trabajos-{i}", daemon=True)
+                hilo.start()
+                self._hilos.append(hilo)
+
+    def _purgar(self):
+        limite = time.time() - self.retencion
+        with self._lock:
+            viejos = [t.id for t in self._trabajos.values() if t.terminado and t.fin < limite]
+            for id_trabajo in viejos:
+                del self._trabajos[id_trabajo]
+
+    def enviar(self, nombre):
+        """Encola el script `nombre` y retorna su Trabajo."""
+        self._iniciar()
+        self._purgar()
+        trabajo = Trabajo(nombre)
+        with self._lock:
+            self._trabajos[trabajo.id] = trabajo
+        self._cola.put(trabajo)
+        return trabajo
+
+    def obtener(self, id_trabajo):
+        with self._lock:
+            return self._trabajos.get(id_trabajo)
+
+    def cancelar(self, id_trabajo):
+        """Cancela el trabajo. Retorna False si no existe o ya terminó."""
+        trabajo = self.obtener(id_trabajo)
+        if trabajo is None or trabajo.terminado:
+            return False
+        if trabajo.estado == EN_COLA:
+            trabajo._cambiar_estado(CANCELADO)
+        trabajo.control.cancelar()
+        return True
+
+    def _consumir(self):
+        while True:
+            trabajo = self._cola.get()
+            if trabajo.estado == EN_COLA:
+                self._ejecutar(trabajo)
+
+    def _ejecutar(self, trabajo):
+        trabajo._cambiar_estado(EJECUTANDO)
+        trabajo.control.espera += trabajo.inicio - trabajo.creado
+        vencido = threading.Event()
+
+        def vencer():
+            vencido.set()
+            trabajo.control.cancelar()
+
+        temporizador = threading.Timer(self.tiempo_limite, vencer)
+        temporizador.daemon = True
+        temporizador.start()
+        codigo = None
+        try:
+            for tipo, valor in self.ejecutor(trabajo.nombre, trabajo.control):
+                if tipo == "salida":
+                    trabajo._agregar_salida(valor)
+                elif tipo == "artefactos":
+                    trabajo.artefactos = valor
+                elif tipo == "fin":
+                    codigo = valor
+        except Exception as e:
+            trabajo._agregar_salida(f"Error al ejecutar el trabajo: {e}")
+        finally:
+            temporizador.cancel()
+
+        if vencido.is_set():
+            estado = TIEMPO_AGOTADO
+        elif trabajo.control.cancelado:
+            estado = CANCELADO
+        elif codigo == 0:
+            estado = COMPLETADO
+        else:
+            estado = FALLIDO
+        trabajo._cambiar_estado(estado, codigo)